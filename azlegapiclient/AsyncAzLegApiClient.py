@@ -0,0 +1,291 @@
+import asyncio
+from functools import partial
+from typing import AsyncIterator, Callable, Iterable
+
+import httpx
+from lxml import etree
+from zeep import AsyncClient
+from zeep.cache import SqliteCache
+from zeep.exceptions import TransportError
+from zeep.transports import AsyncTransport
+from zeep.wsse.username import UsernameToken
+
+from .AzLegApiClient import AzLegApiClient, BulkResult
+from .CircuitBreaker import CircuitOpenError
+from .Instrumentation import timed_async
+from .PooledTransport import is_retryable
+from .ResponseCache import ResponseCache
+from .SessionSnapshot import SNAPSHOT_CALLS, SessionSnapshot, field
+
+# Same method surface as AzLegApiClient, but every method returns a coroutine.
+#
+#   async with AsyncAzLegApiClient(username, password, max_concurrency=50) as api:
+#       bills = (await api.bills_by_session_id(121))["bills"]
+#       infos = await asyncio.gather(
+#           *[api.bill_info(121, bill["bill_number"]) for bill in bills]
+#       )
+
+
+class AsyncAzLegApiClient(AzLegApiClient):
+    def __init__(
+        self,
+        username,
+        password,
+        max_concurrency: int = 20,
+        keep_alive: bool = True,
+        connect_timeout: float = 10,
+        read_timeout: float = 60,
+        cache_path: str = None,
+        cache_ttl: int = 86400,
+        **kwargs
+    ):
+        self.schema_cache = SqliteCache(path=cache_path, timeout=cache_ttl)
+        self.max_concurrency = max_concurrency
+        self.keep_alive = keep_alive
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        super().__init__(username, password, **kwargs)
+
+    def _create_transport(self):
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency if self.keep_alive else 0,
+        )
+
+        return AsyncTransport(
+            client=httpx.AsyncClient(limits=limits, timeout=self.timeout),
+            wsdl_client=httpx.Client(timeout=self.timeout),
+            cache=self.schema_cache,
+        )
+
+    def _create_client(self, username, password):
+        return AsyncClient(
+            self.wsdl,
+            wsse=UsernameToken(username=username, password=password),
+            transport=self.transport,
+        )
+
+    async def _request(self, operation: str, args: tuple, parser: Callable = None):
+
+        if self.planner is not None:
+            parser = partial(self.planner.parse, operation, parser)
+
+        if self.instrumentation is not None:
+            with self.instrumentation.measure(operation) as call:
+                response = await self._fetch(operation, args)
+
+                return self.instrumentation.map(call, response, parser)
+
+        response = await self._fetch(operation, args)
+
+        return parser(response) if parser is not None else response
+
+    async def _fetch(self, operation: str, args: tuple):
+
+        if self.planner is not None:
+            subset = self.planner.derive(operation, args)
+
+            if subset is not None:
+                return subset
+
+        if self.single_flight is None:
+            return await self._lookup(operation, args)
+
+        return await self.single_flight.do_async(
+            ResponseCache.key(operation, args),
+            partial(self._lookup, operation, args),
+            operation,
+        )
+
+    async def _lookup(self, operation: str, args: tuple):
+
+        if self.cache is not None:
+            response = self.cache.get(operation, args)
+
+            if response is not None:
+                return response
+
+        if self.circuit_breaker is None:
+            response = await self._call_service(operation, args)
+        else:
+            try:
+                response = await self.circuit_breaker.call_async(
+                    operation, self._call_service, operation, args
+                )
+            except CircuitOpenError as error:
+                return self._stale(operation, args, error)
+
+        if self.cache is not None:
+            self.cache.set(operation, args, response)
+
+        if self.planner is not None:
+            self.planner.observe(operation, args, response)
+
+        return response
+
+    async def _call_service(self, operation: str, args: tuple):
+
+        if self.fast:
+            return await self._retry(
+                operation, self.fast_path.call_async, (operation, args)
+            )
+
+        return await self._retry(
+            operation, getattr(self.client.service, operation), args
+        )
+
+    async def _retry(
+        self, operation: str, function: Callable, args: tuple, hedge: bool = True
+    ):
+
+        for delay in self.retry_policies.get(operation, self.retry_policy).delays():
+            try:
+                async with self.semaphore:
+                    if hedge and self.hedger is not None:
+                        return await self.hedger.call_async(
+                            operation, self._attempt, operation, function, args
+                        )
+
+                    return await self._attempt(operation, function, args)
+            except Exception as error:
+                if delay is None or not is_retryable(error):
+                    raise
+
+            await asyncio.sleep(delay)
+
+    async def _attempt(self, operation: str, function: Callable, args: tuple):
+
+        if self.instrumentation is not None:
+            function = partial(timed_async, function)
+
+        if self.throttle is None:
+            return await function(*args)
+
+        return await self.throttle.call_async(operation, function, *args)
+
+    # Streaming. As in AzLegApiClient, but the response body is read from
+    # httpx and fed to an lxml pull parser as it arrives, so the iter_* methods
+    # return async generators here:
+    #
+    #   async for document in api.iter_documents_by_session_id(121):
+    #       ...
+
+    async def _post_raw(self, operation: str, args: tuple):
+
+        service = self.client.service
+        envelope, headers = service._binding._create(
+            operation, args, {}, client=self.client
+        )
+        client = self.transport.client
+        request = client.build_request(
+            "POST",
+            service._binding_options["address"],
+            content=etree.tostring(envelope, encoding="utf-8", xml_declaration=True),
+            headers=headers,
+        )
+        response = await client.send(request, stream=True)
+
+        if response.status_code != 200:
+            content = await response.aread()
+            await response.aclose()
+            raise TransportError(
+                "Server returned HTTP status %d" % response.status_code,
+                status_code=response.status_code,
+                content=content,
+            )
+
+        return response
+
+    async def _iter_records(self, operation: str, args: tuple, mapper: Callable):
+
+        post = partial(
+            self._retry, operation, self._post_raw, (operation, args), hedge=False
+        )
+
+        if self.instrumentation is not None:
+            async for record in self.instrumentation.stream_async(
+                operation, post, self._iter_stream, mapper
+            ):
+                yield record
+            return
+
+        response = await post()
+
+        try:
+            async for record in self._iter_stream(response, mapper):
+                yield record
+        finally:
+            await response.aclose()
+
+    async def _iter_stream(self, response, mapper: Callable):
+
+        parser = etree.XMLPullParser(events=("start", "end"))
+        depth = 0
+
+        async for chunk in response.aiter_bytes():
+            parser.feed(chunk)
+
+            for event, element in parser.read_events():
+
+                if event == "start":
+                    depth += 1
+                    continue
+
+                if depth == self.RECORD_DEPTH:
+                    yield mapper(element)
+                    self._release(element)
+
+                depth -= 1
+
+        parser.close()
+
+    # The *_many methods return async generators here. Concurrency is bounded by
+    # the client's semaphore (and throttle, if any), so max_workers is ignored.
+
+    async def _many(
+        self, method: Callable, session_id: int, keys: Iterable, max_workers=None
+    ) -> AsyncIterator[BulkResult]:
+        async def fetch(key):
+            try:
+                return BulkResult(key, await method(session_id, key), None)
+            except Exception as error:
+                return BulkResult(key, None, error)
+
+        for result in asyncio.as_completed([fetch(key) for key in keys]):
+            yield await result
+
+    # As AzLegApiClient.snapshot_session, with the calls gathered on the loop.
+
+    async def snapshot_session(
+        self, session_id: int, legislature_id: int = None
+    ) -> SessionSnapshot:
+
+        session = asyncio.ensure_future(self.session_by_id(session_id))
+
+        async def committees():
+
+            if legislature_id is None:
+                return await self.committees_by_leg(field(await session, "legislature"))
+
+            return await self.committees_by_leg(legislature_id)
+
+        results = await asyncio.gather(
+            *[getattr(self, name)(session_id) for name in SNAPSHOT_CALLS],
+            committees(),
+            session,
+        )
+
+        return SessionSnapshot(
+            session_id,
+            results[-1],
+            dict(zip(SNAPSHOT_CALLS + ("committees_by_leg",), results)),
+        )
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
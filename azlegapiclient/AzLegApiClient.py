@@ -1,1206 +1,1049 @@
 from zeep import CachingClient
 from zeep.wsse.username import UsernameToken
 from lxml import objectify, etree
-from typing import List, Dict
+from typing import Callable, Iterable, Iterator, List, Dict, NamedTuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from enum import Enum
-import isodate
+import os
+import threading
+import time
+
+from platformdirs import user_cache_dir
+from zeep.exceptions import TransportError
+
+from .CircuitBreaker import BreakerPolicy, CircuitBreaker, CircuitOpenError
+from .Extractors import (
+    EXTRACTORS,
+    LAZY_EXTRACTORS,
+    TYPED_EXTRACTORS,
+    extract_committee,
+)
+from .FastPath import FastPath
+from .Hedger import HedgePolicy, Hedger
+from .Instrumentation import Instrumentation, instrument, timed
+from .PooledTransport import PooledTransport, RetryPolicy, is_retryable
+from .QueryPlanner import QueryPlanner
+from .ResponseCache import ResponseCache
+from .SessionSnapshot import SNAPSHOT_CALLS, SessionSnapshot, field
+from .SingleFlight import SingleFlight
+from .Throttle import Throttle
+from .Timestamps import parse_timestamp
 
 WSDL = "https://www.azleg.gov/xml/legservice.asmx?WSDL"
+VENDORED_WSDL = os.path.join(user_cache_dir("azlegapiclient"), "legservice.wsdl")
 DEBUG = 1
 
 
-class AzLegApiClient:
-    def __init__(self, username, password):
-        self.client = CachingClient(
-            WSDL, wsse=UsernameToken(username=username, password=password)
-        )
+# The client loads the vendored copy of the WSDL when one has been saved with
+# vendor_wsdl(), so startup needs no network round trip. It is kept in the
+# user cache directory rather than the installed package, which may be
+# read-only.
 
-    # def pretty_print_xml(self, node):
-    #     print(etree.tostring(node, pretty_print=True))
 
-    def iso_date(self, key: str, obj: object):
-        return isodate.parse_datetime(obj[key]) if key in obj else None
-
-    def ars(self):
-        ars = self.client.service.ARS()
-        for ars_document in ars:
-            print(ars_document.attrib)
-
-    # TODO Check what S Committee Type actually means
-
-    CommitteeType = Enum("CommitteeType", [("Sitting", "S"), ("Financial", "F")])
+def default_wsdl() -> str:
+    return VENDORED_WSDL if os.path.exists(VENDORED_WSDL) else WSDL
 
-    # Date
-
-    def agendas_by_committee_id(self, session_id, committee_id, start_date=None):
-
-        if start_date is not None:
-            self.client.service.AgendaByCommitteeIDFromDate(
-                session_id, committee_id, start_date
-            )
-        else:
-            self.client.service.AgendaByCommitteeID(session_id, committee_id)
-
-    def agenda_by_id(self, agenda_id):
-        pass
-
-    # Date
 
-    def agendas_by_session_id(self, session_id, start_date=None):
+def vendor_wsdl(path: str = VENDORED_WSDL, url: str = WSDL, transport=None) -> str:
 
-        if start_date is not None:
-            self.client.service.AgendaBySessionID(session_id)
-        else:
-            self.client.service.AgendaBySessionIDFromDate(session_id, start_date)
+    transport = transport if transport is not None else PooledTransport()
+    content = transport.load(url)
 
-    # BillInfo
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
 
-    def bill_info(self, session_id: int, bill_num: str) -> Dict:
+    with open(path + ".tmp", "wb") as f:
+        f.write(content)
 
-        response = self.client.service.BillInfo(session_id, bill_num)
-
-        current = response.find("BILL")
-        sponsors = current.find("SPONSORS")
-        docs = current.find("DOCS")
-        meta = current.attrib
-
-        bill = {
-            "session_id": meta["Session_ID"],
-            "bill_number": meta["Bill_Number"],
-            "short_title": current.findtext("Short_Title"),
-            "introduced_date": current.findtext("Introduced_Date"),
-            "house_1st_read": current.findtext("House_1st_Read"),
-            "house_official": current.findtext("House_Official"),
-            "house_2nd_read": current.findtext("House_2nd_Read"),
-            "house_consent_calendar_object": current.findtext(
-                "House_Consent_Calendar_Object"
-            ),
-            "senate_official": current.findtext("Senate_Official"),
-            "senate_consent_calendar_object": current.findtext(
-                "Senate_Consent_Calendar_Object"
-            ),
-            "postingsheet": current.findtext("PostingSheet"),
-            "last_updated": current.findtext("Last_Updated"),
-            "sponsors": [],
-            "docs": [],
-        }
+    os.replace(path + ".tmp", path)
 
-        for sponsor in sponsors:
+    return path
 
-            current = sponsor.attrib
 
-            obj = {
-                "display_order": current["Display_Order"],
-                "type": current["Type"],
-                "member_id": current["Member_ID"],
-                "member_name": current["Member_Name"],
-            }
+class BulkResult(NamedTuple):
+    key: str
+    result: object
+    error: Exception
 
-            bill["sponsors"].append(obj)
 
-        for doc in docs:
+class AzLegApiClient:
 
-            current = doc.attrib
+    # transport defaults to a PooledTransport; pass one to tune pool size,
+    # keep-alive, timeouts and the schema cache. retry_policies maps SOAP
+    # operation names (e.g. "FloorVotesBySessionID") to a RetryPolicy
+    # overriding retry_policy. wsdl is a URL or a local path and defaults to
+    # the vendored copy when present. cache is an optional ResponseCache
+    # consulted before every service call. fast=True sends precompiled
+    # envelopes and parses responses with lxml directly (see FastPath).
+    # typed=True returns documents, floor transactions and votes, calendars
+    # and members as the compact NamedTuples in Records instead of dicts.
+    # lazy=True returns LazyRecord mappings that decode fields on first
+    # access; iter_* methods always build records eagerly. coalesce=True
+    # shares one service call between identical calls made concurrently
+    # (see SingleFlight); self.single_flight.stats() counts them. throttle is
+    # an optional Throttle that every attempt of every service call passes
+    # through: a token bucket rate limit plus an adaptive concurrency limit.
+    # hedge_policy sends a duplicate of a call that is slower than usual and
+    # takes the first answer (see Hedger); breaker_policy fails calls fast, or
+    # answers them from stale cache entries, while an operation keeps failing
+    # (see CircuitBreaker). Like retry_policies, hedge_policies and
+    # breaker_policies override them per SOAP operation. instrumentation is an
+    # optional Instrumentation that records network, parse and mapping time,
+    # response bytes and record counts for every call. planner is an optional
+    # QueryPlanner that answers per-bill and per-committee floor vote and
+    # document calls from a recent session-wide response instead of the
+    # service, and marks each of those answers with its "source".
+    #
+    # The zeep client, and with it the WSDL load and parse, is only built on
+    # first use of self.client.
+
+    def __init__(
+        self,
+        username,
+        password,
+        transport=None,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        retry_policies: Dict[str, RetryPolicy] = None,
+        wsdl: str = None,
+        cache: ResponseCache = None,
+        fast: bool = False,
+        typed: bool = False,
+        lazy: bool = False,
+        coalesce: bool = False,
+        throttle: Throttle = None,
+        hedge_policy: HedgePolicy = None,
+        hedge_policies: Dict[str, HedgePolicy] = None,
+        breaker_policy: BreakerPolicy = None,
+        breaker_policies: Dict[str, BreakerPolicy] = None,
+        instrumentation: Instrumentation = None,
+        planner: QueryPlanner = None,
+    ):
+        if typed and lazy:
+            raise ValueError("typed and lazy records cannot be combined")
+
+        self.wsdl = wsdl if wsdl is not None else default_wsdl()
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce else None
+        self.throttle = throttle
+        self.hedger = (
+            Hedger(hedge_policy, hedge_policies)
+            if hedge_policy is not None or hedge_policies
+            else None
+        )
+        self.circuit_breaker = (
+            CircuitBreaker(breaker_policy, breaker_policies)
+            if breaker_policy is not None or breaker_policies
+            else None
+        )
+        self.fast = fast
+        self._fast_path = None
+        self.stream_extractors = TYPED_EXTRACTORS if typed else EXTRACTORS
+        self.extractors = LAZY_EXTRACTORS if lazy else self.stream_extractors
+        self.transport = (
+            transport if transport is not None else self._create_transport()
+        )
+        self.instrumentation = instrumentation
+        self.planner = planner
 
-            obj = {
-                "document_yype": current["Document_Type"],
-                "document_format": current["Document_Format"],
-                "description": current["Description"],
-                "last_updated": current["Last_Updated"],
-                "url": current["URL"],
-            }
+        if instrumentation is not None:
+            instrument(self.transport)
 
-            bill["docs"].append(obj)
+        if self.hedger is not None and isinstance(self.transport, PooledTransport):
+            self.hedger.reserve(self.transport.pool_maxsize)
 
-        return bill
+        self.retry_policy = retry_policy
+        self.retry_policies = retry_policies or {}
 
-    # BillsBySessionId
+        if isinstance(self.transport, PooledTransport) and self.retries_operations():
+            if self.transport.connect_retries is None:
+                self.transport.retry_connections(0)
+        self._credentials = (username, password)
+        self._client = None
+        self._client_lock = threading.Lock()
 
-    def bills_by_session_id(self, session_id: int) -> Dict:
+    @property
+    def client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client(*self._credentials)
 
-        response = self.client.service.BillsBySessionID(session_id)
-        meta = response.attrib
+        return self._client
 
-        bills = {"session_id": meta["SessionID"], "bills": []}
+    @property
+    def fast_path(self) -> FastPath:
+        if self._fast_path is None:
+            client = self.client
 
-        for bill in response:
+            with self._client_lock:
+                if self._fast_path is None:
+                    self._fast_path = FastPath(client, self.transport)
 
-            obj = {
-                "bill_number": bill.findtext("Bill_Number"),
-                "initial_title": bill.findtext("Initial_Title"),
-                "current_title": bill.findtext("Current_Title"),
-                "last_updated": isodate.parse_datetime(bill.findtext("Last_Updated")),
-            }
+        return self._fast_path
 
-            bills["bills"].append(obj)
+    def _create_transport(self):
+        return PooledTransport()
 
-        return bills
+    def _create_client(self, username, password):
+        return CachingClient(
+            self.wsdl,
+            wsse=UsernameToken(username=username, password=password),
+            transport=self.transport,
+        )
 
-    # BillsUpdated
+    # Every service call goes through _request so subclasses can change how
+    # the SOAP operation is executed (see AsyncAzLegApiClient) while reusing
+    # the response parsers below.
 
-    def updated_bills(self, session_id: int, start_date: str):
+    def _request(self, operation: str, args: tuple, parser: Callable = None):
 
-        response = self.client.service.BillsUpdated(session_id, start_date)
+        if self.planner is not None:
+            parser = partial(self.planner.parse, operation, parser)
 
-        meta = response.attrib
+        if self.instrumentation is not None:
+            with self.instrumentation.measure(operation) as call:
+                response = self._fetch(operation, args)
 
-        bills = {"session_id": meta["SessionID"], "bills": []}
+                return self.instrumentation.map(call, response, parser)
 
-        for bill in response:
+        response = self._fetch(operation, args)
 
-            obj = {
-                "bill_number": bill.findtext("Bill_Number"),
-                "initial_title": bill.findtext("Initial_Title"),
-                "current_title": bill.findtext("Current_Title"),
-                "last_updated": isodate.parse_datetime(bill.findtext("Last_Updated")),
-            }
+        return parser(response) if parser is not None else response
 
-            bills["bills"].append(obj)
+    def _fetch(self, operation: str, args: tuple):
 
-        return bills
+        if self.planner is not None:
+            subset = self.planner.derive(operation, args)
 
-    def calendars_by_body(self, session_id: int, body: str) -> Dict:
+            if subset is not None:
+                return subset
 
-        response = self.client.service.CalendarsByBody(session_id, body)
-
-        calendars = {"session_id": session_id, "body": body, "calendars": []}
-
-        for calendar in response:
-
-            current = calendar.attrib
-
-            calendar_obj = {
-                "calendar_id": current["Cal_ID"],
-                "body": current["Body"],
-                "type": current["Type"],
-                "calendar_date": current["Cal_Date"],
-                "number": current["Number"],
-                "committee_name": current["Committee_Name"],
-                "committee_id": current["Committee_ID"],
-                "calendar_name": current["Cal_Name"],
-                "calendar_Time": current["Cal_Time"],
-                "protest_date": current["Protest_Date"]
-                if "Protest_Date" in current
-                else None,
-                "url": current["URL"] if "URL" in current else None,
-                "bills": [],
-            }
+        if self.single_flight is None:
+            return self._lookup(operation, args)
 
-            for bill in calendar:
+        return self.single_flight.do(
+            ResponseCache.key(operation, args),
+            partial(self._lookup, operation, args),
+            operation,
+        )
 
-                bill_attrib = bill.attrib
+    def _lookup(self, operation: str, args: tuple):
 
-                bill_obj = {
-                    "bill_number": bill_attrib["Bill_Number"],
-                    "display_order": bill_attrib["Display_Order"],
-                    "reconsidered": bill_attrib["Reconsidered"],
-                }
+        if self.cache is not None:
+            response = self.cache.get(operation, args)
 
-                calendar_obj["bills"].append(bill_obj)
+            if response is not None:
+                return response
 
-            calendars["calendars"].append(calendar_obj)
+        if self.circuit_breaker is None:
+            response = self._call_service(operation, args)
+        else:
+            try:
+                response = self.circuit_breaker.call(
+                    operation, self._call_service, operation, args
+                )
+            except CircuitOpenError as error:
+                return self._stale(operation, args, error)
 
-        return calendars
+        if self.cache is not None:
+            self.cache.set(operation, args, response)
 
-    def calendars_by_id(self, calendar_id):
+        if self.planner is not None:
+            self.planner.observe(operation, args, response)
 
-        response = self.client.service.CalendarsByCalendarID(calendar_id)
-
-        current = response.find("CALENDAR")
-        current_attrib = current.attrib
-
-        calendar = {
-            "calendar_id": current_attrib["Cal_ID"],
-            "body": current_attrib["Body"],
-            "type": current_attrib["Type"],
-            "calendar_date": current_attrib["Cal_Date"],
-            "number": current_attrib["Number"],
-            "committee_name": current_attrib["Committee_Name"],
-            "committee_id": current_attrib["Committee_ID"],
-            "calendar_name": current_attrib["Cal_Name"],
-            "calendar_time": current_attrib["Cal_Time"],
-            "protest_date": current_attrib["Protest_Date"],
-            "url": current_attrib["URL"] if "URL" in current_attrib else None,
-            "bills": [],
-        }
+        return response
 
-        for bill in current:
+    # Answers a call rejected by the circuit breaker from an expired cache
+    # entry, if the operation's policy allows it and one exists.
 
-            bill_attrib = bill.attrib
+    def _stale(self, operation: str, args: tuple, error: CircuitOpenError):
 
-            bill_obj = {
-                "bill_number": bill_attrib["Bill_Number"],
-                "display_order": bill_attrib["Display_Order"],
-                "reconsidered": bill_attrib["Reconsidered"],
-            }
+        if (
+            self.cache is not None
+            and self.circuit_breaker.policy(operation).serve_stale
+        ):
+            response = self.cache.stale(operation, args)
 
-            calendar["bills"].append(bill_obj)
+            if response is not None:
+                self.circuit_breaker.served_stale(operation)
+                return response
 
-        return calendar
+        raise error
 
-    def calendars_by_committee_id(self, session_id, committee_id):
+    def _call_service(self, operation: str, args: tuple):
 
-        response = self.client.service.CalendarsByCommittee(session_id, committee_id)
+        if self.fast:
+            return self._retry(operation, self.fast_path.call, (operation, args))
 
-        calendars = {
-            "session_id": session_id,
-            "committee_id": committee_id,
-            "calendars": [],
-        }
+        return self._retry(operation, getattr(self.client.service, operation), args)
 
-        for calendar in response:
-
-            current = calendar.attrib
-
-            calendar_obj = {
-                "calendar_id": current["Cal_ID"],
-                "body": current["Body"],
-                "type": current["Type"],
-                "calendar_date": current["Cal_Date"],
-                "number": current["Number"],
-                "committee_name": current["Committee_Name"],
-                "committee_id": current["Committee_ID"],
-                "calendar_name": current["Cal_Name"],
-                "calendar_Time": current["Cal_Time"],
-                "protest_date": current["Protest_Date"],
-                "url": current["URL"] if "URL" in current else None,
-                "bills": [],
-            }
+    def retries_operations(self) -> bool:
+        return any(
+            policy.attempts > 1
+            for policy in (self.retry_policy, *self.retry_policies.values())
+        )
 
-            for bill in calendar:
+    # Streamed responses are never hedged: a losing duplicate would hold a
+    # connection open until its body was read.
 
-                bill_attrib = bill.attrib
+    def _retry(
+        self, operation: str, function: Callable, args: tuple, hedge: bool = True
+    ):
 
-                bill_obj = {
-                    "bill_number": bill_attrib["Bill_Number"],
-                    "display_order": bill_attrib["Display_Order"],
-                    "reconsidered": bill_attrib["Reconsidered"],
-                }
+        for delay in self.retry_policies.get(operation, self.retry_policy).delays():
+            try:
+                if hedge and self.hedger is not None:
+                    return self.hedger.call(
+                        operation, self._attempt, operation, function, args
+                    )
 
-                calendar_obj["bills"].append(bill_obj)
+                return self._attempt(operation, function, args)
+            except Exception as error:
+                if delay is None or not is_retryable(error):
+                    raise
 
-            calendars["calendars"].append(calendar_obj)
+            time.sleep(delay)
 
-        return calendars
+    def _attempt(self, operation: str, function: Callable, args: tuple):
 
-    def calendars_by_session_id(self, session_id, start_date=None):
+        if self.instrumentation is not None:
+            function = partial(timed, function)
 
-        if start_date is not None:
-            response = self.client.service.CalendarsFromDate(session_id, start_date)
-        else:
-            response = self.client.service.CalendarsBySessionID(session_id)
-
-        calendars = {"session_id": session_id, "calendars": []}
-
-        for calendar in response:
-
-            current = calendar.attrib
-
-            calendar_obj = {
-                "calendar_id": current["Cal_ID"],
-                "body": current["Body"],
-                "type": current["Type"],
-                "calendar_date": current["Cal_Date"],
-                "number": current["Number"],
-                "committee_name": current["Committee_Name"],
-                "committee_id": current["Committee_ID"],
-                "calendar_name": current["Cal_Name"],
-                "calendar_Time": current["Cal_Time"],
-                "protest_date": current["Protest_Date"]
-                if "Protest_Date" in current
-                else None,
-                "url": current["URL"] if "URL" in current else None,
-                "bills": [],
-            }
+        if self.throttle is None:
+            return function(*args)
 
-            for bill in calendar:
+        return self.throttle.call(operation, function, *args)
 
-                bill_attrib = bill.attrib
+    # Streaming. The SOAP envelope is built by zeep but the response body is
+    # read straight off the socket with iterparse. Records are the children of
+    # the document returned inside <OperationResult>, i.e. elements at
+    # Envelope/Body/OperationResponse/OperationResult/ROOT/RECORD. Each record
+    # is mapped and then cleared, so memory stays flat however large the
+    # session is.
 
-                bill_obj = {
-                    "bill_number": bill_attrib["Bill_Number"],
-                    "display_order": bill_attrib["Display_Order"],
-                    "reconsidered": bill_attrib["Reconsidered"],
-                }
+    RECORD_DEPTH = 6
 
-                calendar_obj["bills"].append(bill_obj)
+    def _post_raw(self, operation: str, args: tuple, stream: bool = False):
 
-            calendars["calendars"].append(calendar_obj)
+        service = self.client.service
+        envelope, headers = service._binding._create(
+            operation, args, {}, client=self.client
+        )
 
-        return calendars
+        response = self.transport.session.post(
+            service._binding_options["address"],
+            data=etree.tostring(envelope, encoding="utf-8", xml_declaration=True),
+            headers=headers,
+            timeout=self.transport.operation_timeout,
+            stream=stream,
+        )
 
-    def committee_actions(self, body=None, committee_type=None) -> List:
-        if body is not None and committee_type is not None:
-            response = self.client.service.CommitteeActionsQualified(
-                body, committee_type
+        if response.status_code != 200:
+            content = response.content
+            response.close()
+            raise TransportError(
+                "Server returned HTTP status %d" % response.status_code,
+                status_code=response.status_code,
+                content=content,
             )
-        else:
-            response = self.client.service.CommitteeActions()
 
-        actions = []
+        response.raw.decode_content = True
 
-        for action in response:
+        return response
 
-            current = action.attrib
+    def _iter_records(self, operation: str, args: tuple, mapper: Callable):
 
-            obj = {
-                "action_id": current["Action_ID"],
-                "action": current["Action"],
-                "action_description": current["Action_Description"],
-                "rfeir_action": current["RFEIR_Action"],
-                "body": current["Body"],
-                "committee_type": current["Committee_Type"],
-            }
-
-            actions.append(obj)
-
-        return actions
-
-    def committees_by_leg_body(self, legislature_id: int, body: str):
+        post = partial(
+            self._retry, operation, self._post_raw, (operation, args, True), hedge=False
+        )
 
-        response = self.client.service.CommitteeByLegBody(legislature_id, body)
+        if self.instrumentation is not None:
+            yield from self.instrumentation.stream(
+                operation, post, self._iter_stream, mapper
+            )
+            return
 
-        meta = response.attrib
+        response = post()
 
-        committees = {"legislature_id": meta["legislature"], "committees": []}
+        try:
+            yield from self._iter_stream(response.raw, mapper)
+        finally:
+            response.close()
 
-        for type in response:
+    def _iter_stream(self, stream, mapper: Callable):
 
-            committee_type = type.attrib["Committee_Type"]
+        depth = 0
 
-            for body in type:
+        for event, element in etree.iterparse(stream, events=("start", "end")):
 
-                committee_body = body.attrib["Body"]
+            if event == "start":
+                depth += 1
+                continue
 
-                for committee in body:
+            if depth == self.RECORD_DEPTH:
+                yield mapper(element)
+                self._release(element)
 
-                    committee_attrib = committee.attrib
+            depth -= 1
 
-                    current = {
-                        "type": committee_type,
-                        "body": committee_body,
-                        "committee_id": committee_attrib["Committee_ID"],
-                        "committee_name": committee_attrib["Committee_Name"],
-                        "committee_short_name": committee_attrib[
-                            "Committee_Short_Name"
-                        ],
-                        "sub_committee": committee_attrib["Sub_Committee"],
-                    }
+    # Frees a consumed record and the siblings parsed before it.
 
-                    committees["committees"].append(current)
+    @staticmethod
+    def _release(element):
 
-        return committees
+        element.clear()
+        parent = element.getparent()
 
-    # Returns two body tags
-    # Only get commitee data from body tags with children?
+        while element.getprevious() is not None:
+            del parent[0]
 
-    def committee_by_leg_id(self, legislature_id: int, committee_id: int):
-
-        response = self.client.service.CommitteeByLegID(legislature_id, committee_id)
+    def iter_documents_by_session_id(self, session_id: int):
+        return self._iter_records(
+            "DocumentsBySessionID", (session_id,), self.stream_extractors["document"]
+        )
 
-        meta = response.attrib
+    def iter_floor_votes_by_session_id(self, session_id: int):
+        return self._iter_records(
+            "FloorVotesBySessionID",
+            (session_id,),
+            self.stream_extractors["floor_transaction"],
+        )
 
-        committees = {"legislature_id": meta["legislature"]}
+    def iter_bill_positions_by_session(self, session_id: int):
+        return self._iter_records(
+            "ForAgainstNeutralBySessionID",
+            (session_id,),
+            self.stream_extractors["bill_position"],
+        )
 
-        for committee_type in response:
+    def iter_videos_by_session(self, session_id: int):
+        return self._iter_records(
+            "VideosBySession", (session_id,), self.stream_extractors["video"]
+        )
 
-            committee_type_str = committee_type.attrib["Committee_Type"]
+    # Bulk fetchers run one call per bill number on a bounded thread pool. All
+    # workers share self.client and therefore one HTTP session. Results are
+    # yielded as they complete; a failed bill yields a BulkResult with error
+    # set instead of aborting the batch.
 
-            for committee_body in committee_type:
+    def _many(
+        self, method: Callable, session_id: int, keys: Iterable, max_workers: int = 8
+    ) -> Iterator[BulkResult]:
 
-                committee_body_str = committee_body.attrib["Body"]
+        executor = ThreadPoolExecutor(max_workers=max_workers)
 
-                for committee in committee_body:
+        if self.hedger is not None:
+            self.hedger.reserve(max_workers)
 
-                    committee_attrib = committee.attrib
-
-                    obj = {
-                        "type": committee_type_str,
-                        "body": committee_body_str,
-                        "committee_id": committee_attrib["Committee_ID"],
-                        "committee_name": committee_attrib["Committee_Name"],
-                        "committee_short_name": committee_attrib[
-                            "Committee_Short_Name"
-                        ],
-                        "sub_committee": committee_attrib["Sub_Committee"],
-                    }
+        try:
+            futures = {executor.submit(method, session_id, key): key for key in keys}
 
-                    committees["committee"] = obj
+            for future in as_completed(futures):
+                key = futures[future]
+                error = future.exception()
 
-        return committees
+                if error is not None:
+                    yield BulkResult(key, None, error)
+                else:
+                    yield BulkResult(key, future.result(), None)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-    def committee_by_leg_type(self, legislature_id: int, committee_type: str) -> Dict:
+    def bill_info_many(self, session_id: int, bill_numbers: Iterable, max_workers=8):
+        return self._many(self.bill_info, session_id, bill_numbers, max_workers)
 
-        response = self.client.service.CommitteeByLegType(
-            legislature_id, committee_type
+    def documents_by_bill_num_many(
+        self, session_id: int, bill_numbers: Iterable, max_workers=8
+    ):
+        return self._many(
+            self.documents_by_bill_num, session_id, bill_numbers, max_workers
         )
 
-        meta = response.attrib
-
-        committees = {"legislature_id": meta["legislature"], "committees": []}
-
-        for type in response:
+    def floor_votes_by_bill_many(
+        self, session_id: int, bill_numbers: Iterable, max_workers=8
+    ):
+        return self._many(
+            self.floor_votes_by_bill, session_id, bill_numbers, max_workers
+        )
 
-            committee_type = type.attrib["Committee_Type"]
+    def standing_by_bill_num_many(
+        self, session_id: int, bill_numbers: Iterable, max_workers=8
+    ):
+        return self._many(
+            self.standing_by_bill_num, session_id, bill_numbers, max_workers
+        )
 
-            for body in type:
+    # Fetches the session-wide calls in SNAPSHOT_CALLS, session_by_id and
+    # committees_by_leg on a thread pool, one worker per call, and links the
+    # results into a SessionSnapshot. committees_by_leg waits for
+    # session_by_id to learn the legislature unless legislature_id is given,
+    # so the snapshot takes as long as the slowest single call, or
+    # session_by_id plus committees_by_leg if that is longer. Calls are
+    # checked as they complete, so the error raised is from the call that
+    # failed first, without waiting for slower calls to finish.
+
+    def snapshot_session(
+        self, session_id: int, legislature_id: int = None
+    ) -> SessionSnapshot:
+
+        executor = ThreadPoolExecutor(max_workers=len(SNAPSHOT_CALLS) + 2)
+
+        try:
+            futures = {
+                name: executor.submit(getattr(self, name), session_id)
+                for name in SNAPSHOT_CALLS
+            }
+            session = executor.submit(self.session_by_id, session_id)
 
-                committee_body = body.attrib["Body"]
+            if legislature_id is None:
+                futures["committees_by_leg"] = executor.submit(
+                    lambda: self.committees_by_leg(
+                        field(session.result(), "legislature")
+                    )
+                )
+            else:
+                futures["committees_by_leg"] = executor.submit(
+                    self.committees_by_leg, legislature_id
+                )
 
-                for committee in body:
+            for future in as_completed([session, *futures.values()]):
+                future.result()
 
-                    committee_attrib = committee.attrib
+            results = {name: future.result() for name, future in futures.items()}
 
-                    current = {
-                        "type": committee_type,
-                        "body": committee_body,
-                        "committee_id": committee_attrib["Committee_ID"],
-                        "committee_name": committee_attrib["Committee_Name"],
-                        "committee_short_name": committee_attrib[
-                            "Committee_Short_Name"
-                        ],
-                        "sub_committee": committee_attrib["Sub_Committee"],
-                    }
+            return SessionSnapshot(session_id, session.result(), results)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-                    committees["committees"].append(current)
+    # def pretty_print_xml(self, node):
+    #     print(etree.tostring(node, pretty_print=True))
 
-        return committees
+    def iso_date(self, key: str, obj: object):
+        return parse_timestamp(obj[key]) if key in obj else None
 
-    def committees_by_leg_type_body(self, legislature_id, body: str) -> Dict:
+    def ars(self):
+        return self._request("ARS", (), self._parse_ars)
 
-        response = self.client.service.CommitteeByLegBody(legislature_id, body)
+    def _parse_ars(self, ars):
+        for ars_document in ars:
+            print(ars_document.attrib)
 
-        meta = response.attrib
+    # TODO Check what S Committee Type actually means
 
-        committees = {"legislature_id": meta["legislature"], "committees": []}
+    CommitteeType = Enum("CommitteeType", [("Sitting", "S"), ("Financial", "F")])
 
-        for type in response:
+    # Date
 
-            committee_type = type.attrib["Committee_Type"]
+    # Agendas are not mapped to records yet; these return the <AGENDAS>
+    # response element as lxml parsed it.
 
-            for body in type:
+    def agendas_by_committee_id(self, session_id, committee_id, start_date=None):
 
-                committee_body = body.attrib["Body"]
+        if start_date is not None:
+            return self._request(
+                "AgendaByCommitteeIDFromDate", (session_id, committee_id, start_date)
+            )
+        else:
+            return self._request("AgendaByCommitteeID", (session_id, committee_id))
 
-                for committee in body:
+    def agenda_by_id(self, agenda_id):
+        pass
 
-                    committee_attrib = committee.attrib
+    # Date
 
-                    current = {
-                        "type": committee_type,
-                        "body": committee_body,
-                        "committee_id": committee_attrib["Committee_ID"],
-                        "committee_name": committee_attrib["Committee_Name"],
-                        "committee_short_name": committee_attrib[
-                            "Committee_Short_Name"
-                        ],
-                        "sub_committee": committee_attrib["Sub_Committee"],
-                    }
+    def agendas_by_session_id(self, session_id, start_date=None):
 
-                    committees["committees"].append(current)
+        if start_date is not None:
+            return self._request("AgendaBySessionIDFromDate", (session_id, start_date))
+        else:
+            return self._request("AgendaBySessionID", (session_id,))
 
-        return committees
+    # BillInfo
 
-    def committees_by_leg(self, legislature_id: int) -> Dict:
+    def bill_info(self, session_id: int, bill_num: str) -> Dict:
 
-        response = self.client.service.CommitteeByLegislature(legislature_id)
+        return self._request("BillInfo", (session_id, bill_num), self._parse_bill_info)
 
-        meta = response.attrib
+    def _parse_bill_info(self, response) -> Dict:
+        return self.extractors["bill"](response.find("BILL"))
 
-        committees = {"legislature_id": meta["legislature"], "committees": []}
+    # BillsBySessionId
 
-        for type in response:
+    def bills_by_session_id(self, session_id: int) -> Dict:
 
-            committee_type = type.attrib["Committee_Type"]
+        return self._request(
+            "BillsBySessionID", (session_id,), self._parse_bills_by_session_id
+        )
 
-            for body in type:
+    def _parse_bills_by_session_id(self, response) -> Dict:
 
-                committee_body = body.attrib["Body"]
+        return {"session_id": response.get("SessionID"), "bills": self._bills(response)}
 
-                for committee in body:
+    # BillsUpdated
 
-                    committee_attrib = committee.attrib
+    def updated_bills(self, session_id: int, start_date: str):
 
-                    current = {
-                        "type": committee_type,
-                        "body": committee_body,
-                        "committee_id": committee_attrib["Committee_ID"],
-                        "committee_name": committee_attrib["Committee_Name"],
-                        "committee_short_name": committee_attrib[
-                            "Committee_Short_Name"
-                        ],
-                        "sub_committee": committee_attrib["Sub_Committee"],
-                    }
+        return self._request(
+            "BillsUpdated", (session_id, start_date), self._parse_updated_bills
+        )
 
-                    committees["committees"].append(current)
+    def _parse_updated_bills(self, response) -> Dict:
 
-        return committees
+        return {"session_id": response.get("SessionID"), "bills": self._bills(response)}
 
-    def committee_members(self, session_id: int, committee_id: int) -> Dict:
+    def _bills(self, response) -> List:
+        return list(map(self.extractors["bill_summary"], response))
 
-        response = self.client.service.CommitteeMembers(session_id, committee_id)
+    def calendars_by_body(self, session_id: int, body: str) -> Dict:
 
-        current_body = response.find("BODY")
-        current_committee = current_body.find("COMMITTEE")
+        return self._request(
+            "CalendarsByBody",
+            (session_id, body),
+            partial(self._parse_calendars_by_body, session_id, body),
+        )
 
-        response_committee_id = current_committee.get("Committee_ID")
+    def _parse_calendars_by_body(self, session_id, body, response) -> Dict:
 
-        committee_members = {
-            "committee_id": response_committee_id,
-            "committee_type": current_committee.get("Committee_Type"),
-            "committee_name": current_committee.get("Committee_Name"),
-            "committee_members": [],
+        return {
+            "session_id": session_id,
+            "body": body,
+            "calendars": list(map(self.extractors["calendar"], response)),
         }
 
-        # Probably a better way of doing this
-
-        for body in response:
-            for committee in body:
-                for members in committee:
-                    for member in members:
-                        obj = {
-                            "member_order": member.get("Member_Order"),
-                            "member_id": member.get("Member_ID"),
-                            "member_name": member.get("Member_Name"),
-                            "member_position": member.get("Member_Position"),
-                        }
-
-                        committee_members["committee_members"].append(obj)
-
-        return committee_members
-
-    def documents_by_bill_num(self, session_id: int, bill_number: str):
-
-        response = self.client.service.DocumentsByBillNum(session_id, bill_number)
-
-        documents = {"bill_number": bill_number, "documents": []}
-
-        for document in response:
-            obj = {
-                "item": document.get("Item"),
-                "transaction_type": document.get("Transaction_Type"),
-                "bill_number": document.get("Bill_Number"),
-                "document_type": document.get("Document_Type"),
-                "document_format": document.get("Document_Format"),
-                "description": document.get("Description"),
-                "url": document.get("URL"),
-                "transaction_date": document.get("Transaction_Date"),
-            }
-
-            documents["documents"].append(obj)
-
-        return documents
-
-    def documents_by_bill_num_doc_type(
-        self, session_id: int, bill_number: str, doc_type: str
-    ):
+    def calendars_by_id(self, calendar_id):
 
-        response = self.client.service.DocumentsByBillNumDocType(
-            session_id, bill_number, doc_type
+        return self._request(
+            "CalendarsByCalendarID", (calendar_id,), self._parse_calendars_by_id
         )
 
-        documents = {"bill_number": bill_number, "documents": []}
-
-        for document in response:
-            obj = {
-                "item": document.get("Item"),
-                "transaction_type": document.get("Transaction_Type"),
-                "bill_number": document.get("Bill_Number"),
-                "document_type": document.get("Document_Type"),
-                "document_format": document.get("Document_Format"),
-                "description": document.get("Description"),
-                "url": document.get("URL"),
-                "transaction_date": document.get("Transaction_Date"),
-            }
-
-            documents["documents"].append(obj)
-
-        return documents
+    def _parse_calendars_by_id(self, response):
+        return self.extractors["calendar"](response.find("CALENDAR"))
 
-    def documents_by_doc_type(self, session_id: int, doc_type: str) -> Dict:
-
-        response = self.client.service.DocumentsByDocType(session_id, doc_type)
+    def calendars_by_committee_id(self, session_id, committee_id):
 
-        documents = {"session_id": session_id, "documents": []}
+        return self._request(
+            "CalendarsByCommittee",
+            (session_id, committee_id),
+            partial(self._parse_calendars_by_committee_id, session_id, committee_id),
+        )
 
-        for document in response:
-            obj = {
-                "item": document.get("Item"),
-                "transaction_type": document.get("Transaction_Type"),
-                "bill_number": document.get("Bill_Number"),
-                "document_type": document.get("Document_Type"),
-                "document_format": document.get("Document_Format"),
-                "description": document.get("Description"),
-                "url": document.get("URL"),
-                "transaction_date": document.get("Transaction_Date"),
-            }
+    def _parse_calendars_by_committee_id(self, session_id, committee_id, response):
 
-            documents["documents"].append(obj)
+        return {
+            "session_id": session_id,
+            "committee_id": committee_id,
+            "calendars": list(map(self.extractors["calendar"], response)),
+        }
 
-        return documents
+    def calendars_by_session_id(self, session_id, start_date=None):
 
-    def documents_by_session_id(self, session_id: int):
+        parser = partial(self._parse_calendars_by_session_id, session_id)
 
-        response = self.client.service.DocumentsBySessionID(session_id)
+        if start_date is not None:
+            return self._request("CalendarsFromDate", (session_id, start_date), parser)
+        else:
+            return self._request("CalendarsBySessionID", (session_id,), parser)
 
-        documents = {"session_id": session_id, "documents": []}
+    def _parse_calendars_by_session_id(self, session_id, response):
 
-        for document in response:
-            obj = {
-                "item": document.get("Item"),
-                "transaction_type": document.get("Transaction_Type"),
-                "bill_number": document.get("Bill_Number"),
-                "document_type": document.get("Document_Type"),
-                "document_format": document.get("Document_Format"),
-                "description": document.get("Description"),
-                "url": document.get("URL"),
-                "transaction_date": document.get("Transaction_Date"),
-            }
+        return {
+            "session_id": session_id,
+            "calendars": list(map(self.extractors["calendar"], response)),
+        }
 
-            documents["documents"].append(obj)
+    def committee_actions(self, body=None, committee_type=None) -> List:
+        if body is not None and committee_type is not None:
+            return self._request(
+                "CommitteeActionsQualified",
+                (body, committee_type),
+                self._parse_committee_actions,
+            )
+        else:
+            return self._request("CommitteeActions", (), self._parse_committee_actions)
 
-        return documents
+    def _parse_committee_actions(self, response) -> List:
+        return list(map(self.extractors["committee_action"], response))
 
-    def documents_from_date(self, session_id: int, start_date: str):
+    def committees_by_leg_body(self, legislature_id: int, body: str):
 
-        response = self.client.service.DocumentsByBillNumFromDate(
-            session_id, start_date
+        return self._request(
+            "CommitteeByLegBody",
+            (legislature_id, body),
+            self._parse_committees_by_leg_body,
         )
 
-        documents = {"session_id": session_id, "documents": []}
-
-        for document in response:
-            obj = {
-                "item": document.get("Item"),
-                "transaction_type": document.get("Transaction_Type"),
-                "ill_number": document.get("Bill_Number"),
-                "document_type": document.get("Document_Type"),
-                "document_format": document.get("Document_Format"),
-                "description": document.get("Description"),
-                "url": document.get("URL"),
-                "transaction_date": document.get("Transaction_Date"),
-            }
-
-            documents["documents"].append(obj)
+    def _parse_committees_by_leg_body(self, response) -> Dict:
 
-        return documents
+        return {
+            "legislature_id": response.get("legislature"),
+            "committees": list(self._committees(response)),
+        }
 
-    # TODO Borked
+    # Returns two body tags
+    # Only get commitee data from body tags with children?
 
-    def documents_from_date_to_date(
-        self, session_id: int, start_date: str, end_date: str
-    ):
+    def committee_by_leg_id(self, legislature_id: int, committee_id: int):
 
-        response = self.client.service.DocumentsFromDateToDate(
-            session_id, start_date, end_date
+        return self._request(
+            "CommitteeByLegID",
+            (legislature_id, committee_id),
+            self._parse_committee_by_leg_id,
         )
 
-        documents = {"session_id": session_id, "documents": []}
+    def _parse_committee_by_leg_id(self, response):
 
-        for document in response:
-            obj = {
-                "item": document.get("Item"),
-                "transaction_type": document.get("Transaction_Type"),
-                "bill_number": document.get("Bill_Number"),
-                "document_type": document.get("Document_Type"),
-                "document_format": document.get("Document_Format"),
-                "description": document.get("Description"),
-                "url": document.get("URL"),
-                "transaction_date": document.get("Transaction_Date"),
-            }
+        committees = {"legislature_id": response.get("legislature")}
 
-            documents["documents"].append(obj)
+        for committee in self._committees(response):
+            committees["committee"] = committee
 
-        return documents
+        return committees
 
-    def exe_nom_current_position_holder(
-        self, session_id: int, agency_id: int, position_id: int
-    ) -> Dict:
+    def committee_by_leg_type(self, legislature_id: int, committee_type: str) -> Dict:
 
-        response = self.client.service.ExeNomCurrentPositionHolder(
-            session_id, agency_id, position_id
+        return self._request(
+            "CommitteeByLegType",
+            (legislature_id, committee_type),
+            self._parse_committee_by_leg_type,
         )
 
-        nominee_position = response.find("NOMINEEPOS")
-
-        nominee = {
-            "agency_id": nominee_position.get("AgencyId"),
-            "position_id": nominee_position.get("PositionId"),
-            "nominee_id": nominee_position.get("NomineeId"),
-            "first_name": nominee_position.get("FirstName"),
-            "middle_initial": nominee_position.get("MiddleInitial"),
-            "last_name": nominee_position.get("LastName"),
-            "title": nominee_position.get("Title"),
-            "party": nominee_position.get("Party"),
-            "nominee_position_id": nominee_position.get("NomineePositionId"),
-            "received_date": nominee_position.get("ReceivedDate"),
-            "confirmed_date": nominee_position.get("ConfirmedDate"),
-            "governor": nominee_position.get("Governor"),
-            "position_comment": nominee_position.get("PositionComment"),
-            "replacing": nominee_position.get("Replacing"),
-            "appointment_date": nominee_position.get("AppointmentDate"),
-            "expiration_date": nominee_position.get("ExpirationDate"),
-            "caucus_date": nominee_position.get("CaucusDate"),
-            "gov_notified_date": nominee_position.get("GovNotifiedDate"),
-            "withdrawn_from_consideration": nominee_position.get(
-                "WithdrawnFromConsideration"
-            ),
-            "comments": nominee_position.get("Comments"),
-            "reappoint": nominee_position.get("Reappoint"),
-            "no_longer_serving": nominee_position.get("NoLongerServing"),
-            "wo_conf": nominee_position.get("WOConf"),
-            "wd_date": nominee_position.get("WDDate"),
-        }
-
-        return nominee
-
-    def exe_nom_by_id(self, nominee_id: int):
+    def _parse_committee_by_leg_type(self, response) -> Dict:
 
-        response = self.client.service.ExeNomNomineeById(nominee_id)
-
-        nominee = response.find("NOMINEE")
-        nominee_position = nominee.find("NOMPOSITION")
-
-        obj = {
-            "nominee_id": nominee.get("NomineeId"),
-            "first_name": nominee.get("FirstName"),
-            "middle_initial": nominee.get("MiddleInitial"),
-            "last_name": nominee.get("LastName"),
-            "title": nominee.get("Title"),
-            "party": nominee.get("Party"),
-            "address_line_1": nominee.get("AddressLine1"),
-            "address_line_2": nominee.get("AddressLine2"),
-            "address_line_3": nominee.get("AddressLine3"),
-            "nominee_dosition_Id": nominee_position.get("NomineePositionId"),
-            "received_date": nominee_position.get("ReceivedDate"),
-            "confirmed_date": nominee_position.get("ConfirmedDate"),
-            "governor": nominee_position.get("Governor"),
-            "position_comment": nominee_position.get("PositionComment"),
-            "replacing": nominee_position.get("Replacing"),
-            "appointment_date": nominee_position.get("AppointmentDate"),
-            "expiration_date": nominee_position.get("ExpirationDate"),
-            "referred_date": nominee_position.get("ReferredDate"),
-            "report_date": nominee_position.get("ReportDate"),
-            "caucus_date": nominee_position.get("CaucusDate"),
-            "committee_Short_Name": nominee_position.get("CommitteeShortName"),
-            "gov_notified_date": nominee_position.get("GovNotifiedDate"),
-            "withdrawn_from_consideration": nominee_position.get(
-                "WithdrawnFromConsideration"
-            ),
-            "comments": nominee_position.get("Comments"),
-            "reappoint": nominee_position.get("Reappoint"),
-            "caucus_vote": nominee_position.get("CaucusVote"),
-            "beginning_date": nominee_position.get("BeginningDate"),
-            "no_longer_serving": nominee_position.get("NoLongerServing"),
-            "wd_date": nominee_position.get("WDDate"),
+        return {
+            "legislature_id": response.get("legislature"),
+            "committees": list(self._committees(response)),
         }
 
-        return obj
-
-    def exec_nom_agencies_and_positions(self, include_disabled_agencies: int):
+    def committees_by_leg_type_body(self, legislature_id, body: str) -> Dict:
 
-        response = self.client.service.ExecNomAgenciesandPositions(
-            include_disabled_agencies
+        return self._request(
+            "CommitteeByLegBody",
+            (legislature_id, body),
+            self._parse_committees_by_leg_type_body,
         )
 
-        agencies = {"agencies": []}
-
-        for agency in response:
+    def _parse_committees_by_leg_type_body(self, response) -> Dict:
 
-            agency_obj = {
-                "agency_id": agency.get("AgencyID"),
-                "agency_name": agency.get("AgencyName"),
-                "proper_name": agency.get("ProperName"),
-                "origin": agency.get("Origin"),
-                "term_length": agency.get("TermLength"),
-                "description": agency.get("Description"),
-                "disabled": agency.get("Disabled"),
-                "positions": [],
-            }
+        return {
+            "legislature_id": response.get("legislature"),
+            "committees": list(self._committees(response)),
+        }
 
-            for position in agency:
-                position_obj = {
-                    "position_id": position.get("PositionId"),
-                    "name": position.get("Name"),
-                    "display_order": position.get("DisplayOrder"),
-                    "disabled": position.get("Disabled"),
-                }
+    def committees_by_leg(self, legislature_id: int) -> Dict:
 
-                agency_obj["positions"].append(position_obj)
+        return self._request(
+            "CommitteeByLegislature", (legislature_id,), self._parse_committees_by_leg
+        )
 
-            agencies["agencies"].append(agency_obj)
+    def _parse_committees_by_leg(self, response) -> Dict:
 
-        return agencies
+        return {
+            "legislature_id": response.get("legislature"),
+            "committees": list(self._committees(response)),
+        }
 
-    def floor_votes_by_bill(self, session_id: int, bill_number: str) -> Dict:
+    # Committee responses nest COMMITTEE elements under their type and body.
 
-        response = self.client.service.FloorVotesByBill(session_id, bill_number)
+    def _committees(self, response) -> Iterator[Dict]:
 
-        meta = response.attrib
+        for committee_type in response:
+            for committee_body in committee_type:
+                for committee in committee_body:
+                    yield {
+                        "type": committee_type.get("Committee_Type"),
+                        "body": committee_body.get("Body"),
+                        **extract_committee(committee),
+                    }
 
-        votes = {"session_id": meta["SessionID"], "tran": []}
+    def committee_members(self, session_id: int, committee_id: int) -> Dict:
 
-        for tran in response:
+        return self._request(
+            "CommitteeMembers",
+            (session_id, committee_id),
+            self._parse_committee_members,
+        )
 
-            tran_meta = tran.attrib
+    def _parse_committee_members(self, response) -> Dict:
 
-            tran_obj = {
-                "tran_id": tran_meta["ID"],
-                "type": tran_meta["Type"],
-                "bill": tran_meta["Bill"],
-                "cmte_id": tran_meta["CmteID"],
-                "cmte_name": tran_meta["CmteName"],
-                "cmte_short_name": tran_meta["CmteShortName"],
-                "referral": tran_meta["Referral"],
-                "cow_referral": tran_meta["COW_Referral"],
-                "action": tran_meta["Action"],
-                "action_id": tran_meta["Action_ID"],
-                "action_date": tran_meta["ActionDate"],
-                "comments": tran_meta["Comments"],
-                "votes": [],
-            }
+        current_committee = response.find("BODY").find("COMMITTEE")
 
-            for vote in tran:
-
-                current = vote.attrib
+        return {
+            "committee_id": current_committee.get("Committee_ID"),
+            "committee_type": current_committee.get("Committee_Type"),
+            "committee_name": current_committee.get("Committee_Name"),
+            "committee_members": [
+                self.extractors["committee_member"](member)
+                for body in response
+                for committee in body
+                for members in committee
+                for member in members
+            ],
+        }
 
-                vote_obj = {
-                    "member_id": current["MemID"],
-                    "member_name": current["MemName"],
-                    "display_order": current["DisplayOrder"],
-                    "vote": current["Vote"],
-                }
+    def documents_by_bill_num(self, session_id: int, bill_number: str):
 
-                tran_obj["votes"].append(vote_obj)
+        return self._request(
+            "DocumentsByBillNum",
+            (session_id, bill_number),
+            partial(self._parse_documents_by_bill_num, bill_number),
+        )
 
-            votes["tran"].append(tran_obj)
+    def _parse_documents_by_bill_num(self, bill_number, response):
 
-        return votes
+        return {
+            "bill_number": bill_number,
+            "documents": list(map(self.extractors["document"], response)),
+        }
 
-    def floor_votes_by_bill_from_date(
-        self, session_id: int, bill_number: str, start_date: str
+    def documents_by_bill_num_doc_type(
+        self, session_id: int, bill_number: str, doc_type: str
     ):
 
-        response = self.client.service.FloorVotesByBillFromDate(
-            session_id, bill_number, start_date
+        return self._request(
+            "DocumentsByBillNumDocType",
+            (session_id, bill_number, doc_type),
+            partial(self._parse_documents_by_bill_num_doc_type, bill_number),
         )
 
-        meta = response.attrib
+    def _parse_documents_by_bill_num_doc_type(self, bill_number, response):
 
-        votes = {"session_id": meta["SessionID"], "tran": []}
-
-        for tran in response:
-
-            tran_meta = tran.attrib
+        return {
+            "bill_number": bill_number,
+            "documents": list(map(self.extractors["document"], response)),
+        }
 
-            tran_obj = {
-                "tran_id": tran_meta["ID"],
-                "type": tran_meta["Type"],
-                "bill": tran_meta["Bill"],
-                "cmte_id": tran_meta["CmteID"],
-                "cmte_name": tran_meta["CmteName"],
-                "cmte_short_name": tran_meta["CmteShortName"],
-                "referral": tran_meta["Referral"],
-                "cow_referral": tran_meta["COW_Referral"],
-                "action": tran_meta["Action"],
-                "action_id": tran_meta["Action_ID"],
-                "action_date": tran_meta["ActionDate"],
-                "comments": tran_meta["Comments"],
-                "votes": [],
-            }
+    def documents_by_doc_type(self, session_id: int, doc_type: str) -> Dict:
 
-            for vote in tran:
+        return self._request(
+            "DocumentsByDocType",
+            (session_id, doc_type),
+            partial(self._parse_documents_by_doc_type, session_id),
+        )
 
-                current = vote.attrib
+    def _parse_documents_by_doc_type(self, session_id, response):
 
-                vote_obj = {
-                    "member_id": current["MemID"],
-                    "member_name": current["MemName"],
-                    "display_order": current["DisplayOrder"],
-                    "vote": current["Vote"],
-                }
+        return {
+            "session_id": session_id,
+            "documents": list(map(self.extractors["document"], response)),
+        }
 
-                tran_obj["votes"].append(vote_obj)
+    def documents_by_session_id(self, session_id: int):
 
-            votes["tran"].append(tran_obj)
+        return self._request(
+            "DocumentsBySessionID",
+            (session_id,),
+            partial(self._parse_documents_by_session_id, session_id),
+        )
 
-        return votes
+    def _parse_documents_by_session_id(self, session_id, response):
 
-    def floor_votes_by_committee_id(self, session_id: int, committee_id: int):
+        return {
+            "session_id": session_id,
+            "documents": list(map(self.extractors["document"], response)),
+        }
 
-        response = self.client.service.FloorVotesByCommID(session_id, committee_id)
+    def documents_from_date(self, session_id: int, start_date: str):
 
-        meta = response.attrib
+        return self._request(
+            "DocumentsByBillNumFromDate",
+            (session_id, start_date),
+            partial(self._parse_documents_from_date, session_id),
+        )
 
-        votes = {"session_id": meta["SessionID"], "tran": []}
+    def _parse_documents_from_date(self, session_id, response):
 
-        for tran in response:
+        return {
+            "session_id": session_id,
+            "documents": list(map(self.extractors["document"], response)),
+        }
 
-            tran_meta = tran.attrib
+    # TODO Borked
 
-            tran_obj = {
-                "tran_id": tran_meta["ID"],
-                "type": tran_meta["Type"],
-                "bill": tran_meta["Bill"],
-                "cmte_id": tran_meta["CmteID"],
-                "cmte_name": tran_meta["CmteName"],
-                "cmte_short_name": tran_meta["CmteShortName"],
-                "referral": tran_meta["Referral"],
-                "cow_referral": tran_meta["COW_Referral"],
-                "action": tran_meta["Action"],
-                "action_id": tran_meta["Action_ID"],
-                "action_date": tran_meta["ActionDate"],
-                "comments": tran_meta["Comments"],
-                "votes": [],
-            }
+    def documents_from_date_to_date(
+        self, session_id: int, start_date: str, end_date: str
+    ):
 
-            for vote in tran:
+        return self._request(
+            "DocumentsFromDateToDate",
+            (session_id, start_date, end_date),
+            partial(self._parse_documents_from_date_to_date, session_id),
+        )
 
-                current = vote.attrib
+    def _parse_documents_from_date_to_date(self, session_id, response):
 
-                vote_obj = {
-                    "member_id": current["MemID"],
-                    "member_name": current["MemName"],
-                    "display_order": current["DisplayOrder"],
-                    "vote": current["Vote"],
-                }
+        return {
+            "session_id": session_id,
+            "documents": list(map(self.extractors["document"], response)),
+        }
 
-                tran_obj["votes"].append(vote_obj)
+    def exe_nom_current_position_holder(
+        self, session_id: int, agency_id: int, position_id: int
+    ) -> Dict:
 
-            votes["tran"].append(tran_obj)
+        return self._request(
+            "ExeNomCurrentPositionHolder",
+            (session_id, agency_id, position_id),
+            self._parse_exe_nom_current_position_holder,
+        )
 
-        return votes
+    def _parse_exe_nom_current_position_holder(self, response) -> Dict:
+        return self.extractors["nominee_position_holder"](response.find("NOMINEEPOS"))
 
-    def floor_votes_by_session_id(self, session_id: int):
+    def exe_nom_by_id(self, nominee_id: int):
 
-        response = self.client.service.FloorVotesBySessionID(session_id)
+        return self._request(
+            "ExeNomNomineeById", (nominee_id,), self._parse_exe_nom_by_id
+        )
 
-        meta = response.attrib
+    def _parse_exe_nom_by_id(self, response):
+        return self.extractors["nominee_position"](response.find("NOMINEE"))
 
-        votes = {"session_id": meta["SessionID"], "tran": []}
+    def exec_nom_agencies_and_positions(self, include_disabled_agencies: int):
 
-        for tran in response:
+        return self._request(
+            "ExecNomAgenciesandPositions",
+            (include_disabled_agencies,),
+            self._parse_exec_nom_agencies_and_positions,
+        )
 
-            tran_meta = tran.attrib
+    def _parse_exec_nom_agencies_and_positions(self, response):
+        return {"agencies": list(map(self.extractors["agency"], response))}
 
-            tran_obj = {
-                "tran_id": tran_meta["ID"],
-                "type": tran_meta["Type"],
-                "bill": tran_meta["Bill"],
-                "cmte_id": tran_meta["CmteID"],
-                "cmte_name": tran_meta["CmteName"],
-                "cmte_short_name": tran_meta["CmteShortName"],
-                "referral": tran_meta["Referral"],
-                "cow_referral": tran_meta["COW_Referral"],
-                "action": tran_meta["Action"],
-                "action_id": tran_meta["Action_ID"],
-                "action_date": tran_meta["ActionDate"],
-                "comments": tran_meta["Comments"],
-                "votes": [],
-            }
+    def floor_votes_by_bill(self, session_id: int, bill_number: str) -> Dict:
 
-            for vote in tran:
+        return self._request(
+            "FloorVotesByBill",
+            (session_id, bill_number),
+            self._parse_floor_votes_by_bill,
+        )
 
-                current = vote.attrib
+    def _parse_floor_votes_by_bill(self, response) -> Dict:
 
-                vote_obj = {
-                    "member_id": current["MemID"],
-                    "member_name": current["MemName"],
-                    "display_order": current["DisplayOrder"],
-                    "vote": current["Vote"],
-                }
+        return {
+            "session_id": response.get("SessionID"),
+            "tran": list(map(self.extractors["floor_transaction"], response)),
+        }
 
-                tran_obj["votes"].append(vote_obj)
+    def floor_votes_by_bill_from_date(
+        self, session_id: int, bill_number: str, start_date: str
+    ):
 
-            votes["tran"].append(tran_obj)
+        return self._request(
+            "FloorVotesByBillFromDate",
+            (session_id, bill_number, start_date),
+            self._parse_floor_votes_by_bill_from_date,
+        )
 
-        return votes
+    def _parse_floor_votes_by_bill_from_date(self, response) -> Dict:
 
-    def floor_votes_from_date(self, session_id: int, start_date: str):
+        return {
+            "session_id": response.get("SessionID"),
+            "tran": list(map(self.extractors["floor_transaction"], response)),
+        }
 
-        response = self.client.service.FloorVotesFromDate(self, session_id, start_date)
+    def floor_votes_by_committee_id(self, session_id: int, committee_id: int):
 
-        meta = response.attrib
+        return self._request(
+            "FloorVotesByCommID",
+            (session_id, committee_id),
+            self._parse_floor_votes_by_committee_id,
+        )
 
-        votes = {"session_id": meta["SessionID"], "tran": []}
+    def _parse_floor_votes_by_committee_id(self, response) -> Dict:
 
-        for tran in response:
+        return {
+            "session_id": response.get("SessionID"),
+            "tran": list(map(self.extractors["floor_transaction"], response)),
+        }
 
-            tran_meta = tran.attrib
+    def floor_votes_by_session_id(self, session_id: int):
 
-            tran_obj = {
-                "tran_id": tran_meta["ID"],
-                "type": tran_meta["Type"],
-                "bill": tran_meta["Bill"],
-                "cmte_id": tran_meta["CmteID"],
-                "cmte_name": tran_meta["CmteName"],
-                "cmte_short_name": tran_meta["CmteShortName"],
-                "referral": tran_meta["Referral"],
-                "cow_referral": tran_meta["COW_Referral"],
-                "action": tran_meta["Action"],
-                "action_id": tran_meta["Action_ID"],
-                "action_date": tran_meta["ActionDate"],
-                "comments": tran_meta["Comments"],
-                "votes": [],
-            }
+        return self._request(
+            "FloorVotesBySessionID",
+            (session_id,),
+            self._parse_floor_votes_by_session_id,
+        )
 
-            for vote in tran:
+    def _parse_floor_votes_by_session_id(self, response) -> Dict:
 
-                current = vote.attrib
+        return {
+            "session_id": response.get("SessionID"),
+            "tran": list(map(self.extractors["floor_transaction"], response)),
+        }
 
-                vote_obj = {
-                    "member_id": current["MemID"],
-                    "member_name": current["MemName"],
-                    "display_order": current["DisplayOrder"],
-                    "vote": current["Vote"],
-                }
+    def floor_votes_from_date(self, session_id: int, start_date: str):
 
-                tran_obj["votes"].append(vote_obj)
+        return self._request(
+            "FloorVotesFromDate",
+            (session_id, start_date),
+            self._parse_floor_votes_from_date,
+        )
 
-            votes["tran"].append(tran_obj)
+    def _parse_floor_votes_from_date(self, response) -> Dict:
 
-        return votes
+        return {
+            "session_id": response.get("SessionID"),
+            "tran": list(map(self.extractors["floor_transaction"], response)),
+        }
 
     def floor_votes_from_date_to_date(
         self, session_id: int, start_date: str, end_date: str
     ):
 
-        response = self.client.service.FloorVotesFromDateToDate(
-            self, session_id, start_date, end_date
+        return self._request(
+            "FloorVotesFromDateToDate",
+            (session_id, start_date, end_date),
+            self._parse_floor_votes_from_date_to_date,
         )
 
-        meta = response.attrib
-
-        votes = {"session_id": meta["SessionID"], "tran": []}
-
-        for tran in response:
-
-            tran_meta = tran.attrib
+    def _parse_floor_votes_from_date_to_date(self, response) -> Dict:
 
-            tran_obj = {
-                "tran_id": tran_meta["ID"],
-                "type": tran_meta["Type"],
-                "bill": tran_meta["Bill"],
-                "cmte_id": tran_meta["CmteID"],
-                "cmte_name": tran_meta["CmteName"],
-                "cmte_short_name": tran_meta["CmteShortName"],
-                "referral": tran_meta["Referral"],
-                "cow_referral": tran_meta["COW_Referral"],
-                "action": tran_meta["Action"],
-                "action_id": tran_meta["Action_ID"],
-                "action_date": tran_meta["ActionDate"],
-                "comments": tran_meta["Comments"],
-                "votes": [],
-            }
-
-            for vote in tran:
-
-                current = vote.attrib
-
-                vote_obj = {
-                    "member_id": current["MemID"],
-                    "member_name": current["MemName"],
-                    "display_order": current["DisplayOrder"],
-                    "vote": current["Vote"],
-                }
-
-                tran_obj["votes"].append(vote_obj)
-
-            votes["tran"].append(tran_obj)
-
-        return votes
+        return {
+            "session_id": response.get("SessionID"),
+            "tran": list(map(self.extractors["floor_transaction"], response)),
+        }
 
     def bill_positions_by_date(self, start_date: str, end_date: str) -> Dict:
 
-        response = self.client.service.ForAgainstNeutralBetweenDates(
-            start_date, end_date
+        return self._request(
+            "ForAgainstNeutralBetweenDates",
+            (start_date, end_date),
+            self._parse_bill_positions_by_date,
         )
 
-        positions = {"positions": []}
-
-        for position in response:
-            position_obj = {
-                "first_name": position.get("First_Name"),
-                "last_name": position.get("Last_name"),
-                "bill_number": position.get("BillNum"),
-                "representing": position.get("Representing"),
-                "opinion": position.get("Opinion"),
-                "position_date": position.get("PosDate"),
-            }
-
-            positions["positions"].append(position_obj)
-
-        return positions
+    def _parse_bill_positions_by_date(self, response) -> Dict:
+        return {"positions": list(map(self.extractors["bill_position"], response))}
 
     def bill_positions_by_session(self, session_id: int) -> Dict:
 
-        response = self.client.service.ForAgainstNeutralBySessionID(session_id)
-
-        positions = {"positions": []}
-
-        for position in response:
-            position_obj = {
-                "first_name": position.get("First_Name"),
-                "last_name": position.get("Last_name"),
-                "bill_number": position.get("BillNum"),
-                "representing": position.get("Representing"),
-                "opinion": position.get("Opinion"),
-                "position_date": position.get("PosDate"),
-            }
-
-            positions["positions"].append(position_obj)
+        return self._request(
+            "ForAgainstNeutralBySessionID",
+            (session_id,),
+            self._parse_bill_positions_by_session,
+        )
 
-        return positions
+    def _parse_bill_positions_by_session(self, response) -> Dict:
+        return {"positions": list(map(self.extractors["bill_position"], response))}
 
     def bill_positions_by_session_from_date(self, session_id: int, start_date: str):
 
-        response = self.client.service.ForAgainstNeutralBySessionIDFromDate(
-            session_id, start_date
+        return self._request(
+            "ForAgainstNeutralBySessionIDFromDate",
+            (session_id, start_date),
+            self._parse_bill_positions_by_session_from_date,
         )
 
-        positions = {"positions": []}
-
-        for position in response:
-            position_obj = {
-                "first_name": position.get("First_Name"),
-                "last_name": position.get("Last_name"),
-                "bill_number": position.get("BillNum"),
-                "representing": position.get("Representing"),
-                "opinion": position.get("Opinion"),
-                "position_date": position.get("PosDate"),
-            }
-
-            positions["positions"].append(position_obj)
-
-        return positions
+    def _parse_bill_positions_by_session_from_date(self, response) -> Dict:
+        return {"positions": list(map(self.extractors["bill_position"], response))}
 
     def member_by_id(self, member_id: int, session_id: int):
 
-        response = self.client.service.MemberByID(member_id, session_id)
-
-        current = dict(response.attrib)
-
-        member = {
-            "legislature": current["Legislature"],
-            "member_id": current["Member_ID"],
-            "full_name": current["Full_Name"],
-            "report_name": current["Report_Name"],
-            "body": current["Body"],
-            "district": current["District"],
-            "party": current["Party"],
-            "status": current["Status"],
-            "postition": current["Postition"],
-            "email": current["Email"],
-            "phone": current["Phone"],
-            "fax": current["Fax"],
-            "maj_leader": current["Maj_Leader"],
-            "min_leader": current["Min_Leader"],
-            "maj_whip": current["Maj_Whip"],
-            "min_whip": current["Min_Whip"],
-            "room": current["Room"],
-        }
+        return self._request(
+            "MemberByID", (member_id, session_id), self._parse_member_by_id
+        )
 
-        return member
+    def _parse_member_by_id(self, response):
+        return self.extractors["member"](response)
 
     # TODO Test This One
     # TODO Does not work ... ?
@@ -1213,39 +1056,24 @@ class AzLegApiClient:
 
     def members_by_session_id(self, session_id: int) -> Dict:
 
-        response = self.client.service.MembersBySessionID(session_id)
-
-        members = {"session_id": session_id, "members": []}
-
-        for current in response:
-
-            member = {
-                "legislature": current["Legislature"],
-                "member_id": current["Member_ID"],
-                "full_name": current["Full_Name"],
-                "report_name": current["Report_Name"],
-                "body": current["Body"],
-                "district": current["District"],
-                "party": current["Party"],
-                "status": current["Status"],
-                "postition": current["Postition"],
-                "email": current["Email"],
-                "phone": current["Phone"],
-                "fax": current["Fax"],
-                "maj_leader": current["Maj_Leader"],
-                "min_leader": current["Min_Leader"],
-                "maj_whip": current["Maj_Whip"],
-                "min_whip": current["Min_Whip"],
-                "room": current["Room"],
-            }
+        return self._request(
+            "MembersBySessionID",
+            (session_id,),
+            partial(self._parse_members_by_session_id, session_id),
+        )
 
-            members["members"].append(member)
+    def _parse_members_by_session_id(self, session_id, response) -> Dict:
 
-        return members
+        return {
+            "session_id": session_id,
+            "members": list(map(self.extractors["member"], response)),
+        }
 
     def sessions(self):
 
-        response = self.client.service.Sessions()
+        return self._request("Sessions", (), self._parse_sessions)
+
+    def _parse_sessions(self, response):
 
         sessions = []
 
@@ -1259,14 +1087,16 @@ class AzLegApiClient:
                 "legislature": current["Legislature"],
                 "session": current["Session"],
                 "legislation_Year": current["Legislation_Year"],
-                "session_start_date": isodate.parse_datetime(
-                    current["session_start_date"]
-                )
-                if "session_start_date" in current
-                else None,
-                "sine_die_sate": isodate.parse_datetime(current["sine_die_date"])
-                if "sine_die_date" in current
-                else None,
+                "session_start_date": (
+                    parse_timestamp(current["session_start_date"])
+                    if "session_start_date" in current
+                    else None
+                ),
+                "sine_die_sate": (
+                    parse_timestamp(current["sine_die_date"])
+                    if "sine_die_date" in current
+                    else None
+                ),
             }
 
             sessions.append(obj)
@@ -1275,7 +1105,9 @@ class AzLegApiClient:
 
     def session_by_id(self, session_id):
 
-        response = self.client.service.SessionsbyID(session_id)
+        return self._request("SessionsbyID", (session_id,), self._parse_session_by_id)
+
+    def _parse_session_by_id(self, response):
 
         current = dict(response.find("SESSION").attrib)
 
@@ -1285,78 +1117,53 @@ class AzLegApiClient:
             "legislature": current["Legislature"],
             "session": current["Session"],
             "legislation_Year": current["Legislation_Year"],
-            "session_start_date": isodate.parse_datetime(current["Session_Start_Date"])
-            if "session_start_date" in current
-            else None,
-            "sine_die_sate": isodate.parse_datetime(current["Sine_Die_Date"])
-            if "sine_die_date" in current
-            else None,
+            "session_start_date": (
+                parse_timestamp(current["Session_Start_Date"])
+                if "session_start_date" in current
+                else None
+            ),
+            "sine_die_sate": (
+                parse_timestamp(current["Sine_Die_Date"])
+                if "sine_die_date" in current
+                else None
+            ),
         }
 
         return session
 
     def sponsored_bills(self, session_id, member_id):
 
-        response = self.client.service.SponsoredBills(session_id, member_id)
+        return self._request(
+            "SponsoredBills", (session_id, member_id), self._parse_sponsored_bills
+        )
 
-        data = {"member": {}, "bills": []}
+    def _parse_sponsored_bills(self, response):
 
         sponsor = response.find("SPONSOR")
 
-        member = dict(sponsor.attrib)
-
-        data["member"] = {"name": member["MEMBER"], "member_id": member["MEMBER_ID"]}
-
-        for bill in sponsor:
-
-            bill = {
-                "bill_number": bill.findtext("Bill_Number"),
-                "sponsor_type": bill.findtext("Sponsor_Type"),
-                "display_order": bill.findtext("Display_Order"),
-                "bill_version": bill.findtext("Bill_Version"),
-            }
+        return {
+            "member": {
+                "name": sponsor.get("MEMBER"),
+                "member_id": sponsor.get("MEMBER_ID"),
+            },
+            "bills": list(map(self.extractors["sponsored_bill"], sponsor)),
+        }
 
-            data["bills"].append(bill)
+    def standing_by_bill_num(self, session_id: int, bill_number: str) -> Dict:
 
-        return data
+        return self._request(
+            "StandingByBillNum",
+            (session_id, bill_number),
+            partial(self._parse_standing_by_bill_num, bill_number),
+        )
 
-    def standing_by_bill_num(self, session_id: int, bill_number: str) -> Dict:
-        
-        response = self.client.service.StandingByBillNum(session_id, bill_number)
+    def _parse_standing_by_bill_num(self, bill_number, response) -> Dict:
 
-        standings = {
+        return {
             "bill_number": bill_number,
-            "standings":[]
+            "standings": list(map(self.extractors["standing"], response)),
         }
 
-        for standing in response:
-
-            standing_obj = {
-                "session_id":standing.get("Session_ID"),
-                "bill_number":standing.get("Bill_Number"),
-                "committee_id":standing.get("Committee_ID"),
-                "committee_name":standing.get("Committee_Name"),
-                "committee_short_name":standing.get("Committee_Short_Name"),
-                "referral_number":standing.get("Referral_Number"),
-                "display_order":standing.get("Display_Order"),
-                "assigned_date":standing.get("Assigned_Date"),
-                "vote_recon":standing.get("Vote_Recon"),
-                "action_id":standing.get("Action_ID"),
-                "action":standing.get("Action"),
-                "ayes":standing.get("Ayes"),
-                "nays":standing.get("Nays"),
-                "excused":standing.get("Excused"),
-                "not_voting":standing.get("Not_Voting"),
-                "present":standing.get("Present"),
-                "absent":standing.get("Absent"),
-                "report_date":standing.get("Report_Date"),
-                "vacant":standing.get("Vacant")
-            }
-
-            standings["standings"].append(standing_obj)
-
-        return standings
-
     # TODO DATE
 
     def standing_by_committee(self, committee_id, start_date=None):
@@ -1369,47 +1176,23 @@ class AzLegApiClient:
         pass
 
     def standing_vote_for_bill(self, session_id: int, bill_number: str) -> Dict:
-        
-        response = self.client.service.StandingVoteForBillNum(session_id, bill_number)
 
-        standing_votes = {
+        return self._request(
+            "StandingVoteForBillNum",
+            (session_id, bill_number),
+            partial(self._parse_standing_vote_for_bill, bill_number),
+        )
+
+    def _parse_standing_vote_for_bill(self, bill_number, response) -> Dict:
+
+        return {
             "session_id": response.get("SessionID"),
             "bill_number": bill_number,
-            "transactions":[]
+            "transactions": list(
+                map(self.extractors["standing_transaction"], response)
+            ),
         }
 
-        for transaction in response:
-
-            transaction_obj = {
-                "id":transaction.get("ID"),
-                "type":transaction.get("Type"),
-                "bill_number":transaction.get("Bill"),
-                "committee_id":transaction.get("CmteID"),
-                "committee_short_name":transaction.get("CmteShortName"),
-                "committee_name":transaction.get("CmteName"),
-                "referral":transaction.get("Referral"),
-                "action":transaction.get("Action"),
-                "action_id":transaction.get("Action_ID"),
-                "action_date":transaction.get("ActionDate"),
-                "votes":[]
-            }
-
-            for vote in transaction:
-
-                vote_obj = {
-                    "member_id":vote.get("MemID"),
-                    "member_name":vote.get("MemName"),
-                    "display_order":vote.get("DisplayOrder"),
-                    "vote":vote.get("Vote")
-                }
-
-                transaction_obj["votes"].append(vote_obj)
-
-            standing_votes["transactions"].append(transaction_obj)
-
-        return standing_votes
-
-
     # TODO Date
 
     def standing_vote_by_committee(self, session_id, committee_id, date=None):
@@ -1423,68 +1206,16 @@ class AzLegApiClient:
 
     def videos_by_date(self, date: str):
 
-        response = self.client.service.VideosByDate(date)
-
-        videos = {"videos": []}
-
-        for video in response:
-
-            video_obj = {
-                "VideoClipId": video.get("VideoClipId"),
-                "ClipName": video.get("ClipName"),
-                "Duration": video.get("Duration"),
-                "Date": video.get("Date"),
-                "ForeignId": video.get("ForeignId"),
-                "DownloadLink": video.get("DownloadLink"),
-                "SessionId": video.get("SessionId"),
-                "chapters": [],
-            }
-
-            for chapter in video:
+        return self._request("VideosByDate", (date,), self._parse_videos_by_date)
 
-                chapter_obj = {
-                    "Clipname": chapter.get("Clipname"),
-                    "ForeignID": chapter.get("ForeignID"),
-                    "TimeStamp": chapter.get("TimeStamp"),
-                    "VideoClipIndexId": chapter.get("VideoClipIndexId"),
-                }
-
-                video_obj["chapters"].append(chapter_obj)
-
-            videos["videos"].append(video_obj)
-
-        return videos
+    def _parse_videos_by_date(self, response):
+        return {"videos": list(map(self.extractors["video"], response))}
 
     def videos_by_session(self, session_id: int):
 
-        response = self.client.service.VideosBySession(session_id)
-
-        videos = {"videos": []}
-
-        for video in response:
-
-            video_obj = {
-                "VideoClipId": video.get("VideoClipId"),
-                "ClipName": video.get("ClipName"),
-                "Duration": video.get("Duration"),
-                "Date": video.get("Date"),
-                "ForeignId": video.get("ForeignId"),
-                "DownloadLink": video.get("DownloadLink"),
-                "SessionId": video.get("SessionId"),
-                "chapters": [],
-            }
-
-            for chapter in video:
-
-                chapter_obj = {
-                    "Clipname": chapter.get("Clipname"),
-                    "ForeignID": chapter.get("ForeignID"),
-                    "TimeStamp": chapter.get("TimeStamp"),
-                    "VideoClipIndexId": chapter.get("VideoClipIndexId"),
-                }
-
-                video_obj["chapters"].append(chapter_obj)
-
-            videos["videos"].append(video)
+        return self._request(
+            "VideosBySession", (session_id,), self._parse_videos_by_session
+        )
 
-        return videos
+    def _parse_videos_by_session(self, response):
+        return {"videos": list(map(self.extractors["video"], response))}
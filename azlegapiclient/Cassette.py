@@ -0,0 +1,218 @@
+import gzip
+import io
+import os
+import threading
+from typing import Iterator, Tuple
+from urllib.parse import quote, unquote
+
+import requests
+from lxml import etree
+
+from .FastPath import SOAP_ENV, FastPath
+from .PooledTransport import PooledTransport
+from .ResponseCache import ResponseCache
+
+RECORD = "record"
+REPLAY = "replay"
+AUTO = "auto"
+
+SUFFIX = ".xml.gz"
+
+
+class CassetteMiss(LookupError):
+    def __init__(self, operation: str, args: tuple):
+        super().__init__("no recorded response for %s%r" % (operation, args))
+        self.operation = operation
+        self.args = args
+
+
+class RecordedResponse:
+    def __init__(self, content: bytes):
+        self.status_code = 200
+        self.content = content
+
+
+# A directory of recorded responses, one gzip file per SOAP operation and
+# argument tuple, e.g. FloorVotesByBill(121,HB2001).xml.gz. Arguments are kept
+# as the strings that were sent. GET requests (the WSDL and its schemas) are
+# stored under the operation "GET" with the URL as their argument. Only
+# successful responses are recorded. Replayed files are kept in memory after
+# first use; preload() reads them all up front.
+
+
+class Cassette:
+    def __init__(self, path: str, mode: str = REPLAY):
+        if mode not in (RECORD, REPLAY, AUTO):
+            raise ValueError("unknown cassette mode %r" % mode)
+
+        self.path = path
+        self.mode = mode
+        self.responses = {}
+        self.lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def filename(operation: str, args: tuple) -> str:
+        return "%s(%s)%s" % (
+            operation,
+            ",".join(quote(arg, safe="") for arg in args),
+            SUFFIX,
+        )
+
+    @staticmethod
+    def parse_filename(filename: str) -> Tuple[str, tuple]:
+
+        operation, _, args = filename[: -len(SUFFIX)].partition("(")
+        args = args[:-1]
+
+        return operation, tuple(unquote(arg) for arg in args.split(",")) if args else ()
+
+    def get(self, operation: str, args: tuple) -> bytes:
+
+        key = (operation, args)
+        content = self.responses.get(key)
+
+        if content is None:
+            try:
+                with gzip.open(
+                    os.path.join(self.path, self.filename(operation, args))
+                ) as f:
+                    content = f.read()
+            except FileNotFoundError:
+                return None
+
+            with self.lock:
+                self.responses[key] = content
+
+        return content
+
+    def put(self, operation: str, args: tuple, content: bytes):
+
+        path = os.path.join(self.path, self.filename(operation, args))
+
+        with gzip.open(path + ".tmp", "wb") as f:
+            f.write(content)
+
+        os.replace(path + ".tmp", path)
+
+        with self.lock:
+            self.responses[(operation, args)] = content
+
+    def __iter__(self) -> Iterator[Tuple[str, tuple]]:
+        for filename in sorted(os.listdir(self.path)):
+            if filename.endswith(SUFFIX):
+                yield self.parse_filename(filename)
+
+    def preload(self):
+        for operation, args in self:
+            self.get(operation, args)
+
+    # Fills a ResponseCache with every recorded SOAP response, parsed as the
+    # client would parse it, so calls are answered without a request (for as
+    # long as the cache's TTLs allow). Returns the number of responses added.
+
+    def warm(self, cache: ResponseCache) -> int:
+
+        parser = FastPath(None, None)
+        count = 0
+
+        for operation, args in self:
+            if operation != "GET":
+                response = RecordedResponse(self.get(operation, args))
+                cache.set(operation, args, parser.parse(response))
+                count += 1
+
+        return count
+
+
+# The operation comes from the SOAPAction header and the arguments from the
+# children of the operation element in the body, so the WS-Security header's
+# nonce and timestamp do not change the key.
+
+
+def request_key(request: requests.PreparedRequest) -> Tuple[str, tuple]:
+
+    if request.method == "GET":
+        return "GET", (request.url,)
+
+    operation = request.headers["SOAPAction"].strip('"').rsplit("/", 1)[-1]
+    body = etree.fromstring(request.body).find(etree.QName(SOAP_ENV, "Body"))
+
+    return operation, tuple(child.text or "" for child in body[0])
+
+
+# requests adapter that answers from a Cassette and, when recording, passes
+# requests on to adapter and saves what comes back.
+
+
+class CassetteAdapter(requests.adapters.BaseAdapter):
+    def __init__(self, cassette: Cassette, adapter: requests.adapters.BaseAdapter):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request, stream=False, **kwargs):
+
+        operation, args = request_key(request)
+
+        if self.cassette.mode != RECORD:
+            content = self.cassette.get(operation, args)
+
+            if content is not None:
+                return self.build(request, 200, content)
+
+            if self.cassette.mode == REPLAY:
+                raise CassetteMiss(operation, args)
+
+        response = self.adapter.send(request, stream=stream, **kwargs)
+        content = response.content
+        response.close()
+
+        if response.status_code == 200:
+            self.cassette.put(operation, args, content)
+
+        return self.build(request, response.status_code, content)
+
+    def build(self, request, status_code: int, content: bytes) -> requests.Response:
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers["Content-Type"] = "text/xml; charset=utf-8"
+        response.raw = io.BytesIO(content)
+        response.request = request
+        response.url = request.url
+
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+# PooledTransport whose HTTP(S) requests go through a CassetteAdapter. mode is
+# "record" (always send, and save the responses), "replay" (never send; a
+# missing response raises CassetteMiss) or "auto" (replay what was recorded
+# and record the rest). The schema cache is bypassed so the WSDL is recorded
+# and replayed like any other response.
+#
+#   api = AzLegApiClient(username, password,
+#                        transport=CassetteTransport("cassettes", mode="record"))
+
+
+class CassetteTransport(PooledTransport):
+    def __init__(
+        self,
+        path: str,
+        mode: str = REPLAY,
+        adapter: requests.adapters.BaseAdapter = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.cache = None
+        self.cassette = Cassette(path, mode)
+        self.adapter = CassetteAdapter(
+            self.cassette,
+            adapter if adapter is not None else self.session.get_adapter("https://"),
+        )
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
@@ -0,0 +1,173 @@
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, NamedTuple, Optional
+
+from .PooledTransport import is_retryable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+# An operation's circuit opens after failure_threshold consecutive failed
+# calls (after retries). While open, calls fail fast, or are answered from an
+# expired cache entry when serve_stale is set and one exists. After
+# reset_timeout seconds a single probe call is let through: success closes
+# the circuit, failure opens it again.
+
+
+class BreakerPolicy(NamedTuple):
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    serve_stale: bool = True
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, operation: str, retry_after: float):
+        super().__init__(
+            "%s circuit is open, retry in %.1fs" % (operation, retry_after)
+        )
+        self.operation = operation
+        self.retry_after = retry_after
+
+
+# Only errors that mean the endpoint is unavailable (see is_retryable) count
+# as failures; a SOAP fault still proves the service is answering.
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        policy: BreakerPolicy = None,
+        policies: Dict[str, BreakerPolicy] = None,
+        clock: Callable = time.monotonic,
+    ):
+        self.default_policy = policy
+        self.policies = policies or {}
+        self.clock = clock
+        self.states = {}
+        self.failures = Counter()
+        self.opened_at = {}
+        self.opened = Counter()
+        self.rejected = Counter()
+        self.stale = Counter()
+        self.lock = threading.Lock()
+
+    def policy(self, operation: str) -> Optional[BreakerPolicy]:
+        return self.policies.get(operation, self.default_policy)
+
+    def state(self, operation: str) -> str:
+        return self.states.get(operation, CLOSED)
+
+    # Raises CircuitOpenError unless a call may go ahead. The caller must
+    # report its outcome with record() or abort().
+
+    def before(self, operation: str):
+
+        policy = self.policy(operation)
+
+        if policy is None:
+            return
+
+        with self.lock:
+            state = self.state(operation)
+
+            if state == CLOSED:
+                return
+
+            retry_after = (
+                self.opened_at[operation] + policy.reset_timeout - self.clock()
+            )
+
+            if state == OPEN and retry_after <= 0:
+                self.states[operation] = HALF_OPEN
+                return
+
+            self.rejected[operation] += 1
+
+        raise CircuitOpenError(operation, max(0.0, retry_after))
+
+    def record(self, operation: str, error: Exception = None):
+
+        policy = self.policy(operation)
+
+        if policy is None:
+            return
+
+        with self.lock:
+            if error is None or not is_retryable(error):
+                self.states.pop(operation, None)
+                self.failures[operation] = 0
+                return
+
+            self.failures[operation] += 1
+
+            if (
+                self.state(operation) == HALF_OPEN
+                or self.failures[operation] >= policy.failure_threshold
+            ):
+                self.states[operation] = OPEN
+                self.opened_at[operation] = self.clock()
+                self.opened[operation] += 1
+
+    # A probe that was cancelled says nothing about the endpoint; let the
+    # next call probe instead.
+
+    def abort(self, operation: str):
+        with self.lock:
+            if self.state(operation) == HALF_OPEN:
+                self.states[operation] = OPEN
+
+    def served_stale(self, operation: str):
+        with self.lock:
+            self.stale[operation] += 1
+
+    def call(self, operation: str, function: Callable, *args):
+
+        self.before(operation)
+
+        try:
+            result = function(*args)
+        except Exception as error:
+            self.record(operation, error)
+            raise
+        except BaseException:
+            self.abort(operation)
+            raise
+
+        self.record(operation)
+
+        return result
+
+    async def call_async(self, operation: str, function: Callable, *args):
+
+        self.before(operation)
+
+        try:
+            result = await function(*args)
+        except Exception as error:
+            self.record(operation, error)
+            raise
+        except BaseException:
+            self.abort(operation)
+            raise
+
+        self.record(operation)
+
+        return result
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {
+                "operations": {
+                    operation: {
+                        "state": self.state(operation),
+                        "failures": self.failures[operation],
+                        "opened": self.opened[operation],
+                        "rejected": self.rejected[operation],
+                        "stale": self.stale[operation],
+                    }
+                    for operation in set(self.failures) | set(self.rejected)
+                }
+            }
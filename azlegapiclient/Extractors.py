@@ -0,0 +1,530 @@
+from operator import itemgetter
+from typing import Callable, Dict, NamedTuple, Tuple
+
+from . import LazyRecord as lazy
+from .LazyRecord import getters, lazy_extractor
+from .Timestamps import parse_timestamp
+from .Records import Calendar, CalendarBill, Document, FloorTransaction, Member, Vote
+
+# Record schemas: (key, XML attribute) pairs in output order, with an optional
+# third item decoding the raw value (dates go through parse_timestamp). Each
+# schema is turned once into an extractor that builds the record dict from an
+# lxml element, and every endpoint returning that record type shares it.
+
+SPONSOR_FIELDS = (
+    ("display_order", "Display_Order"),
+    ("type", "Type"),
+    ("member_id", "Member_ID"),
+    ("member_name", "Member_Name"),
+)
+
+BILL_DOCUMENT_FIELDS = (
+    ("document_type", "Document_Type"),
+    ("document_format", "Document_Format"),
+    ("description", "Description"),
+    ("last_updated", "Last_Updated", parse_timestamp),
+    ("url", "URL"),
+)
+
+CALENDAR_BILL_FIELDS = (
+    ("bill_number", "Bill_Number"),
+    ("display_order", "Display_Order"),
+    ("reconsidered", "Reconsidered"),
+)
+
+CALENDAR_FIELDS = (
+    ("calendar_id", "Cal_ID"),
+    ("body", "Body"),
+    ("type", "Type"),
+    ("calendar_date", "Cal_Date", parse_timestamp),
+    ("number", "Number"),
+    ("committee_name", "Committee_Name"),
+    ("committee_id", "Committee_ID"),
+    ("calendar_name", "Cal_Name"),
+    ("calendar_time", "Cal_Time"),
+    ("protest_date", "Protest_Date", parse_timestamp),
+    ("url", "URL"),
+)
+
+COMMITTEE_ACTION_FIELDS = (
+    ("action_id", "Action_ID"),
+    ("action", "Action"),
+    ("action_description", "Action_Description"),
+    ("rfeir_action", "RFEIR_Action"),
+    ("body", "Body"),
+    ("committee_type", "Committee_Type"),
+)
+
+COMMITTEE_FIELDS = (
+    ("committee_id", "Committee_ID"),
+    ("committee_name", "Committee_Name"),
+    ("committee_short_name", "Committee_Short_Name"),
+    ("sub_committee", "Sub_Committee"),
+)
+
+COMMITTEE_MEMBER_FIELDS = (
+    ("member_order", "Member_Order"),
+    ("member_id", "Member_ID"),
+    ("member_name", "Member_Name"),
+    ("member_position", "Member_Position"),
+)
+
+DOCUMENT_FIELDS = (
+    ("item", "Item"),
+    ("transaction_type", "Transaction_Type"),
+    ("bill_number", "Bill_Number"),
+    ("document_type", "Document_Type"),
+    ("document_format", "Document_Format"),
+    ("description", "Description"),
+    ("url", "URL"),
+    ("transaction_date", "Transaction_Date", parse_timestamp),
+)
+
+NOMINEE_POSITION_HOLDER_FIELDS = (
+    ("agency_id", "AgencyId"),
+    ("position_id", "PositionId"),
+    ("nominee_id", "NomineeId"),
+    ("first_name", "FirstName"),
+    ("middle_initial", "MiddleInitial"),
+    ("last_name", "LastName"),
+    ("title", "Title"),
+    ("party", "Party"),
+    ("nominee_position_id", "NomineePositionId"),
+    ("received_date", "ReceivedDate", parse_timestamp),
+    ("confirmed_date", "ConfirmedDate", parse_timestamp),
+    ("governor", "Governor"),
+    ("position_comment", "PositionComment"),
+    ("replacing", "Replacing"),
+    ("appointment_date", "AppointmentDate", parse_timestamp),
+    ("expiration_date", "ExpirationDate", parse_timestamp),
+    ("caucus_date", "CaucusDate", parse_timestamp),
+    ("gov_notified_date", "GovNotifiedDate", parse_timestamp),
+    ("withdrawn_from_consideration", "WithdrawnFromConsideration"),
+    ("comments", "Comments"),
+    ("reappoint", "Reappoint"),
+    ("no_longer_serving", "NoLongerServing"),
+    ("wo_conf", "WOConf"),
+    ("wd_date", "WDDate", parse_timestamp),
+)
+
+NOMINEE_FIELDS = (
+    ("nominee_id", "NomineeId"),
+    ("first_name", "FirstName"),
+    ("middle_initial", "MiddleInitial"),
+    ("last_name", "LastName"),
+    ("title", "Title"),
+    ("party", "Party"),
+    ("address_line_1", "AddressLine1"),
+    ("address_line_2", "AddressLine2"),
+    ("address_line_3", "AddressLine3"),
+)
+
+NOMINATION_FIELDS = (
+    ("nominee_position_id", "NomineePositionId"),
+    ("received_date", "ReceivedDate", parse_timestamp),
+    ("confirmed_date", "ConfirmedDate", parse_timestamp),
+    ("governor", "Governor"),
+    ("position_comment", "PositionComment"),
+    ("replacing", "Replacing"),
+    ("appointment_date", "AppointmentDate", parse_timestamp),
+    ("expiration_date", "ExpirationDate", parse_timestamp),
+    ("referred_date", "ReferredDate", parse_timestamp),
+    ("report_date", "ReportDate", parse_timestamp),
+    ("caucus_date", "CaucusDate", parse_timestamp),
+    ("committee_short_name", "CommitteeShortName"),
+    ("gov_notified_date", "GovNotifiedDate", parse_timestamp),
+    ("withdrawn_from_consideration", "WithdrawnFromConsideration"),
+    ("comments", "Comments"),
+    ("reappoint", "Reappoint"),
+    ("caucus_vote", "CaucusVote"),
+    ("beginning_date", "BeginningDate", parse_timestamp),
+    ("no_longer_serving", "NoLongerServing"),
+    ("wd_date", "WDDate", parse_timestamp),
+)
+
+AGENCY_POSITION_FIELDS = (
+    ("position_id", "PositionId"),
+    ("name", "Name"),
+    ("display_order", "DisplayOrder"),
+    ("disabled", "Disabled"),
+)
+
+AGENCY_FIELDS = (
+    ("agency_id", "AgencyID"),
+    ("agency_name", "AgencyName"),
+    ("proper_name", "ProperName"),
+    ("origin", "Origin"),
+    ("term_length", "TermLength"),
+    ("description", "Description"),
+    ("disabled", "Disabled"),
+)
+
+VOTE_FIELDS = (
+    ("member_id", "MemID"),
+    ("member_name", "MemName"),
+    ("display_order", "DisplayOrder"),
+    ("vote", "Vote"),
+)
+
+FLOOR_TRANSACTION_FIELDS = (
+    ("tran_id", "ID"),
+    ("type", "Type"),
+    ("bill", "Bill"),
+    ("cmte_id", "CmteID"),
+    ("cmte_name", "CmteName"),
+    ("cmte_short_name", "CmteShortName"),
+    ("referral", "Referral"),
+    ("cow_referral", "COW_Referral"),
+    ("action", "Action"),
+    ("action_id", "Action_ID"),
+    ("action_date", "ActionDate", parse_timestamp),
+    ("comments", "Comments"),
+)
+
+BILL_POSITION_FIELDS = (
+    ("first_name", "First_Name"),
+    ("last_name", "Last_name"),
+    ("bill_number", "BillNum"),
+    ("representing", "Representing"),
+    ("opinion", "Opinion"),
+    ("position_date", "PosDate", parse_timestamp),
+)
+
+MEMBER_FIELDS = (
+    ("legislature", "Legislature"),
+    ("member_id", "Member_ID"),
+    ("full_name", "Full_Name"),
+    ("report_name", "Report_Name"),
+    ("body", "Body"),
+    ("district", "District"),
+    ("party", "Party"),
+    ("status", "Status"),
+    ("postition", "Postition"),
+    ("email", "Email"),
+    ("phone", "Phone"),
+    ("fax", "Fax"),
+    ("maj_leader", "Maj_Leader"),
+    ("min_leader", "Min_Leader"),
+    ("maj_whip", "Maj_Whip"),
+    ("min_whip", "Min_Whip"),
+    ("room", "Room"),
+)
+
+STANDING_FIELDS = (
+    ("session_id", "Session_ID"),
+    ("bill_number", "Bill_Number"),
+    ("committee_id", "Committee_ID"),
+    ("committee_name", "Committee_Name"),
+    ("committee_short_name", "Committee_Short_Name"),
+    ("referral_number", "Referral_Number"),
+    ("display_order", "Display_Order"),
+    ("assigned_date", "Assigned_Date", parse_timestamp),
+    ("vote_recon", "Vote_Recon"),
+    ("action_id", "Action_ID"),
+    ("action", "Action"),
+    ("ayes", "Ayes"),
+    ("nays", "Nays"),
+    ("excused", "Excused"),
+    ("not_voting", "Not_Voting"),
+    ("present", "Present"),
+    ("absent", "Absent"),
+    ("report_date", "Report_Date", parse_timestamp),
+    ("vacant", "Vacant"),
+)
+
+STANDING_TRANSACTION_FIELDS = (
+    ("id", "ID"),
+    ("type", "Type"),
+    ("bill_number", "Bill"),
+    ("committee_id", "CmteID"),
+    ("committee_short_name", "CmteShortName"),
+    ("committee_name", "CmteName"),
+    ("referral", "Referral"),
+    ("action", "Action"),
+    ("action_id", "Action_ID"),
+    ("action_date", "ActionDate", parse_timestamp),
+)
+
+VIDEO_CHAPTER_FIELDS = (
+    ("Clipname", "Clipname"),
+    ("ForeignID", "ForeignID"),
+    ("TimeStamp", "TimeStamp"),
+    ("VideoClipIndexId", "VideoClipIndexId"),
+)
+
+VIDEO_FIELDS = (
+    ("VideoClipId", "VideoClipId"),
+    ("ClipName", "ClipName"),
+    ("Duration", "Duration"),
+    ("Date", "Date", parse_timestamp),
+    ("ForeignId", "ForeignId"),
+    ("DownloadLink", "DownloadLink"),
+    ("SessionId", "SessionId"),
+)
+
+# Fields read from child element text rather than attributes.
+
+BILL_INFO_FIELDS = (
+    ("short_title", "Short_Title"),
+    ("introduced_date", "Introduced_Date", parse_timestamp),
+    ("house_1st_read", "House_1st_Read", parse_timestamp),
+    ("house_official", "House_Official"),
+    ("house_2nd_read", "House_2nd_Read", parse_timestamp),
+    ("house_consent_calendar_object", "House_Consent_Calendar_Object"),
+    ("senate_official", "Senate_Official"),
+    ("senate_consent_calendar_object", "Senate_Consent_Calendar_Object"),
+    ("postingsheet", "PostingSheet"),
+    ("last_updated", "Last_Updated", parse_timestamp),
+)
+
+BILL_SUMMARY_FIELDS = (
+    ("bill_number", "Bill_Number"),
+    ("initial_title", "Initial_Title"),
+    ("current_title", "Current_Title"),
+    ("last_updated", "Last_Updated", parse_timestamp),
+)
+
+SPONSORED_BILL_FIELDS = (
+    ("bill_number", "Bill_Number"),
+    ("sponsor_type", "Sponsor_Type"),
+    ("display_order", "Display_Order"),
+    ("bill_version", "Bill_Version"),
+)
+
+
+# Each schema becomes a closure. Attribute records fetch every attribute with
+# one itemgetter over element.attrib and only fall back to get(), which
+# yields None for absent attributes, when one is missing. The values are
+# zipped with the keys into a dict, or passed to record when one is given.
+# children is an optional (key, extractor) pair; the extractor is applied to
+# every child element and the list stored under key, after the fields.
+# benchmarks/bench_extractors.py measures them against the hand-written
+# loops they replaced.
+
+
+def _fetcher(sources: Tuple[str, ...]) -> Callable:
+
+    if len(sources) == 1:
+        source = sources[0]
+        return lambda attrib: (attrib[source],)
+
+    return itemgetter(*sources)
+
+
+def compile_extractor(
+    fields: Tuple[Tuple, ...],
+    children: Tuple[str, Callable] = None,
+    record: NamedTuple = None,
+) -> Callable:
+
+    keys = tuple(field[0] for field in fields)
+    sources = tuple(field[1] for field in fields)
+    fetch = _fetcher(sources)
+    key, extract_child = children if children is not None else (None, None)
+
+    if record is not None:
+        if record._fields != keys + ((key,) if children is not None else ()):
+            raise ValueError("%s fields do not match the schema" % record.__name__)
+
+        decoders = tuple(
+            (index, field[2]) for index, field in enumerate(fields) if len(field) > 2
+        )
+        make = record._make
+
+        def extract_record(element):
+
+            try:
+                values = fetch(element.attrib)
+            except KeyError:
+                values = tuple(map(element.get, sources))
+
+            if decoders or extract_child is not None:
+                values = list(values)
+
+                for index, decode in decoders:
+                    values[index] = decode(values[index])
+
+                if extract_child is not None:
+                    values.append([extract_child(child) for child in element])
+
+            return make(values)
+
+        return extract_record
+
+    decoders = tuple((field[0], field[2]) for field in fields if len(field) > 2)
+
+    def extract(element):
+
+        try:
+            result = dict(zip(keys, fetch(element.attrib)))
+        except KeyError:
+            result = dict(zip(keys, map(element.get, sources)))
+
+        for name, decode in decoders:
+            result[name] = decode(result[name])
+
+        if extract_child is not None:
+            result[key] = [extract_child(child) for child in element]
+
+        return result
+
+    return extract
+
+
+def compile_text_extractor(fields: Tuple[Tuple, ...]) -> Callable[..., Dict]:
+
+    keys = tuple(field[0] for field in fields)
+    sources = tuple(field[1] for field in fields)
+    decoders = tuple((field[0], field[2]) for field in fields if len(field) > 2)
+
+    def extract(element):
+
+        result = dict(zip(keys, map(element.findtext, sources)))
+
+        for name, decode in decoders:
+            result[name] = decode(result[name])
+
+        return result
+
+    return extract
+
+
+extract_sponsor = compile_extractor(SPONSOR_FIELDS)
+extract_bill_document = compile_extractor(BILL_DOCUMENT_FIELDS)
+extract_calendar_bill = compile_extractor(CALENDAR_BILL_FIELDS)
+extract_calendar = compile_extractor(CALENDAR_FIELDS, ("bills", extract_calendar_bill))
+extract_committee_action = compile_extractor(COMMITTEE_ACTION_FIELDS)
+extract_committee = compile_extractor(COMMITTEE_FIELDS)
+extract_committee_member = compile_extractor(COMMITTEE_MEMBER_FIELDS)
+extract_document = compile_extractor(DOCUMENT_FIELDS)
+extract_nominee_position_holder = compile_extractor(NOMINEE_POSITION_HOLDER_FIELDS)
+extract_nominee = compile_extractor(NOMINEE_FIELDS)
+extract_nomination = compile_extractor(NOMINATION_FIELDS)
+extract_agency_position = compile_extractor(AGENCY_POSITION_FIELDS)
+extract_agency = compile_extractor(
+    AGENCY_FIELDS, ("positions", extract_agency_position)
+)
+extract_vote = compile_extractor(VOTE_FIELDS)
+extract_floor_transaction = compile_extractor(
+    FLOOR_TRANSACTION_FIELDS, ("votes", extract_vote)
+)
+extract_bill_position = compile_extractor(BILL_POSITION_FIELDS)
+extract_member = compile_extractor(MEMBER_FIELDS)
+extract_standing = compile_extractor(STANDING_FIELDS)
+extract_standing_transaction = compile_extractor(
+    STANDING_TRANSACTION_FIELDS, ("votes", extract_vote)
+)
+extract_video_chapter = compile_extractor(VIDEO_CHAPTER_FIELDS)
+extract_video = compile_extractor(VIDEO_FIELDS, ("chapters", extract_video_chapter))
+extract_bill_info = compile_text_extractor(BILL_INFO_FIELDS)
+extract_bill_summary = compile_text_extractor(BILL_SUMMARY_FIELDS)
+extract_sponsored_bill = compile_text_extractor(SPONSORED_BILL_FIELDS)
+
+
+# Composite records assembled from several parts of the response.
+
+
+def extract_bill(element) -> Dict:
+    return {
+        "session_id": element.get("Session_ID"),
+        "bill_number": element.get("Bill_Number"),
+        **extract_bill_info(element),
+        "sponsors": [extract_sponsor(sponsor) for sponsor in element.find("SPONSORS")],
+        "docs": [extract_bill_document(doc) for doc in element.find("DOCS")],
+    }
+
+
+def extract_nominee_position(element) -> Dict:
+    return {
+        **extract_nominee(element),
+        **extract_nomination(element.find("NOMPOSITION")),
+    }
+
+
+# Extractors by record name. The client picks EXTRACTORS, TYPED_EXTRACTORS
+# or LAZY_EXTRACTORS depending on its typed and lazy options; record types
+# without a typed or lazy form fall back to the plain extractor.
+
+EXTRACTORS = {
+    "agency": extract_agency,
+    "bill": extract_bill,
+    "bill_position": extract_bill_position,
+    "bill_summary": extract_bill_summary,
+    "calendar": extract_calendar,
+    "committee_action": extract_committee_action,
+    "committee_member": extract_committee_member,
+    "document": extract_document,
+    "floor_transaction": extract_floor_transaction,
+    "member": extract_member,
+    "nominee_position": extract_nominee_position,
+    "nominee_position_holder": extract_nominee_position_holder,
+    "sponsored_bill": extract_sponsored_bill,
+    "standing": extract_standing,
+    "standing_transaction": extract_standing_transaction,
+    "video": extract_video,
+}
+
+extract_vote_record = compile_extractor(VOTE_FIELDS, record=Vote)
+
+TYPED_EXTRACTORS = dict(
+    EXTRACTORS,
+    calendar=compile_extractor(
+        CALENDAR_FIELDS,
+        ("bills", compile_extractor(CALENDAR_BILL_FIELDS, record=CalendarBill)),
+        Calendar,
+    ),
+    document=compile_extractor(DOCUMENT_FIELDS, record=Document),
+    floor_transaction=compile_extractor(
+        FLOOR_TRANSACTION_FIELDS, ("votes", extract_vote_record), FloorTransaction
+    ),
+    member=compile_extractor(MEMBER_FIELDS, record=Member),
+)
+
+LAZY_EXTRACTORS = dict(
+    EXTRACTORS,
+    agency=lazy_extractor(
+        dict(
+            getters(AGENCY_FIELDS),
+            positions=lazy.children(extract_agency_position),
+        )
+    ),
+    bill=lazy_extractor(
+        dict(
+            session_id=lazy.attribute("Session_ID"),
+            bill_number=lazy.attribute("Bill_Number"),
+            **getters(BILL_INFO_FIELDS, lazy.text),
+            sponsors=lazy.children(extract_sponsor, "SPONSORS"),
+            docs=lazy.children(extract_bill_document, "DOCS"),
+        )
+    ),
+    bill_position=lazy_extractor(getters(BILL_POSITION_FIELDS)),
+    bill_summary=lazy_extractor(getters(BILL_SUMMARY_FIELDS, lazy.text)),
+    calendar=lazy_extractor(
+        dict(getters(CALENDAR_FIELDS), bills=lazy.children(extract_calendar_bill))
+    ),
+    committee_action=lazy_extractor(getters(COMMITTEE_ACTION_FIELDS)),
+    committee_member=lazy_extractor(getters(COMMITTEE_MEMBER_FIELDS)),
+    document=lazy_extractor(getters(DOCUMENT_FIELDS)),
+    floor_transaction=lazy_extractor(
+        dict(getters(FLOOR_TRANSACTION_FIELDS), votes=lazy.children(extract_vote))
+    ),
+    member=lazy_extractor(getters(MEMBER_FIELDS)),
+    nominee_position=lazy_extractor(
+        dict(
+            getters(NOMINEE_FIELDS),
+            **{
+                key: lazy.nested("NOMPOSITION", getter)
+                for key, getter in getters(NOMINATION_FIELDS).items()
+            },
+        )
+    ),
+    nominee_position_holder=lazy_extractor(getters(NOMINEE_POSITION_HOLDER_FIELDS)),
+    sponsored_bill=lazy_extractor(getters(SPONSORED_BILL_FIELDS, lazy.text)),
+    standing=lazy_extractor(getters(STANDING_FIELDS)),
+    standing_transaction=lazy_extractor(
+        dict(getters(STANDING_TRANSACTION_FIELDS), votes=lazy.children(extract_vote))
+    ),
+    video=lazy_extractor(
+        dict(getters(VIDEO_FIELDS), chapters=lazy.children(extract_video_chapter))
+    ),
+)
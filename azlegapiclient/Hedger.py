@@ -0,0 +1,223 @@
+import asyncio
+import contextvars
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, NamedTuple, Optional
+
+# Send a duplicate request once the first has taken longer than `percentile`
+# of the operation's recent latencies (the last `window` successful calls),
+# and take whichever answers first. Nothing is hedged until min_samples
+# latencies have been seen. max_hedges bounds the duplicates per call.
+
+
+class HedgePolicy(NamedTuple):
+    percentile: float = 0.95
+    window: int = 100
+    min_samples: int = 20
+    min_delay: float = 0.05
+    max_hedges: int = 1
+
+
+# Threaded calls run on a pool of at least max_workers threads; the caller
+# waits for the first success and a losing request finishes in the
+# background. Each hedged call holds up to 1 + max_hedges pool threads, so
+# the client calls reserve() with its concurrency to grow the pool to match
+# and keep hedges from queueing behind other calls' requests. Async losers
+# are cancelled. A call only fails once every copy has failed, and then
+# raises the error of the original request.
+
+
+class Hedger:
+    def __init__(
+        self,
+        policy: HedgePolicy = None,
+        policies: Dict[str, HedgePolicy] = None,
+        max_workers: int = 32,
+    ):
+        self.default_policy = policy
+        self.policies = policies or {}
+        self.max_workers = max_workers
+        self.latencies = {}
+        self.calls = Counter()
+        self.hedged = Counter()
+        self.wins = Counter()
+        self.lock = threading.Lock()
+        self._executor = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self.lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="hedge"
+                )
+
+        return self._executor
+
+    # Threads that `callers` concurrent calls may hold. A pool that is too
+    # small is replaced; the old one finishes its requests and is collected.
+
+    def reserve(self, callers: int):
+
+        max_hedges = max(
+            policy.max_hedges
+            for policy in (self.default_policy, *self.policies.values())
+            if policy is not None
+        )
+        max_workers = callers * (1 + max_hedges)
+
+        with self.lock:
+            if max_workers > self.max_workers:
+                self.max_workers = max_workers
+                self._executor = None
+
+    def policy(self, operation: str) -> Optional[HedgePolicy]:
+        return self.policies.get(operation, self.default_policy)
+
+    def delay(self, operation: str) -> Optional[float]:
+
+        policy = self.policy(operation)
+
+        if policy is None:
+            return None
+
+        with self.lock:
+            latencies = sorted(self.latencies.get(operation, ()))
+
+        if len(latencies) < policy.min_samples:
+            return None
+
+        index = min(len(latencies) - 1, int(policy.percentile * len(latencies)))
+
+        return max(policy.min_delay, latencies[index])
+
+    def record(self, operation: str, latency: float):
+
+        with self.lock:
+            if operation not in self.latencies:
+                self.latencies[operation] = deque(maxlen=self.policy(operation).window)
+
+            self.latencies[operation].append(latency)
+
+    def _timed(self, operation: str, function: Callable, args: tuple):
+
+        started = time.monotonic()
+        result = function(*args)
+        self.record(operation, time.monotonic() - started)
+
+        return result
+
+    # Copies run with the caller's context variables (see Instrumentation).
+
+    def submit(self, operation: str, function: Callable, args: tuple):
+        return self.executor.submit(
+            contextvars.copy_context().run, self._timed, operation, function, args
+        )
+
+    async def _timed_async(self, operation: str, function: Callable, args: tuple):
+
+        started = time.monotonic()
+        result = await function(*args)
+        self.record(operation, time.monotonic() - started)
+
+        return result
+
+    def _count(self, operation: str, hedges: int, winner: int):
+        with self.lock:
+            self.calls[operation] += 1
+            self.hedged[operation] += hedges
+            self.wins[operation] += winner > 0
+
+    def call(self, operation: str, function: Callable, *args):
+
+        delay = self.delay(operation)
+
+        if delay is None:
+            if self.policy(operation) is None:
+                return function(*args)
+
+            self._count(operation, 0, 0)
+            return self._timed(operation, function, args)
+
+        max_hedges = self.policy(operation).max_hedges
+        futures = [self.submit(operation, function, args)]
+        pending = set(futures)
+
+        while True:
+            done, pending = wait(
+                pending,
+                timeout=delay if len(futures) <= max_hedges else None,
+                return_when=FIRST_COMPLETED,
+            )
+            succeeded = [future for future in done if future.exception() is None]
+
+            if succeeded:
+                self._count(operation, len(futures) - 1, futures.index(succeeded[0]))
+                return succeeded[0].result()
+
+            if not pending:
+                self._count(operation, len(futures) - 1, 0)
+                return futures[0].result()
+
+            if not done:
+                futures.append(self.submit(operation, function, args))
+                pending.add(futures[-1])
+
+    async def call_async(self, operation: str, function: Callable, *args):
+
+        delay = self.delay(operation)
+
+        if delay is None:
+            if self.policy(operation) is None:
+                return await function(*args)
+
+            self._count(operation, 0, 0)
+            return await self._timed_async(operation, function, args)
+
+        max_hedges = self.policy(operation).max_hedges
+        tasks = [asyncio.ensure_future(self._timed_async(operation, function, args))]
+        pending = set(tasks)
+
+        try:
+            while True:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=delay if len(tasks) <= max_hedges else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                succeeded = [task for task in done if task.exception() is None]
+
+                if succeeded:
+                    self._count(operation, len(tasks) - 1, tasks.index(succeeded[0]))
+                    return succeeded[0].result()
+
+                if not pending:
+                    self._count(operation, len(tasks) - 1, 0)
+                    return tasks[0].result()
+
+                if not done:
+                    tasks.append(
+                        asyncio.ensure_future(
+                            self._timed_async(operation, function, args)
+                        )
+                    )
+                    pending.add(tasks[-1])
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict:
+
+        operations = {}
+
+        for operation in list(self.calls):
+            operations[operation] = {
+                "calls": self.calls[operation],
+                "hedged": self.hedged[operation],
+                "hedge_wins": self.wins[operation],
+                "delay": self.delay(operation),
+            }
+
+        return {"operations": operations}
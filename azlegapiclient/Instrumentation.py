@@ -0,0 +1,382 @@
+import contextvars
+import threading
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Iterator
+
+import httpx
+import requests
+from lxml import etree
+
+# Histogram bucket upper bounds.
+
+SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+BYTES = tuple(1024 * 4**power for power in range(10))
+RECORDS = (0, 1, 10, 100, 1000, 10000, 100000, 1000000)
+
+PHASES = ("network", "parse", "map", "total")
+
+# The call being measured in the current thread or task. The transport hook
+# installed by instrument() adds network time and bytes to it.
+
+CURRENT = contextvars.ContextVar("azleg_call", default=None)
+LOCK = threading.Lock()
+
+
+# One client method call. network is time spent sending requests and reading
+# responses off the wire, parse is the rest of the service call (zeep or
+# FastPath turning bytes into elements), map is the parser building records,
+# and total is the whole call. Hedged and retried attempts are summed.
+# source is "service" when a request was sent and "cache" when the call was
+# answered from the response cache or by a concurrent identical call.
+
+
+class CallMetrics:
+
+    __slots__ = (
+        "operation",
+        "network",
+        "service",
+        "map",
+        "total",
+        "bytes",
+        "records",
+        "attempts",
+        "error",
+    )
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.network = 0.0
+        self.service = 0.0
+        self.map = 0.0
+        self.total = 0.0
+        self.bytes = 0
+        self.records = 0
+        self.attempts = 0
+        self.error = None
+
+    @property
+    def parse(self) -> float:
+        return max(0.0, self.service - self.network)
+
+    @property
+    def source(self) -> str:
+        return "service" if self.attempts else "cache"
+
+    def add(self, **values):
+        with LOCK:
+            for name, value in values.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict:
+        return {
+            "operation": self.operation,
+            "source": self.source,
+            "network": self.network,
+            "parse": self.parse,
+            "map": self.map,
+            "total": self.total,
+            "bytes": self.bytes,
+            "records": self.records,
+            "attempts": self.attempts,
+            "error": self.error,
+        }
+
+    def __repr__(self):
+        return "CallMetrics(%r)" % self.as_dict()
+
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    # (upper bound, cumulative count) pairs ending with +Inf.
+
+    def cumulative(self):
+
+        total = 0
+
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            yield bound, total
+
+
+# Service call wrappers used by the client for every attempt.
+
+
+def timed(function: Callable, *args):
+
+    call = CURRENT.get()
+
+    if call is None:
+        return function(*args)
+
+    started = perf_counter()
+
+    try:
+        return function(*args)
+    finally:
+        call.add(service=perf_counter() - started, attempts=1)
+
+
+async def timed_async(function: Callable, *args):
+
+    call = CURRENT.get()
+
+    if call is None:
+        return await function(*args)
+
+    started = perf_counter()
+
+    try:
+        return await function(*args)
+    finally:
+        call.add(service=perf_counter() - started, attempts=1)
+
+
+# Wraps the HTTP client of a zeep transport (a requests session, or the httpx
+# client of an AsyncTransport) so the time to send a request and read its
+# response, and the response size, are added to the current call. Streamed
+# responses are measured by Instrumentation.stream instead.
+
+
+def instrument(transport):
+
+    session = getattr(transport, "session", None)
+    client = getattr(transport, "client", None)
+
+    if isinstance(session, requests.Session):
+        target, send = session, session.send
+
+        def timed_send(request, **kwargs):
+
+            call = CURRENT.get()
+
+            if call is None:
+                return send(request, **kwargs)
+
+            started = perf_counter()
+            response = send(request, **kwargs)
+            size = 0 if kwargs.get("stream") else len(response.content)
+            call.add(network=perf_counter() - started, bytes=size)
+
+            return response
+
+    elif isinstance(client, httpx.AsyncClient):
+        target, send = client, client.send
+
+        async def timed_send(request, **kwargs):
+
+            call = CURRENT.get()
+
+            if call is None:
+                return await send(request, **kwargs)
+
+            started = perf_counter()
+            response = await send(request, **kwargs)
+            size = 0 if kwargs.get("stream") else len(response.content)
+            call.add(network=perf_counter() - started, bytes=size)
+
+            return response
+
+    else:
+        return
+
+    if not getattr(target, "_azleg_instrumented", False):
+        target.send = timed_send
+        target._azleg_instrumented = True
+
+
+# Collects CallMetrics for every client call into per-operation histograms
+# and passes each one to the registered hooks, e.g.
+#
+#   Instrumentation(hooks=[lambda call: log.info("%r", call)])
+#
+# Hooks run on the calling thread after the call completes and must not
+# raise.
+
+
+class Instrumentation:
+    def __init__(self, hooks: Iterator[Callable] = ()):
+        self.hooks = list(hooks)
+        self.seconds = {}
+        self.bytes = {}
+        self.records = {}
+        self.calls = Counter()
+        self.lock = threading.Lock()
+
+    def add_hook(self, hook: Callable[[CallMetrics], None]):
+        self.hooks.append(hook)
+
+    @contextmanager
+    def measure(self, operation: str):
+
+        call = CallMetrics(operation)
+        token = CURRENT.set(call)
+        started = perf_counter()
+
+        try:
+            yield call
+        except BaseException as error:
+            call.error = type(error).__name__
+            raise
+        finally:
+            call.total = perf_counter() - started
+            CURRENT.reset(token)
+            self.emit(call)
+
+    # Runs the parser inside a measure() block, recording mapping time and
+    # the number of records (children of the response document).
+
+    def map(self, call: CallMetrics, response, parser: Callable = None):
+
+        started = perf_counter()
+        result = parser(response) if parser is not None else response
+        call.map = perf_counter() - started
+
+        if etree.iselement(response):
+            call.records = len(response)
+
+        return result
+
+    # Measures a streamed call. post() sends the request and returns the
+    # requests response; iterate(raw, mapper) yields the records. Time the
+    # consumer spends between records is not counted.
+
+    def stream(
+        self, operation: str, post: Callable, iterate: Callable, mapper: Callable
+    ):
+
+        call = CallMetrics(operation)
+
+        def timed_mapper(element):
+            started = perf_counter()
+            record = mapper(element)
+            call.map += perf_counter() - started
+            call.records += 1
+
+            return record
+
+        started = perf_counter()
+
+        try:
+            response = post()
+            call.attempts = 1
+            call.network = call.total = perf_counter() - started
+
+            try:
+                records = iterate(response.raw, timed_mapper)
+
+                while True:
+                    started = perf_counter()
+
+                    try:
+                        record = next(records)
+                    except StopIteration:
+                        break
+                    finally:
+                        call.total += perf_counter() - started
+
+                    yield record
+            finally:
+                call.bytes = response.raw.tell()
+                response.close()
+        except GeneratorExit:
+            raise
+        except BaseException as error:
+            call.error = type(error).__name__
+            raise
+        finally:
+            call.service = call.total - call.map
+            self.emit(call)
+
+    # As stream(), for AsyncAzLegApiClient: post() is awaited and returns an
+    # httpx response, and iterate(response, mapper) is an async generator.
+
+    async def stream_async(
+        self, operation: str, post: Callable, iterate: Callable, mapper: Callable
+    ):
+
+        call = CallMetrics(operation)
+
+        def timed_mapper(element):
+            started = perf_counter()
+            record = mapper(element)
+            call.map += perf_counter() - started
+            call.records += 1
+
+            return record
+
+        started = perf_counter()
+
+        try:
+            response = await post()
+            call.attempts = 1
+            call.network = call.total = perf_counter() - started
+
+            try:
+                records = iterate(response, timed_mapper)
+
+                while True:
+                    started = perf_counter()
+
+                    try:
+                        record = await records.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        call.total += perf_counter() - started
+
+                    yield record
+            finally:
+                call.bytes = response.num_bytes_downloaded
+                await response.aclose()
+        except GeneratorExit:
+            raise
+        except BaseException as error:
+            call.error = type(error).__name__
+            raise
+        finally:
+            call.service = call.total - call.map
+            self.emit(call)
+
+    def emit(self, call: CallMetrics):
+
+        phases = PHASES if call.attempts else ("map", "total")
+
+        with self.lock:
+            for phase in phases:
+                self.histogram(self.seconds, (call.operation, phase), SECONDS).observe(
+                    getattr(call, phase)
+                )
+
+            if call.attempts:
+                self.histogram(self.bytes, call.operation, BYTES).observe(call.bytes)
+
+            self.histogram(self.records, call.operation, RECORDS).observe(call.records)
+            self.calls[
+                (call.operation, call.source, "error" if call.error else "ok")
+            ] += 1
+
+        for hook in self.hooks:
+            hook(call)
+
+    def histogram(self, histograms: Dict, key, buckets: tuple) -> Histogram:
+
+        histogram = histograms.get(key)
+
+        if histogram is None:
+            histogram = histograms[key] = Histogram(buckets)
+
+        return histogram
@@ -0,0 +1,77 @@
+from collections.abc import Mapping
+from typing import Callable, Dict, Tuple
+
+# Read-only mapping over an lxml element that decodes each field on first
+# access and keeps the result. getters maps every key to a function of the
+# element; it is shared by all records of a type. A record keeps its
+# element, and so the whole response document, alive.
+
+
+class LazyRecord(Mapping):
+
+    __slots__ = ("_element", "_getters", "_values")
+
+    def __init__(self, element, getters: Dict[str, Callable]):
+        self._element = element
+        self._getters = getters
+        self._values = {}
+
+    def __getitem__(self, key: str):
+
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        value = self._values[key] = self._getters[key](self._element)
+
+        return value
+
+    def __iter__(self):
+        return iter(self._getters)
+
+    def __len__(self):
+        return len(self._getters)
+
+    def __repr__(self):
+        return "LazyRecord(%r)" % dict(self)
+
+
+def attribute(source: str, decoder: Callable = None) -> Callable:
+
+    if decoder is None:
+        return lambda element: element.get(source)
+
+    return lambda element: decoder(element.get(source))
+
+
+def text(tag: str, decoder: Callable = None) -> Callable:
+
+    if decoder is None:
+        return lambda element: element.findtext(tag)
+
+    return lambda element: decoder(element.findtext(tag))
+
+
+# Child records are built eagerly, but only once the list is first read.
+# path selects a container element (e.g. "SPONSORS") holding the children.
+
+
+def children(extractor: Callable, path: str = None) -> Callable:
+
+    if path is None:
+        return lambda element: [extractor(child) for child in element]
+
+    return lambda element: [extractor(child) for child in element.find(path)]
+
+
+def nested(path: str, getter: Callable) -> Callable:
+    return lambda element: getter(element.find(path))
+
+
+def getters(fields: Tuple[Tuple, ...], kind: Callable = attribute) -> Dict:
+    return {key: kind(source, *decoder) for key, source, *decoder in fields}
+
+
+def lazy_extractor(getters: Dict[str, Callable]) -> Callable[..., LazyRecord]:
+    return lambda element: LazyRecord(element, getters)
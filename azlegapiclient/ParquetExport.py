@@ -0,0 +1,192 @@
+import itertools
+import os
+from typing import Dict, Iterable, Iterator, NamedTuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .AzLegApiClient import AzLegApiClient
+from .Records import as_mapping
+from .Timestamps import parse_timestamp
+
+# Repeated values (bill numbers, parties, vote codes, committee names, ...)
+# are dictionary encoded; dates are stored as timestamps.
+
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+TIMESTAMP = pa.timestamp("s")
+
+BILLS = pa.schema(
+    [
+        ("session_id", pa.int32()),
+        ("bill_number", pa.string()),
+        ("initial_title", pa.string()),
+        ("current_title", pa.string()),
+        ("last_updated", TIMESTAMP),
+    ]
+)
+
+DOCUMENTS = pa.schema(
+    [
+        ("session_id", pa.int32()),
+        ("item", pa.string()),
+        ("transaction_type", CATEGORY),
+        ("bill_number", CATEGORY),
+        ("document_type", CATEGORY),
+        ("document_format", CATEGORY),
+        ("description", pa.string()),
+        ("url", pa.string()),
+        ("transaction_date", TIMESTAMP),
+    ]
+)
+
+FLOOR_VOTES = pa.schema(
+    [
+        ("session_id", pa.int32()),
+        ("tran_id", pa.string()),
+        ("type", CATEGORY),
+        ("bill", CATEGORY),
+        ("cmte_id", CATEGORY),
+        ("cmte_name", CATEGORY),
+        ("cmte_short_name", CATEGORY),
+        ("referral", CATEGORY),
+        ("cow_referral", CATEGORY),
+        ("action", CATEGORY),
+        ("action_id", CATEGORY),
+        ("action_date", TIMESTAMP),
+        ("comments", pa.string()),
+        ("member_id", CATEGORY),
+        ("member_name", CATEGORY),
+        ("display_order", CATEGORY),
+        ("vote", CATEGORY),
+    ]
+)
+
+BILL_POSITIONS = pa.schema(
+    [
+        ("session_id", pa.int32()),
+        ("first_name", pa.string()),
+        ("last_name", pa.string()),
+        ("bill_number", CATEGORY),
+        ("representing", CATEGORY),
+        ("opinion", CATEGORY),
+        ("position_date", TIMESTAMP),
+    ]
+)
+
+
+class ExportResult(NamedTuple):
+    path: str
+    rows: int
+
+
+# Writes session datasets to directory/session_<id>/<dataset>.parquet. Rows
+# are pulled from the streaming iter_* methods where the service has one and
+# written as Arrow record batches of at most row_group_size rows, so memory
+# is bounded by one row group whatever the session size. Files are written
+# under a temporary name and renamed into place when complete.
+
+
+class ParquetExport:
+    def __init__(
+        self,
+        api: AzLegApiClient,
+        directory: str,
+        row_group_size: int = 65536,
+        compression: str = "zstd",
+    ):
+        self.api = api
+        self.directory = directory
+        self.row_group_size = row_group_size
+        self.compression = compression
+
+    def path(self, session_id: int, dataset: str) -> str:
+        return os.path.join(
+            self.directory, "session_%s" % session_id, "%s.parquet" % dataset
+        )
+
+    def batch(self, schema: pa.Schema, rows: list) -> pa.RecordBatch:
+
+        columns = []
+
+        for field in schema:
+            values = [row.get(field.name) for row in rows]
+
+            if field.type == TIMESTAMP:
+                values = [parse_timestamp(value) for value in values]
+
+            columns.append(pa.array(values, type=field.type))
+
+        return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+    def write(self, path: str, schema: pa.Schema, rows: Iterable[Dict]) -> ExportResult:
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        rows = iter(rows)
+        count = 0
+
+        try:
+            with pq.ParquetWriter(
+                path + ".tmp", schema, compression=self.compression
+            ) as writer:
+                while True:
+                    chunk = list(itertools.islice(rows, self.row_group_size))
+
+                    if not chunk:
+                        break
+
+                    writer.write_batch(
+                        self.batch(schema, chunk), row_group_size=self.row_group_size
+                    )
+                    count += len(chunk)
+
+            os.replace(path + ".tmp", path)
+        except BaseException:
+            if os.path.exists(path + ".tmp"):
+                os.unlink(path + ".tmp")
+            raise
+
+        return ExportResult(path, count)
+
+    def bills(self, session_id: int) -> Iterator[Dict]:
+        for bill in self.api.bills_by_session_id(session_id)["bills"]:
+            yield dict(bill, session_id=session_id)
+
+    def documents(self, session_id: int) -> Iterator[Dict]:
+        for document in self.api.iter_documents_by_session_id(session_id):
+            yield dict(as_mapping(document), session_id=session_id)
+
+    # One row per member vote. Transactions without votes (voice votes,
+    # committee actions) get a single row with empty member and vote columns.
+
+    def floor_votes(self, session_id: int) -> Iterator[Dict]:
+        for tran in self.api.iter_floor_votes_by_session_id(session_id):
+            tran = dict(as_mapping(tran), session_id=session_id)
+            votes = tran.pop("votes")
+
+            if not votes:
+                yield tran
+
+            for vote in votes:
+                yield dict(tran, **as_mapping(vote))
+
+    def bill_positions(self, session_id: int) -> Iterator[Dict]:
+        for position in self.api.iter_bill_positions_by_session(session_id):
+            yield dict(as_mapping(position), session_id=session_id)
+
+    DATASETS = {
+        "bills": BILLS,
+        "documents": DOCUMENTS,
+        "floor_votes": FLOOR_VOTES,
+        "bill_positions": BILL_POSITIONS,
+    }
+
+    def export(self, session_id: int, dataset: str) -> ExportResult:
+        return self.write(
+            self.path(session_id, dataset),
+            self.DATASETS[dataset],
+            getattr(self, dataset)(session_id),
+        )
+
+    def export_session(self, session_id: int) -> Dict[str, ExportResult]:
+        return {dataset: self.export(session_id, dataset) for dataset in self.DATASETS}
@@ -0,0 +1,98 @@
+from typing import Iterator, NamedTuple, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from zeep.cache import SqliteCache
+from zeep.exceptions import TransportError
+from zeep.transports import Transport
+
+
+class RetryPolicy(NamedTuple):
+    attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+
+    # Yields the delay before each retry, then None once attempts run out.
+
+    def delays(self) -> Iterator[Optional[float]]:
+        for attempt in range(self.attempts - 1):
+            yield min(self.max_backoff, self.backoff_factor * 2**attempt)
+
+        yield None
+
+
+NO_RETRY = RetryPolicy(attempts=1)
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, TransportError):
+        return error.status_code >= 500
+
+    return isinstance(
+        error,
+        (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            httpx.TransportError,
+        ),
+    )
+
+
+# zeep transport backed by a requests session with a sized keep-alive pool and
+# explicit (connect, read) timeouts. Connection failures are retried by
+# urllib3 connect_retries times (3 by default). When connect_retries is left
+# unset and the transport is given to an AzLegApiClient whose RetryPolicy
+# retries whole SOAP operations, the client turns urllib3 retries off so the
+# two don't multiply. Fetched WSDL and schema documents are kept in a
+# persistent sqlite cache at cache_path (zeep's user cache directory by
+# default) for cache_ttl seconds.
+
+
+class PooledTransport(Transport):
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: float = 10,
+        read_timeout: float = 60,
+        connect_retries: int = None,
+        cache_path: str = None,
+        cache_ttl: int = 86400,
+        cache=None,
+    ):
+        session = requests.Session()
+
+        self.connect_retries = connect_retries
+        self.pool_maxsize = pool_maxsize
+        self.http_adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.retry_connections(3 if connect_retries is None else connect_retries)
+
+        session.mount("https://", self.http_adapter)
+        session.mount("http://", self.http_adapter)
+
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+
+        super().__init__(
+            cache=(
+                cache
+                if cache is not None
+                else SqliteCache(path=cache_path, timeout=cache_ttl)
+            ),
+            timeout=(connect_timeout, read_timeout),
+            operation_timeout=(connect_timeout, read_timeout),
+            session=session,
+        )
+
+    def retry_connections(self, retries: int):
+        self.http_adapter.max_retries = Retry(
+            total=None, connect=retries, read=0, backoff_factor=0.2
+        )
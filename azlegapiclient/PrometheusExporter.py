@@ -0,0 +1,132 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+from .Instrumentation import Instrumentation
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def labels(**values) -> str:
+    return ",".join(
+        '%s="%s"' % (name, escape(str(value))) for name, value in values.items()
+    )
+
+
+def number(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+# Renders an Instrumentation in the Prometheus text exposition format:
+#
+#   <prefix>_call_seconds{operation,phase}       histogram
+#   <prefix>_response_bytes{operation}           histogram
+#   <prefix>_response_records{operation}         histogram
+#   <prefix>_calls_total{operation,source,outcome} counter
+#
+# serve() exposes it over HTTP on a daemon thread for scraping.
+
+
+class PrometheusExporter:
+    def __init__(self, instrumentation: Instrumentation, prefix: str = "azleg"):
+        self.instrumentation = instrumentation
+        self.prefix = prefix
+
+    def histogram(
+        self,
+        lines: List[str],
+        name: str,
+        description: str,
+        histograms: dict,
+        label_names,
+    ):
+
+        lines.append("# HELP %s %s" % (name, description))
+        lines.append("# TYPE %s histogram" % name)
+
+        for key, histogram in sorted(histograms.items()):
+            key = key if isinstance(key, tuple) else (key,)
+            values = dict(zip(label_names, key))
+
+            for bound, count in histogram.cumulative():
+                lines.append(
+                    "%s_bucket{%s} %d"
+                    % (name, labels(**values, le=number(bound)), count)
+                )
+
+            lines.append(
+                "%s_sum{%s} %s" % (name, labels(**values), number(histogram.sum))
+            )
+            lines.append("%s_count{%s} %d" % (name, labels(**values), histogram.count))
+
+    def render(self) -> str:
+
+        instrumentation = self.instrumentation
+        lines = []
+
+        with instrumentation.lock:
+            self.histogram(
+                lines,
+                self.prefix + "_call_seconds",
+                "Client call time by phase.",
+                instrumentation.seconds,
+                ("operation", "phase"),
+            )
+            self.histogram(
+                lines,
+                self.prefix + "_response_bytes",
+                "Response body size.",
+                instrumentation.bytes,
+                ("operation",),
+            )
+            self.histogram(
+                lines,
+                self.prefix + "_response_records",
+                "Records in the response document.",
+                instrumentation.records,
+                ("operation",),
+            )
+
+            name = self.prefix + "_calls_total"
+            lines.append("# HELP %s Client calls by source and outcome." % name)
+            lines.append("# TYPE %s counter" % name)
+
+            for (operation, source, outcome), count in sorted(
+                instrumentation.calls.items()
+            ):
+                lines.append(
+                    "%s{%s} %d"
+                    % (
+                        name,
+                        labels(operation=operation, source=source, outcome=outcome),
+                        count,
+                    )
+                )
+
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, host: str = "") -> ThreadingHTTPServer:
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = exporter.render().encode("utf-8")
+
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        return server
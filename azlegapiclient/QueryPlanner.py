@@ -0,0 +1,183 @@
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict
+
+from .SessionIndex import Index
+
+NETWORK = "network"
+DERIVED = "derived"
+
+# Narrow operation -> (session-wide operation whose response contains its
+# answer, attribute matched against the second argument, attribute matched
+# against the third argument or None). The first argument of both is the
+# session ID.
+
+DERIVATIONS = {
+    "FloorVotesByBill": ("FloorVotesBySessionID", "Bill", None),
+    "FloorVotesByCommID": ("FloorVotesBySessionID", "CmteID", None),
+    "DocumentsByBillNum": ("DocumentsBySessionID", "Bill_Number", None),
+    "DocumentsByBillNumDocType": (
+        "DocumentsBySessionID",
+        "Bill_Number",
+        "Document_Type",
+    ),
+}
+
+SESSION_WIDE = {derivation[0] for derivation in DERIVATIONS.values()}
+
+
+# Stands in for a response document holding some of another document's
+# records, for the response parsers: get() reads the root's attributes and
+# iterating yields the records.
+
+
+class Subset:
+
+    __slots__ = ("root", "children")
+
+    def __init__(self, root, children: list):
+        self.root = root
+        self.children = children
+
+    def get(self, key: str, default=None):
+        return self.root.get(key, default)
+
+    def __iter__(self):
+        return iter(self.children)
+
+    def __len__(self):
+        return len(self.children)
+
+
+class Entry:
+    def __init__(self, response, fetched: float):
+        self.response = response
+        self.fetched = fetched
+        self.children = list(response)
+        self.indexes = {}
+
+
+# Answers narrow per-bill and per-committee calls (see DERIVATIONS) by
+# filtering a session-wide response this client fetched from the service no
+# more than max_age seconds ago, instead of sending a request. Each
+# session-wide response is indexed on first use, so later answers cost a
+# dict lookup plus mapping the matching records. Answers to the narrow
+# operations carry "source": "derived", or "network" when they went through
+# the usual call path (including the response cache, if any).
+#
+#   api = AzLegApiClient(username, password, planner=QueryPlanner(max_age=300))
+#   api.floor_votes_by_session_id(121)
+#   api.floor_votes_by_bill(121, "HB2001")["source"]  # "derived"
+
+
+class QueryPlanner:
+    def __init__(self, max_age: float = 300, clock: Callable = time.monotonic):
+        self.max_age = max_age
+        self.clock = clock
+        self.entries = {}
+        self.derived = Counter()
+        self.network = Counter()
+        self.lock = threading.Lock()
+
+    # Called with every response fetched from the service.
+
+    def observe(self, operation: str, args: tuple, response):
+
+        if operation in SESSION_WIDE and response is not None:
+            with self.lock:
+                self.entries[(operation, str(args[0]))] = Entry(response, self.clock())
+
+    def entry(self, operation: str, session_id) -> Entry:
+
+        key = (operation, str(session_id))
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is not None and self.clock() - entry.fetched > self.max_age:
+                del self.entries[key]
+                entry = None
+
+        return entry
+
+    # Returns a Subset answering the call, or None if it must be sent.
+
+    def derive(self, operation: str, args: tuple) -> Subset:
+
+        derivation = DERIVATIONS.get(operation)
+
+        if derivation is None:
+            return None
+
+        source, attribute, qualifier = derivation
+        entry = self.entry(source, args[0])
+
+        if entry is None:
+            return None
+
+        children = entry.children
+        records = [
+            children[row] for row in self.index(entry, attribute).get(str(args[1]))
+        ]
+
+        if qualifier is not None:
+            records = [
+                record for record in records if record.get(qualifier) == str(args[2])
+            ]
+
+        return Subset(entry.response, records)
+
+    def index(self, entry: Entry, attribute: str) -> Index:
+
+        index = entry.indexes.get(attribute)
+
+        if index is None:
+            with self.lock:
+                index = entry.indexes.get(attribute)
+
+                if index is None:
+                    index = Index()
+
+                    for row, child in enumerate(entry.children):
+                        index.add(child.get(attribute), row)
+
+                    entry.indexes[attribute] = index
+
+        return index
+
+    # Wraps a narrow operation's parser to record where its answer came from.
+
+    def parse(self, operation: str, parser: Callable, response):
+
+        result = parser(response) if parser is not None else response
+
+        if operation in DERIVATIONS:
+            source = DERIVED if isinstance(response, Subset) else NETWORK
+
+            with self.lock:
+                (self.derived if source == DERIVED else self.network)[operation] += 1
+
+            result["source"] = source
+
+        return result
+
+    def invalidate(self, session_id=None):
+        with self.lock:
+            for key in list(self.entries):
+                if session_id is None or key[1] == str(session_id):
+                    del self.entries[key]
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {
+                "derived": sum(self.derived.values()),
+                "network": sum(self.network.values()),
+                "operations": {
+                    operation: {
+                        "derived": self.derived[operation],
+                        "network": self.network[operation],
+                    }
+                    for operation in set(self.derived) | set(self.network)
+                },
+            }
@@ -0,0 +1,88 @@
+import datetime
+from typing import Dict, List, NamedTuple
+
+# Compact record types returned instead of dicts when the client is created
+# with typed=True. Field names are the dict keys of the default mode, so
+# record._asdict() gives the same mapping.
+
+
+class Vote(NamedTuple):
+    member_id: str
+    member_name: str
+    display_order: str
+    vote: str
+
+
+class FloorTransaction(NamedTuple):
+    tran_id: str
+    type: str
+    bill: str
+    cmte_id: str
+    cmte_name: str
+    cmte_short_name: str
+    referral: str
+    cow_referral: str
+    action: str
+    action_id: str
+    action_date: datetime.datetime
+    comments: str
+    votes: List[Vote]
+
+
+class Document(NamedTuple):
+    item: str
+    transaction_type: str
+    bill_number: str
+    document_type: str
+    document_format: str
+    description: str
+    url: str
+    transaction_date: datetime.datetime
+
+
+class CalendarBill(NamedTuple):
+    bill_number: str
+    display_order: str
+    reconsidered: str
+
+
+class Calendar(NamedTuple):
+    calendar_id: str
+    body: str
+    type: str
+    calendar_date: datetime.datetime
+    number: str
+    committee_name: str
+    committee_id: str
+    calendar_name: str
+    calendar_time: str
+    protest_date: datetime.datetime
+    url: str
+    bills: List[CalendarBill]
+
+
+class Member(NamedTuple):
+    legislature: str
+    member_id: str
+    full_name: str
+    report_name: str
+    body: str
+    district: str
+    party: str
+    status: str
+    postition: str
+    email: str
+    phone: str
+    fax: str
+    maj_leader: str
+    min_leader: str
+    maj_whip: str
+    min_whip: str
+    room: str
+
+
+# Consumers that accept either form read records through this.
+
+
+def as_mapping(record) -> Dict:
+    return record._asdict() if hasattr(record, "_asdict") else record
@@ -0,0 +1,214 @@
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Tuple
+
+from lxml import etree
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Seconds to keep a response per SOAP operation. Reference data rarely changes;
+# votes and documents move during session days. Operations not listed use
+# ResponseCache.default_ttl, and a TTL of 0 disables caching.
+
+DEFAULT_TTLS = {
+    "Sessions": DAY,
+    "SessionsbyID": DAY,
+    "CommitteeActions": 7 * DAY,
+    "CommitteeActionsQualified": 7 * DAY,
+    "CommitteeByLegislature": DAY,
+    "CommitteeByLegBody": DAY,
+    "CommitteeByLegID": DAY,
+    "CommitteeByLegType": DAY,
+    "ExecNomAgenciesandPositions": 7 * DAY,
+    "MembersBySessionID": HOUR,
+    "MemberByID": HOUR,
+    "FloorVotesByBill": 5 * MINUTE,
+    "FloorVotesByBillFromDate": 5 * MINUTE,
+    "FloorVotesByCommID": 5 * MINUTE,
+    "FloorVotesBySessionID": 5 * MINUTE,
+    "FloorVotesFromDate": 5 * MINUTE,
+    "FloorVotesFromDateToDate": 5 * MINUTE,
+    "DocumentsByBillNum": 5 * MINUTE,
+    "DocumentsByBillNumDocType": 5 * MINUTE,
+    "DocumentsByDocType": 5 * MINUTE,
+    "DocumentsBySessionID": 5 * MINUTE,
+    "DocumentsByBillNumFromDate": 5 * MINUTE,
+    "DocumentsFromDateToDate": 5 * MINUTE,
+    "BillsUpdated": 0,
+}
+
+
+# Backends store (expires, value) entries under a string key and evict the
+# least recently used entry once maxsize is reached.
+
+
+class MemoryBackend:
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[float, object]:
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is not None:
+                self.entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key: str, expires: float, value):
+        with self.lock:
+            self.entries[key] = (expires, value)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# Responses are lxml elements; the disk backend stores them serialized.
+
+
+class DiskBackend:
+    def __init__(
+        self,
+        path: str,
+        maxsize: int = 10000,
+        dumps: Callable = etree.tostring,
+        loads: Callable = etree.fromstring,
+    ):
+        self.maxsize = maxsize
+        self.dumps = dumps
+        self.loads = loads
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, expires REAL, accessed REAL, value BLOB)"
+            )
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+
+    def get(self, key: str) -> Tuple[float, object]:
+        with self.lock, self.db:
+            row = self.db.execute(
+                "SELECT expires, value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self.db.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+
+        return row[0], self.loads(row[1])
+
+    def set(self, key: str, expires: float, value):
+        value = self.dumps(value)
+
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, expires, time.time(), value),
+            )
+            self.db.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def delete(self, key: str):
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM responses")
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    def __init__(
+        self, backend=None, ttls: Dict[str, float] = None, default_ttl: float = MINUTE
+    ):
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.hits = Counter()
+        self.misses = Counter()
+        self.lock = threading.Lock()
+
+    # Arguments are keyed as the strings sent to the service, so 121 and "121"
+    # share an entry and recorded responses (see Cassette) can be cached.
+
+    @staticmethod
+    def key(operation: str, args: tuple) -> str:
+        return "%s%r" % (operation, tuple(str(arg) for arg in args))
+
+    def ttl(self, operation: str) -> float:
+        return self.ttls.get(operation, self.default_ttl)
+
+    def get(self, operation: str, args: tuple):
+        entry = self.backend.get(self.key(operation, args))
+        hit = entry is not None and entry[0] > time.time()
+
+        with self.lock:
+            (self.hits if hit else self.misses)[operation] += 1
+
+        return entry[1] if hit else None
+
+    # Expired entries stay in the backend until evicted; stale() returns one
+    # regardless of age, for use when the service is unavailable.
+
+    def stale(self, operation: str, args: tuple):
+        entry = self.backend.get(self.key(operation, args))
+
+        return entry[1] if entry is not None else None
+
+    def set(self, operation: str, args: tuple, value):
+        ttl = self.ttl(operation)
+
+        if ttl > 0:
+            self.backend.set(self.key(operation, args), time.time() + ttl, value)
+
+    def invalidate(self, operation: str, args: tuple):
+        self.backend.delete(self.key(operation, args))
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {
+                "hits": sum(self.hits.values()),
+                "misses": sum(self.misses.values()),
+                "operations": {
+                    operation: {
+                        "hits": self.hits[operation],
+                        "misses": self.misses[operation],
+                    }
+                    for operation in set(self.hits) | set(self.misses)
+                },
+            }
@@ -0,0 +1,214 @@
+import datetime
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Tuple
+
+from .SessionSnapshot import field
+
+# Hash index from a key to the row numbers of the records that have it. Rows
+# are kept in an unsigned int array (4 bytes each) rather than a list of
+# references, and in insertion order.
+
+
+class Index:
+    def __init__(self):
+        self.rows = {}
+
+    def add(self, key, row: int):
+
+        rows = self.rows.get(key)
+
+        if rows is None:
+            rows = self.rows[key] = array("I")
+
+        rows.append(row)
+
+    def get(self, key) -> array:
+        return self.rows.get(key, ())
+
+    def __len__(self):
+        return len(self.rows)
+
+
+# Index on the calendar day of a timestamp. Keys are also kept sorted, so a
+# range of days costs a bisect plus the matching buckets.
+
+
+class DayIndex(Index):
+    def __init__(self):
+        super().__init__()
+        self.days = []
+
+    def add(self, timestamp: datetime.datetime, row: int):
+
+        if timestamp is None:
+            return
+
+        day = timestamp.date()
+
+        if day not in self.rows:
+            self.days.insert(bisect_left(self.days, day), day)
+
+        super().add(day, row)
+
+    def between(self, start: datetime.date, end: datetime.date) -> List[int]:
+        return [
+            row
+            for day in self.days[
+                bisect_left(self.days, start) : bisect_right(self.days, end)
+            ]
+            for row in self.rows[day]
+        ]
+
+
+# Session documents and floor votes with indexes on bill number, member ID,
+# committee ID and action day, so everything for one bill, member or
+# committee is a dict lookup however large the session is. Records are
+# stored once as the client returned them (dicts, typed or lazy records;
+# typed=True is the most compact), and can be added incrementally, e.g. from
+# iter_floor_votes_by_session_id or a later floor_votes_from_date. A roll
+# call whose tran_id is already indexed, or a document whose bill, item and
+# URL are, is skipped. IDs are looked up as strings, so 1711 and "1711" both
+# work.
+#
+#   index = SessionIndex()
+#   index.add_roll_calls(api.floor_votes_by_session_id(121)["tran"])
+#   index.add_documents(api.documents_by_session_id(121)["documents"])
+#   index.roll_calls_for_bill("HB2001")
+#   index.votes_for_member(1711)
+
+
+class SessionIndex:
+    def __init__(self):
+        self.documents = []
+        self.roll_calls = []
+        self.vote_roll_calls = array("I")
+        self.vote_positions = array("H")
+        self.document_keys = {}
+        self.roll_call_keys = {}
+        self.documents_by_bill = Index()
+        self.documents_by_day = DayIndex()
+        self.roll_calls_by_bill = Index()
+        self.roll_calls_by_committee = Index()
+        self.roll_calls_by_day = DayIndex()
+        self.votes_by_member = Index()
+        self.lock = threading.Lock()
+
+    # Insertion. Each returns True if the record was added.
+
+    def add_document(self, document) -> bool:
+
+        key = (
+            field(document, "bill_number"),
+            field(document, "item"),
+            field(document, "url"),
+        )
+
+        with self.lock:
+            if key in self.document_keys:
+                return False
+
+            row = self.document_keys[key] = len(self.documents)
+            self.documents.append(document)
+            self.documents_by_bill.add(key[0], row)
+            self.documents_by_day.add(field(document, "transaction_date"), row)
+
+        return True
+
+    def add_roll_call(self, transaction) -> bool:
+
+        key = field(transaction, "tran_id")
+
+        with self.lock:
+            if key in self.roll_call_keys:
+                return False
+
+            row = self.roll_call_keys[key] = len(self.roll_calls)
+            self.roll_calls.append(transaction)
+            self.roll_calls_by_bill.add(field(transaction, "bill"), row)
+            self.roll_calls_by_committee.add(field(transaction, "cmte_id"), row)
+            self.roll_calls_by_day.add(field(transaction, "action_date"), row)
+
+            for position, vote in enumerate(field(transaction, "votes")):
+                self.votes_by_member.add(
+                    field(vote, "member_id"), len(self.vote_roll_calls)
+                )
+                self.vote_roll_calls.append(row)
+                self.vote_positions.append(position)
+
+        return True
+
+    def add_documents(self, documents: Iterable) -> int:
+        return sum(map(self.add_document, documents))
+
+    def add_roll_calls(self, transactions: Iterable) -> int:
+        return sum(map(self.add_roll_call, transactions))
+
+    # Queries. Results are in insertion order.
+
+    def documents_for_bill(self, bill_number: str, document_type: str = None) -> List:
+
+        documents = [
+            self.documents[row] for row in self.documents_by_bill.get(bill_number)
+        ]
+
+        if document_type is not None:
+            documents = [
+                document
+                for document in documents
+                if field(document, "document_type") == document_type
+            ]
+
+        return documents
+
+    def documents_between(self, start: datetime.date, end: datetime.date) -> List:
+        return [
+            self.documents[row] for row in self.documents_by_day.between(start, end)
+        ]
+
+    def roll_calls_for_bill(self, bill_number: str) -> List:
+        return [
+            self.roll_calls[row] for row in self.roll_calls_by_bill.get(bill_number)
+        ]
+
+    def roll_calls_for_committee(self, committee_id) -> List:
+        return [
+            self.roll_calls[row]
+            for row in self.roll_calls_by_committee.get(str(committee_id))
+        ]
+
+    def roll_calls_between(self, start: datetime.date, end: datetime.date) -> List:
+        return [
+            self.roll_calls[row] for row in self.roll_calls_by_day.between(start, end)
+        ]
+
+    # (roll call, vote) pairs for every vote the member cast. A vote is stored
+    # as its roll call's row and its position in that roll call's votes.
+
+    def votes_for_member(self, member_id) -> List[Tuple]:
+
+        roll_calls = self.roll_calls
+        positions = self.vote_positions
+        result = []
+
+        for row in self.votes_by_member.get(str(member_id)):
+            roll_call = roll_calls[self.vote_roll_calls[row]]
+            result.append((roll_call, field(roll_call, "votes")[positions[row]]))
+
+        return result
+
+    def stats(self) -> Dict:
+        return {
+            "documents": len(self.documents),
+            "roll_calls": len(self.roll_calls),
+            "votes": len(self.vote_roll_calls),
+            "bills": len(
+                set(self.documents_by_bill.rows) | set(self.roll_calls_by_bill.rows)
+            ),
+            "members": len(self.votes_by_member),
+            "committees": len(self.roll_calls_by_committee),
+            "days": len(
+                set(self.documents_by_day.days) | set(self.roll_calls_by_day.days)
+            ),
+        }
@@ -0,0 +1,249 @@
+from typing import Dict, List
+
+# Client methods fetched for a snapshot, each called with the session ID.
+# committees_by_leg takes the legislature instead and is fetched separately.
+
+SNAPSHOT_CALLS = (
+    "bills_by_session_id",
+    "members_by_session_id",
+    "floor_votes_by_session_id",
+    "documents_by_session_id",
+    "calendars_by_session_id",
+    "bill_positions_by_session",
+)
+
+
+# Reads a field from a dict, LazyRecord or typed record.
+
+
+def field(record, key: str):
+    return getattr(record, key) if isinstance(record, tuple) else record[key]
+
+
+# Nodes wrap a record from the client and add references to related nodes.
+# Record fields read as attributes (node.bill_number); a reference is None
+# when the entity it points to is not in the snapshot.
+
+
+class Node:
+
+    __slots__ = ("record",)
+
+    def __init__(self, record):
+        self.record = record
+
+    def __getattr__(self, name: str):
+
+        if name == "record":
+            raise AttributeError(name)
+
+        try:
+            return field(self.record, name)
+        except (KeyError, AttributeError):
+            raise AttributeError(name) from None
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self.record)
+
+
+class BillNode(Node):
+
+    __slots__ = ("documents", "roll_calls", "calendar_entries", "positions")
+
+    def __init__(self, record):
+        super().__init__(record)
+        self.documents = []
+        self.roll_calls = []
+        self.calendar_entries = []
+        self.positions = []
+
+
+class MemberNode(Node):
+
+    __slots__ = ("votes",)
+
+    def __init__(self, record):
+        super().__init__(record)
+        self.votes = []
+
+
+class CommitteeNode(Node):
+
+    __slots__ = ("roll_calls", "calendars")
+
+    def __init__(self, record):
+        super().__init__(record)
+        self.roll_calls = []
+        self.calendars = []
+
+
+class RollCallNode(Node):
+
+    __slots__ = ("bill", "committee", "votes")
+
+    def __init__(self, record, bill: BillNode, committee: CommitteeNode):
+        super().__init__(record)
+        self.bill = bill
+        self.committee = committee
+        self.votes = []
+
+
+class VoteNode(Node):
+
+    __slots__ = ("roll_call", "member")
+
+    def __init__(self, record, roll_call: RollCallNode, member: MemberNode):
+        super().__init__(record)
+        self.roll_call = roll_call
+        self.member = member
+
+
+class DocumentNode(Node):
+
+    __slots__ = ("bill",)
+
+    def __init__(self, record, bill: BillNode):
+        super().__init__(record)
+        self.bill = bill
+
+
+class PositionNode(Node):
+
+    __slots__ = ("bill",)
+
+    def __init__(self, record, bill: BillNode):
+        super().__init__(record)
+        self.bill = bill
+
+
+class CalendarNode(Node):
+
+    __slots__ = ("committee", "entries")
+
+    def __init__(self, record, committee: CommitteeNode):
+        super().__init__(record)
+        self.committee = committee
+        self.entries = []
+
+
+class CalendarEntryNode(Node):
+
+    __slots__ = ("calendar", "bill")
+
+    def __init__(self, record, calendar: CalendarNode, bill: BillNode):
+        super().__init__(record)
+        self.calendar = calendar
+        self.bill = bill
+
+
+# Everything fetched for one session, linked into a graph: bills, members
+# and committees are keyed by their IDs, and roll calls, votes, documents,
+# calendars and positions point at them (and they back at those).
+#
+#   snapshot = api.snapshot_session(121)
+#   for roll_call in snapshot.bills["HB2001"].roll_calls:
+#       ayes = [vote.member.full_name for vote in roll_call.votes if vote.vote == "Y"]
+
+
+class SessionSnapshot:
+    def __init__(self, session_id: int, session, results: Dict):
+
+        self.session_id = session_id
+        self.session = session
+        self.bills = {
+            bill["bill_number"]: BillNode(bill)
+            for bill in results["bills_by_session_id"]["bills"]
+        }
+        self.members = {
+            field(member, "member_id"): MemberNode(member)
+            for member in results["members_by_session_id"]["members"]
+        }
+        self.committees = {
+            committee["committee_id"]: CommitteeNode(committee)
+            for committee in results["committees_by_leg"]["committees"]
+        }
+        self.roll_calls = [
+            self.roll_call(transaction)
+            for transaction in results["floor_votes_by_session_id"]["tran"]
+        ]
+        self.documents = [
+            self.attach(DocumentNode, document, "documents")
+            for document in results["documents_by_session_id"]["documents"]
+        ]
+        self.positions = [
+            self.attach(PositionNode, position, "positions")
+            for position in results["bill_positions_by_session"]["positions"]
+        ]
+        self.calendars = [
+            self.calendar(calendar)
+            for calendar in results["calendars_by_session_id"]["calendars"]
+        ]
+
+    def roll_call(self, transaction) -> RollCallNode:
+
+        bill = self.bills.get(field(transaction, "bill"))
+        committee = self.committees.get(field(transaction, "cmte_id"))
+        roll_call = RollCallNode(transaction, bill, committee)
+
+        if bill is not None:
+            bill.roll_calls.append(roll_call)
+
+        if committee is not None:
+            committee.roll_calls.append(roll_call)
+
+        for record in field(transaction, "votes"):
+            member = self.members.get(field(record, "member_id"))
+            vote = VoteNode(record, roll_call, member)
+            roll_call.votes.append(vote)
+
+            if member is not None:
+                member.votes.append(vote)
+
+        return roll_call
+
+    def attach(self, node: type, record, collection: str) -> Node:
+
+        bill = self.bills.get(field(record, "bill_number"))
+        attached = node(record, bill)
+
+        if bill is not None:
+            getattr(bill, collection).append(attached)
+
+        return attached
+
+    def calendar(self, record) -> CalendarNode:
+
+        committee = self.committees.get(field(record, "committee_id"))
+        calendar = CalendarNode(record, committee)
+
+        if committee is not None:
+            committee.calendars.append(calendar)
+
+        for entry in field(record, "bills"):
+            bill = self.bills.get(field(entry, "bill_number"))
+            node = CalendarEntryNode(entry, calendar, bill)
+            calendar.entries.append(node)
+
+            if bill is not None:
+                bill.calendar_entries.append(node)
+
+        return calendar
+
+    def votes(self) -> List[VoteNode]:
+        return [vote for roll_call in self.roll_calls for vote in roll_call.votes]
+
+    def __repr__(self):
+        return (
+            "SessionSnapshot(session_id=%r, bills=%d, members=%d, committees=%d, "
+            "roll_calls=%d, documents=%d, calendars=%d, positions=%d)"
+            % (
+                self.session_id,
+                len(self.bills),
+                len(self.members),
+                len(self.committees),
+                len(self.roll_calls),
+                len(self.documents),
+                len(self.calendars),
+                len(self.positions),
+            )
+        )
@@ -0,0 +1,161 @@
+import datetime
+import json
+import os
+import tempfile
+from collections.abc import Mapping
+from typing import Dict, List, NamedTuple
+
+from .AzLegApiClient import AzLegApiClient
+from .Records import as_mapping
+
+# Per-bill operations a sync fetches, each called with (session_id, bill_number).
+
+BILL_OPERATIONS = ("BillInfo", "DocumentsByBillNum", "FloorVotesByBill")
+
+
+class SyncResult(NamedTuple):
+    session_id: int
+    watermark: str
+    updated: List[str]
+    errors: Dict[str, Exception]
+
+
+def _json_default(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+
+    raise TypeError("%r is not JSON serializable" % value)
+
+
+# Copies typed and lazy records, and the lists holding them, into plain dicts
+# and lists so they are stored with their keys.
+
+
+def _plain(value):
+
+    value = as_mapping(value)
+
+    if isinstance(value, Mapping):
+        return {key: _plain(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+
+    return value
+
+
+# Keeps a local copy of every bill in a session in directory/session_<id>.json.
+#
+# The first sync fetches every bill from BillsBySessionID. Later syncs ask
+# BillsUpdated for bills changed since the stored high-water mark (the newest
+# Last_Updated seen) and refetch bill_info, documents and floor votes only for
+# those. Bills that fail to fetch are kept in "pending" and retried on the
+# next sync. State files are replaced atomically, so a crash mid-sync leaves
+# the previous state intact. Responses the client's ResponseCache or
+# QueryPlanner hold for the calls a sync makes are dropped first, so an
+# out-of-date copy is never stored behind an advanced watermark.
+
+
+class SessionSync:
+    def __init__(self, api: AzLegApiClient, directory: str, max_workers: int = 8):
+        self.api = api
+        self.directory = directory
+        self.max_workers = max_workers
+
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, session_id: int) -> str:
+        return os.path.join(self.directory, "session_%s.json" % session_id)
+
+    def load(self, session_id: int) -> Dict:
+
+        try:
+            with open(self.path(session_id)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {
+                "session_id": session_id,
+                "watermark": None,
+                "pending": [],
+                "bills": {},
+            }
+
+    def save(self, session_id: int, state: Dict):
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f, default=_json_default)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(tmp_path, self.path(session_id))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def bills(self, session_id: int) -> Dict:
+        return self.load(session_id)["bills"]
+
+    def invalidate(self, operation: str, *args):
+        if self.api.cache is not None:
+            self.api.cache.invalidate(operation, args)
+
+    def sync(self, session_id: int) -> SyncResult:
+
+        state = self.load(session_id)
+
+        if state["watermark"] is None:
+            self.invalidate("BillsBySessionID", session_id)
+            changed = self.api.bills_by_session_id(session_id)["bills"]
+        else:
+            self.invalidate("BillsUpdated", session_id, state["watermark"])
+            changed = self.api.updated_bills(session_id, state["watermark"])["bills"]
+
+        bill_numbers = sorted(
+            set(bill["bill_number"] for bill in changed) | set(state["pending"])
+        )
+
+        for bill_number in bill_numbers:
+            for operation in BILL_OPERATIONS:
+                self.invalidate(operation, session_id, bill_number)
+
+        if self.api.planner is not None:
+            self.api.planner.invalidate(session_id)
+
+        fetched = {bill_number: {} for bill_number in bill_numbers}
+        errors = {}
+
+        for name, results in [
+            ("bill", self.api.bill_info_many),
+            ("documents", self.api.documents_by_bill_num_many),
+            ("floor_votes", self.api.floor_votes_by_bill_many),
+        ]:
+            for result in results(session_id, bill_numbers, self.max_workers):
+                if result.error is not None:
+                    errors[result.key] = result.error
+                else:
+                    fetched[result.key][name] = _plain(result.result)
+
+        for bill_number, bill in fetched.items():
+            if bill_number not in errors:
+                state["bills"][bill_number] = bill
+
+        last_updated = [
+            bill["last_updated"] for bill in changed if bill["last_updated"] is not None
+        ]
+
+        if last_updated:
+            watermark = max(last_updated).isoformat()
+
+            if state["watermark"] is None or watermark > state["watermark"]:
+                state["watermark"] = watermark
+
+        state["pending"] = sorted(errors)
+
+        self.save(session_id, state)
+
+        return SyncResult(
+            session_id, state["watermark"], sorted(set(fetched) - set(errors)), errors
+        )
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict
+
+# Deduplicates identical calls in flight at the same time. The first caller
+# for a key runs the call; callers arriving before it finishes wait for it and
+# receive the same result or exception. Nothing is kept once the call
+# completes, so this never serves stale data (see ResponseCache for that).
+#
+# Threaded callers use do(), coroutines use do_async(); the two do not share
+# flights.
+
+
+class SingleFlight:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.tasks = {}
+        self.calls = Counter()
+        self.coalesced = Counter()
+
+    def do(self, key: str, function: Callable, operation: str = None):
+
+        with self.lock:
+            self.calls[operation] += 1
+            future = self.flights.get(key)
+            leader = future is None
+
+            if leader:
+                future = self.flights[key] = Future()
+            else:
+                self.coalesced[operation] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                del self.flights[key]
+
+    async def do_async(
+        self, key: str, function: Callable[[], Awaitable], operation: str = None
+    ):
+
+        loop = asyncio.get_running_loop()
+        flight = (loop, key)
+
+        with self.lock:
+            self.calls[operation] += 1
+            task = self.tasks.get(flight)
+
+            if task is None:
+                task = self.tasks[flight] = loop.create_task(function())
+                task.add_done_callback(lambda task: self.land(flight, task))
+            else:
+                self.coalesced[operation] += 1
+
+        # The call runs in its own task, so cancelling any caller, the first
+        # one included, leaves it running for the others.
+
+        return await asyncio.shield(task)
+
+    def land(self, flight: tuple, task: asyncio.Task):
+
+        with self.lock:
+            if self.tasks.get(flight) is task:
+                del self.tasks[flight]
+
+        # Retrieve the exception so a call whose callers were all cancelled
+        # does not log it as never retrieved.
+
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {
+                "calls": sum(self.calls.values()),
+                "coalesced": sum(self.coalesced.values()),
+                "operations": {
+                    operation: {
+                        "calls": self.calls[operation],
+                        "coalesced": self.coalesced[operation],
+                    }
+                    for operation in self.calls
+                },
+            }
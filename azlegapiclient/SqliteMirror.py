@@ -0,0 +1,443 @@
+import datetime
+import sqlite3
+import threading
+from typing import Dict, Iterable, List
+
+from .AzLegApiClient import AzLegApiClient
+from .Records import as_mapping
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id INTEGER PRIMARY KEY,
+    session_full_name TEXT,
+    legislature INTEGER,
+    session TEXT,
+    legislation_year INTEGER,
+    session_start_date TEXT,
+    sine_die_date TEXT
+);
+
+CREATE TABLE IF NOT EXISTS bills (
+    session_id INTEGER NOT NULL,
+    bill_number TEXT NOT NULL,
+    short_title TEXT,
+    introduced_date TEXT,
+    house_1st_read TEXT,
+    house_official TEXT,
+    house_2nd_read TEXT,
+    senate_official TEXT,
+    postingsheet TEXT,
+    last_updated TEXT,
+    PRIMARY KEY (session_id, bill_number)
+);
+
+CREATE TABLE IF NOT EXISTS sponsors (
+    session_id INTEGER NOT NULL,
+    bill_number TEXT NOT NULL,
+    member_id INTEGER NOT NULL,
+    member_name TEXT,
+    type TEXT,
+    display_order INTEGER
+);
+CREATE INDEX IF NOT EXISTS sponsors_bill ON sponsors (session_id, bill_number);
+CREATE INDEX IF NOT EXISTS sponsors_member ON sponsors (member_id);
+
+CREATE TABLE IF NOT EXISTS documents (
+    session_id INTEGER NOT NULL,
+    bill_number TEXT NOT NULL,
+    item INTEGER,
+    transaction_type TEXT,
+    document_type TEXT,
+    document_format TEXT,
+    description TEXT,
+    url TEXT,
+    transaction_date TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_bill ON documents (session_id, bill_number);
+CREATE UNIQUE INDEX IF NOT EXISTS documents_key
+    ON documents (session_id, bill_number, ifnull(item, -1), ifnull(url, ''));
+
+CREATE TABLE IF NOT EXISTS floor_transactions (
+    session_id INTEGER NOT NULL,
+    tran_id INTEGER NOT NULL,
+    bill_number TEXT,
+    type TEXT,
+    committee_id INTEGER,
+    committee_name TEXT,
+    committee_short_name TEXT,
+    referral TEXT,
+    cow_referral TEXT,
+    action TEXT,
+    action_id INTEGER,
+    action_date TEXT,
+    comments TEXT,
+    PRIMARY KEY (session_id, tran_id)
+);
+CREATE INDEX IF NOT EXISTS floor_transactions_bill
+    ON floor_transactions (session_id, bill_number);
+CREATE INDEX IF NOT EXISTS floor_transactions_committee
+    ON floor_transactions (committee_id);
+
+CREATE TABLE IF NOT EXISTS votes (
+    session_id INTEGER NOT NULL,
+    tran_id INTEGER NOT NULL,
+    member_id INTEGER NOT NULL,
+    member_name TEXT,
+    display_order INTEGER,
+    vote TEXT
+);
+CREATE INDEX IF NOT EXISTS votes_tran ON votes (session_id, tran_id);
+CREATE INDEX IF NOT EXISTS votes_member ON votes (member_id, session_id);
+
+CREATE TABLE IF NOT EXISTS members (
+    session_id INTEGER NOT NULL,
+    member_id INTEGER NOT NULL,
+    legislature INTEGER,
+    full_name TEXT,
+    report_name TEXT,
+    body TEXT,
+    district INTEGER,
+    party TEXT,
+    status TEXT,
+    position TEXT,
+    email TEXT,
+    phone TEXT,
+    room TEXT,
+    PRIMARY KEY (session_id, member_id)
+);
+CREATE INDEX IF NOT EXISTS members_member ON members (member_id);
+
+CREATE TABLE IF NOT EXISTS committees (
+    legislature INTEGER NOT NULL,
+    committee_id INTEGER NOT NULL,
+    type TEXT,
+    body TEXT,
+    committee_name TEXT,
+    committee_short_name TEXT,
+    sub_committee TEXT,
+    PRIMARY KEY (legislature, committee_id)
+);
+CREATE INDEX IF NOT EXISTS committees_committee ON committees (committee_id);
+"""
+
+
+def _text(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+
+    return value
+
+
+# Normalized sqlite copy of the records returned by AzLegApiClient, plain or
+# typed. The load_* methods take the client's return values and replace the
+# rows they cover in a single transaction; documents are matched on (session,
+# bill, item, URL), so loading a partial result such as documents_from_date
+# keeps a bill's other documents. The remaining methods query the mirror.
+
+
+class SqliteMirror:
+    def __init__(self, path: str = ":memory:"):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    # Loading
+
+    def load_sessions(self, sessions: List[Dict]):
+
+        rows = [
+            (
+                session["session_id"],
+                session["session_full_name"],
+                session["legislature"],
+                session["session"],
+                session["legislation_Year"],
+                _text(session["session_start_date"]),
+                _text(session["sine_die_sate"]),
+            )
+            for session in sessions
+        ]
+
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def load_bills(self, bills: Iterable[Dict]):
+
+        bills = list(bills)
+        keys = [(bill["session_id"], bill["bill_number"]) for bill in bills]
+
+        with self.lock, self.db:
+            self.db.executemany(
+                "DELETE FROM sponsors WHERE session_id = ? AND bill_number = ?", keys
+            )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO bills VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        bill["session_id"],
+                        bill["bill_number"],
+                        bill["short_title"],
+                        _text(bill["introduced_date"]),
+                        _text(bill["house_1st_read"]),
+                        _text(bill["house_official"]),
+                        _text(bill["house_2nd_read"]),
+                        _text(bill["senate_official"]),
+                        bill["postingsheet"],
+                        _text(bill["last_updated"]),
+                    )
+                    for bill in bills
+                ],
+            )
+            self.db.executemany(
+                "INSERT INTO sponsors VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        bill["session_id"],
+                        bill["bill_number"],
+                        sponsor["member_id"],
+                        sponsor["member_name"],
+                        sponsor["type"],
+                        sponsor["display_order"],
+                    )
+                    for bill in bills
+                    for sponsor in bill["sponsors"]
+                ],
+            )
+
+    def load_documents(self, session_id: int, documents: Dict):
+
+        rows = [
+            (
+                session_id,
+                document["bill_number"],
+                document["item"],
+                document["transaction_type"],
+                document["document_type"],
+                document["document_format"],
+                document["description"],
+                document["url"],
+                _text(document["transaction_date"]),
+            )
+            for document in map(as_mapping, documents["documents"])
+        ]
+
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def load_floor_votes(self, floor_votes: Dict):
+
+        session_id = floor_votes["session_id"]
+        trans = [as_mapping(tran) for tran in floor_votes["tran"]]
+
+        with self.lock, self.db:
+            self.db.executemany(
+                "DELETE FROM votes WHERE session_id = ? AND tran_id = ?",
+                [(session_id, tran["tran_id"]) for tran in trans],
+            )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO floor_transactions "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        session_id,
+                        tran["tran_id"],
+                        tran["bill"],
+                        tran["type"],
+                        tran["cmte_id"],
+                        tran["cmte_name"],
+                        tran["cmte_short_name"],
+                        tran["referral"],
+                        tran["cow_referral"],
+                        tran["action"],
+                        tran["action_id"],
+                        _text(tran["action_date"]),
+                        tran["comments"],
+                    )
+                    for tran in trans
+                ],
+            )
+            self.db.executemany(
+                "INSERT INTO votes VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        session_id,
+                        tran["tran_id"],
+                        vote["member_id"],
+                        vote["member_name"],
+                        vote["display_order"],
+                        vote["vote"],
+                    )
+                    for tran in trans
+                    for vote in map(as_mapping, tran["votes"])
+                ],
+            )
+
+    def load_members(self, members: Dict):
+
+        session_id = members["session_id"]
+
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO members "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        session_id,
+                        member["member_id"],
+                        member["legislature"],
+                        member["full_name"],
+                        member["report_name"],
+                        member["body"],
+                        member["district"],
+                        member["party"],
+                        member["status"],
+                        member["postition"],
+                        member["email"],
+                        member["phone"],
+                        member["room"],
+                    )
+                    for member in map(as_mapping, members["members"])
+                ],
+            )
+
+    def load_committees(self, committees: Dict):
+
+        legislature = committees["legislature_id"]
+
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO committees VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        legislature,
+                        committee["committee_id"],
+                        committee["type"],
+                        committee["body"],
+                        committee["committee_name"],
+                        committee["committee_short_name"],
+                        committee["sub_committee"],
+                    )
+                    for committee in committees["committees"]
+                ],
+            )
+
+    # Returns the errors of bills whose bill_info could not be fetched, keyed by
+    # bill number; everything else has been loaded.
+
+    def mirror_session(
+        self, api: AzLegApiClient, session_id: int, max_workers=8
+    ) -> Dict[str, Exception]:
+
+        session = api.session_by_id(session_id)
+        self.load_sessions([session])
+
+        self.load_members(api.members_by_session_id(session_id))
+        self.load_committees(api.committees_by_leg(session["legislature"]))
+        self.load_documents(session_id, api.documents_by_session_id(session_id))
+        self.load_floor_votes(api.floor_votes_by_session_id(session_id))
+
+        bill_numbers = [
+            bill["bill_number"] for bill in api.bills_by_session_id(session_id)["bills"]
+        ]
+
+        bills = []
+        errors = {}
+
+        for result in api.bill_info_many(session_id, bill_numbers, max_workers):
+            if result.error is None:
+                bills.append(result.result)
+            else:
+                errors[result.key] = result.error
+
+        self.load_bills(bills)
+
+        return errors
+
+    # Queries
+
+    def query(self, sql: str, params=()) -> List[Dict]:
+        with self.lock:
+            return [dict(row) for row in self.db.execute(sql, params)]
+
+    def bill(self, session_id: int, bill_number: str) -> Dict:
+
+        bills = self.query(
+            "SELECT * FROM bills WHERE session_id = ? AND bill_number = ?",
+            (session_id, bill_number),
+        )
+
+        if not bills:
+            return None
+
+        bill = bills[0]
+        bill["sponsors"] = self.query(
+            "SELECT member_id, member_name, type, display_order FROM sponsors "
+            "WHERE session_id = ? AND bill_number = ? ORDER BY display_order",
+            (session_id, bill_number),
+        )
+
+        return bill
+
+    def bills_sponsored_by(self, member_id: int, session_id: int = None) -> List[Dict]:
+        return self.query(
+            "SELECT b.*, s.type AS sponsor_type FROM sponsors s JOIN bills b "
+            "USING (session_id, bill_number) WHERE s.member_id = ? "
+            "AND (? IS NULL OR s.session_id = ?)",
+            (member_id, session_id, session_id),
+        )
+
+    def documents_for_bill(self, session_id: int, bill_number: str) -> List[Dict]:
+        return self.query(
+            "SELECT * FROM documents WHERE session_id = ? AND bill_number = ? "
+            "ORDER BY item",
+            (session_id, bill_number),
+        )
+
+    def floor_votes_for_bill(self, session_id: int, bill_number: str) -> List[Dict]:
+
+        trans = self.query(
+            "SELECT * FROM floor_transactions WHERE session_id = ? AND bill_number = ? "
+            "ORDER BY action_date",
+            (session_id, bill_number),
+        )
+
+        for tran in trans:
+            tran["votes"] = self.query(
+                "SELECT member_id, member_name, display_order, vote FROM votes "
+                "WHERE session_id = ? AND tran_id = ? ORDER BY display_order",
+                (session_id, tran["tran_id"]),
+            )
+
+        return trans
+
+    def votes_by_member(self, session_id: int, member_id: int) -> List[Dict]:
+        return self.query(
+            "SELECT t.bill_number, t.action, t.action_date, t.tran_id, v.vote "
+            "FROM votes v JOIN floor_transactions t USING (session_id, tran_id) "
+            "WHERE v.member_id = ? AND v.session_id = ? ORDER BY t.action_date",
+            (member_id, session_id),
+        )
+
+    def members(self, session_id: int) -> List[Dict]:
+        return self.query(
+            "SELECT * FROM members WHERE session_id = ? ORDER BY member_id",
+            (session_id,),
+        )
+
+    def committee(self, legislature: int, committee_id: int) -> Dict:
+
+        committees = self.query(
+            "SELECT * FROM committees WHERE legislature = ? AND committee_id = ?",
+            (legislature, committee_id),
+        )
+
+        return committees[0] if committees else None
@@ -0,0 +1,944 @@
+import argparse
+import datetime
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from lxml import etree
+
+from .FastPath import SOAP_ENV
+
+NAMESPACE = "http://www.azleg.gov/"
+
+FIRST_NAMES = (
+    "John Maria David Linda Robert Ana James Karen Luis Susan Michael Rosa "
+    "William Patricia Carlos Nancy Thomas Elena Daniel Sarah"
+).split()
+LAST_NAMES = (
+    "Smith Hernandez Jackson Davis Thomas Lopez Anderson Brown Taylor Martinez "
+    "Wilson Garcia Moore Clark Lewis Walker Young Allen King Wright"
+).split()
+COMMITTEES = (
+    ("Appropriations", "APPROP"),
+    ("Education", "ED"),
+    ("Judiciary", "JUD"),
+    ("Government", "GOV"),
+    ("Health and Human Services", "HHS"),
+    ("Natural Resources, Energy and Water", "NREW"),
+    ("Transportation", "TRANS"),
+    ("Ways and Means", "WM"),
+    ("Commerce", "COM"),
+    ("Public Safety", "PS"),
+    ("Rules", "RULES"),
+    ("Land, Agriculture and Rural Affairs", "LARA"),
+)
+SUBJECTS = (
+    "schools; funding",
+    "water; groundwater; management",
+    "vehicles; registration; fees",
+    "appropriations; state agencies",
+    "elections; early ballots",
+    "health care; insurance",
+    "taxation; property",
+    "criminal justice; sentencing",
+)
+DOCUMENT_TYPES = (
+    ("Bill", "Introduced"),
+    ("Fact Sheet", "Fact Sheet for HB"),
+    ("Amendment", "Committee Amendment"),
+    ("Summary", "Senate Engrossed"),
+)
+REPRESENTING = (
+    "Self",
+    "Arizona Chamber of Commerce",
+    "League of Cities and Towns",
+    "Sierra Club",
+    "Arizona Education Association",
+)
+VOTES = ("Y",) * 12 + ("N",) * 6 + ("NV", "EX")
+
+
+def date(start: datetime.date, days: int, clock: str = "00:00:00") -> str:
+    return "%sT%s" % ((start + datetime.timedelta(days=days)).isoformat(), clock)
+
+
+def element(tag: str, attributes: Dict, children: str = None) -> str:
+
+    attributes = "".join(
+        " %s=%s" % (name, quoteattr(str(value))) for name, value in attributes.items()
+    )
+
+    if children is None:
+        return "<%s%s/>" % (tag, attributes)
+
+    return "<%s%s>%s</%s>" % (tag, attributes, children, tag)
+
+
+# One generated legislative session. Every record is derived from seed and
+# the scale parameters, so two servers started with the same arguments give
+# identical answers. Each bill gets roll_calls_per_bill floor votes of
+# votes_per_roll_call members each (capped at the number of members), plus
+# documents, committee standings and public positions, dated within the
+# session's first days days. committees is capped at len(COMMITTEES).
+
+
+class SyntheticSession:
+    def __init__(
+        self,
+        session_id: int = 121,
+        legislature: int = 54,
+        bills: int = 1000,
+        members: int = 90,
+        committees: int = 12,
+        roll_calls_per_bill: int = 2,
+        votes_per_roll_call: int = 60,
+        documents_per_bill: int = 4,
+        positions_per_bill: int = 5,
+        calendars: int = 60,
+        start: datetime.date = datetime.date(2019, 1, 14),
+        days: int = 130,
+        seed: int = 0,
+    ):
+        self.session_id = session_id
+        self.legislature = legislature
+        self.start = start
+        self.days = days
+        self.random = random.Random("%s:%s" % (seed, session_id))
+
+        self.members = [self.member(index) for index in range(members)]
+        self.committees = [
+            self.committee(index) for index in range(min(committees, len(COMMITTEES)))
+        ]
+        self.bills = [
+            self.bill(
+                index,
+                roll_calls_per_bill,
+                votes_per_roll_call,
+                documents_per_bill,
+                positions_per_bill,
+            )
+            for index in range(bills)
+        ]
+        self.by_number = {bill["number"]: bill for bill in self.bills}
+        self.by_member = {member["Member_ID"]: member for member in self.members}
+        self.calendars = [self.calendar(index, calendars) for index in range(calendars)]
+
+    def member(self, index: int) -> Dict:
+
+        first = FIRST_NAMES[index % len(FIRST_NAMES)]
+        last = LAST_NAMES[(index // len(FIRST_NAMES) + index) % len(LAST_NAMES)]
+        member_id = 1700 + index
+
+        return {
+            "Legislature": self.legislature,
+            "Member_ID": member_id,
+            "Full_Name": "%s %s" % (first, last),
+            "Report_Name": last,
+            "Body": "H" if index % 3 else "S",
+            "District": index % 30 + 1,
+            "Party": self.random.choice("RRD"),
+            "Status": "A",
+            "Postition": "",
+            "Email": "%s%d@azleg.gov" % (first.lower(), member_id),
+            "Phone": "602-926-%04d" % member_id,
+            "Fax": "",
+            "Maj_Leader": "N",
+            "Min_Leader": "N",
+            "Maj_Whip": "N",
+            "Min_Whip": "N",
+            "Room": 100 + index,
+        }
+
+    def committee(self, index: int) -> Dict:
+        return {
+            "Committee_ID": index + 1,
+            "Committee_Name": COMMITTEES[index][0],
+            "Committee_Short_Name": COMMITTEES[index][1],
+            "Sub_Committee": "N",
+            "Body": "HS"[index % 2],
+        }
+
+    def bill(
+        self,
+        index: int,
+        roll_calls: int,
+        votes: int,
+        documents: int,
+        positions: int,
+    ) -> Dict:
+
+        number = "%s%d" % ("HB" if index % 3 else "SB", 2001 + index)
+        day = self.random.randrange(self.days)
+        sponsors = self.random.sample(self.members, min(3, len(self.members)))
+        referrals = self.random.sample(self.committees, min(2, len(self.committees)))
+
+        return {
+            "number": number,
+            "day": day,
+            "title": "%s (%d)" % (SUBJECTS[index % len(SUBJECTS)], index),
+            "sponsors": sponsors,
+            "documents": [
+                self.document(number, day, item) for item in range(documents)
+            ],
+            "standings": [
+                self.standing(number, day, order, committee)
+                for order, committee in enumerate(referrals)
+            ],
+            "transactions": [
+                self.transaction(
+                    number, day, index * roll_calls + order, referrals, votes
+                )
+                for order in range(roll_calls)
+            ],
+            "positions": [
+                self.position(number, day, item) for item in range(positions)
+            ],
+        }
+
+    def document(self, number: str, day: int, item: int) -> Dict:
+
+        document_type, description = DOCUMENT_TYPES[item % len(DOCUMENT_TYPES)]
+
+        return {
+            "Item": item,
+            "Transaction_Type": "Bill",
+            "Bill_Number": number,
+            "Document_Type": document_type,
+            "Document_Format": "PDF" if item % 2 == 0 else "HTML",
+            "Description": description,
+            "URL": "https://www.azleg.gov/legtext/%dleg/1R/bills/%s.%d.pdf"
+            % (self.legislature, number, item),
+            "Transaction_Date": date(self.start, min(self.days, day + item)),
+        }
+
+    def standing(self, number: str, day: int, order: int, committee: Dict) -> Dict:
+
+        ayes = self.random.randint(4, 9)
+
+        return {
+            "Session_ID": self.session_id,
+            "Bill_Number": number,
+            "Committee_ID": committee["Committee_ID"],
+            "Committee_Name": committee["Committee_Name"],
+            "Committee_Short_Name": committee["Committee_Short_Name"],
+            "Referral_Number": order + 1,
+            "Display_Order": order,
+            "Assigned_Date": date(self.start, day),
+            "Vote_Recon": "N",
+            "Action_ID": "DP",
+            "Action": "DP",
+            "Ayes": ayes,
+            "Nays": 9 - ayes,
+            "Excused": 0,
+            "Not_Voting": 0,
+            "Present": 0,
+            "Absent": 0,
+            "Report_Date": date(self.start, day + 7),
+            "Vacant": 0,
+        }
+
+    def transaction(
+        self, number: str, day: int, index: int, referrals: List, votes: int
+    ) -> Tuple[Dict, List]:
+
+        committee = referrals[index % len(referrals)] if referrals else None
+        voters = self.random.sample(self.members, min(votes, len(self.members)))
+
+        return (
+            {
+                "ID": 50000 + index,
+                "Type": "F",
+                "Bill": number,
+                "CmteID": committee["Committee_ID"] if committee else "",
+                "CmteName": committee["Committee_Name"] if committee else "",
+                "CmteShortName": committee["Committee_Short_Name"] if committee else "",
+                "Referral": 1,
+                "COW_Referral": 0,
+                "Action": "Passed",
+                "Action_ID": "PASSED",
+                "ActionDate": date(self.start, min(self.days, day + 14 + index % 30)),
+                "Comments": "",
+            },
+            [
+                {
+                    "MemID": member["Member_ID"],
+                    "MemName": member["Full_Name"],
+                    "DisplayOrder": order,
+                    "Vote": self.random.choice(VOTES),
+                }
+                for order, member in enumerate(voters)
+            ],
+        )
+
+    def position(self, number: str, day: int, item: int) -> Dict:
+        return {
+            "First_Name": self.random.choice(FIRST_NAMES),
+            "Last_name": self.random.choice(LAST_NAMES),
+            "BillNum": number,
+            "Representing": REPRESENTING[item % len(REPRESENTING)],
+            "Opinion": ("For", "Against", "Neutral")[item % 3],
+            "PosDate": date(self.start, min(self.days, day + item), "09:30:00"),
+        }
+
+    def calendar(self, index: int, count: int) -> Tuple[Dict, List]:
+
+        committee = (
+            self.committees[index % len(self.committees)] if self.committees else None
+        )
+        bills = self.bills[index::count]
+
+        return (
+            {
+                "Cal_ID": 9000 + index,
+                "Body": committee["Body"] if committee else "HS"[index % 2],
+                "Type": "COW",
+                "Cal_Date": date(self.start, index * self.days // max(1, count)),
+                "Number": index + 1,
+                "Committee_Name": committee["Committee_Name"] if committee else "",
+                "Committee_ID": committee["Committee_ID"] if committee else "",
+                "Cal_Name": "Committee of the Whole",
+                "Cal_Time": "1:30 PM",
+                "Protest_Date": date(
+                    self.start, index * self.days // max(1, count) + 1
+                ),
+                "URL": "https://www.azleg.gov/calendars/%d.pdf" % (9000 + index),
+            },
+            [
+                {
+                    "Bill_Number": bill["number"],
+                    "Display_Order": order,
+                    "Reconsidered": "N",
+                }
+                for order, bill in enumerate(bills)
+            ],
+        )
+
+    # Response documents, in the shape legservice.asmx returns them.
+
+    def session_attributes(self) -> Dict:
+        return {
+            "Session_ID": self.session_id,
+            "Session_Full_Name": "Legislature %d - Regular Session" % self.legislature,
+            "Legislature": self.legislature,
+            "Session": "1R",
+            "Legislation_Year": self.start.year,
+        }
+
+    def sessions(self) -> str:
+        return element(
+            "SESSION",
+            dict(
+                self.session_attributes(),
+                session_start_date=date(self.start, 0),
+                sine_die_date=date(self.start, self.days),
+            ),
+        )
+
+    def session_by_id(self) -> str:
+        return element(
+            "SESSIONS",
+            {},
+            element(
+                "SESSION",
+                dict(
+                    self.session_attributes(),
+                    Session_Start_Date=date(self.start, 0),
+                    Sine_Die_Date=date(self.start, self.days),
+                ),
+            ),
+        )
+
+    def bills_by_session_id(self) -> str:
+        return element(
+            "BILLS",
+            {"SessionID": self.session_id},
+            "".join(
+                "<BILL><Bill_Number>%s</Bill_Number><Initial_Title>%s</Initial_Title>"
+                "<Current_Title>%s</Current_Title><Last_Updated>%s</Last_Updated>"
+                "</BILL>"
+                % (
+                    bill["number"],
+                    escape(bill["title"]),
+                    escape(bill["title"]),
+                    date(self.start, bill["day"], "10:15:00"),
+                )
+                for bill in self.bills
+            ),
+        )
+
+    def bill_info(self, number: str) -> str:
+
+        bill = self.by_number.get(number)
+
+        if bill is None:
+            return "<BILLS/>"
+
+        day = bill["day"]
+        fields = (
+            ("Short_Title", escape(bill["title"])),
+            ("Introduced_Date", date(self.start, day)),
+            ("House_1st_Read", date(self.start, day + 1)),
+            ("House_Official", "N"),
+            ("House_2nd_Read", date(self.start, day + 2)),
+            ("House_Consent_Calendar_Object", "N"),
+            ("Senate_Official", "N"),
+            ("Senate_Consent_Calendar_Object", "N"),
+            (
+                "PostingSheet",
+                "https://www.azleg.gov/PostingSheet/%dleg/1R/%s"
+                % (self.legislature, number),
+            ),
+            ("Last_Updated", date(self.start, day, "10:15:00")),
+        )
+        sponsors = "".join(
+            element(
+                "SPONSOR",
+                {
+                    "Display_Order": order,
+                    "Type": "P" if order == 0 else "C",
+                    "Member_ID": member["Member_ID"],
+                    "Member_Name": member["Full_Name"],
+                },
+            )
+            for order, member in enumerate(bill["sponsors"])
+        )
+        docs = "".join(
+            element(
+                "DOC",
+                {
+                    "Document_Type": document["Document_Type"],
+                    "Document_Format": document["Document_Format"],
+                    "Description": document["Description"],
+                    "Last_Updated": document["Transaction_Date"],
+                    "URL": document["URL"],
+                },
+            )
+            for document in bill["documents"]
+        )
+
+        return element(
+            "BILLS",
+            {},
+            element(
+                "BILL",
+                {"Session_ID": self.session_id, "Bill_Number": number},
+                "".join("<%s>%s</%s>" % (tag, text, tag) for tag, text in fields)
+                + element("SPONSORS", {}, sponsors)
+                + element("DOCS", {}, docs),
+            ),
+        )
+
+    def members_by_session_id(self) -> str:
+        return element(
+            "MEMBERS",
+            {},
+            "".join(element("MEMBER", member) for member in self.members),
+        )
+
+    def member_by_id(self, member_id: int) -> str:
+
+        member = self.by_member.get(member_id)
+
+        return element("MEMBER", member) if member is not None else "<MEMBER/>"
+
+    def bill_list(self, number: str) -> List:
+        return [self.by_number[number]] if number in self.by_number else []
+
+    def floor_votes(self, bills: List, committee_id: int = None) -> str:
+        return element(
+            "FLOORVOTES",
+            {"SessionID": self.session_id},
+            "".join(
+                element(
+                    "TRAN",
+                    transaction,
+                    "".join(element("VOTE", vote) for vote in votes),
+                )
+                for bill in bills
+                for transaction, votes in bill["transactions"]
+                if committee_id is None or transaction["CmteID"] == committee_id
+            ),
+        )
+
+    def floor_votes_by_session_id(self) -> str:
+        return self.floor_votes(self.bills)
+
+    def floor_votes_by_bill(self, number: str) -> str:
+        return self.floor_votes(self.bill_list(number))
+
+    def floor_votes_by_committee_id(self, committee_id: int) -> str:
+        return self.floor_votes(self.bills, committee_id)
+
+    def documents(self, bills: List, document_type: str = None) -> str:
+        return element(
+            "DOCUMENTS",
+            {},
+            "".join(
+                element("DOCUMENT", document)
+                for bill in bills
+                for document in bill["documents"]
+                if document_type is None or document["Document_Type"] == document_type
+            ),
+        )
+
+    def documents_by_session_id(self) -> str:
+        return self.documents(self.bills)
+
+    def documents_by_bill_num(self, number: str, document_type: str = None) -> str:
+        return self.documents(self.bill_list(number), document_type)
+
+    def standing_by_bill_num(self, number: str) -> str:
+        return element(
+            "STANDINGS",
+            {},
+            "".join(
+                element("STANDING", standing)
+                for bill in self.bill_list(number)
+                for standing in bill["standings"]
+            ),
+        )
+
+    def positions(self) -> str:
+        return element(
+            "POSITIONS",
+            {},
+            "".join(
+                element("POSITION", position)
+                for bill in self.bills
+                for position in bill["positions"]
+            ),
+        )
+
+    def calendars_by_session_id(self) -> str:
+        return element(
+            "CALENDARS",
+            {},
+            "".join(
+                element(
+                    "CALENDAR",
+                    calendar,
+                    "".join(element("BILL", bill) for bill in bills),
+                )
+                for calendar, bills in self.calendars
+            ),
+        )
+
+    def committees_by_leg(self) -> str:
+
+        bodies = "".join(
+            element(
+                "BODY",
+                {"Body": body},
+                "".join(
+                    element(
+                        "COMMITTEE",
+                        {
+                            name: value
+                            for name, value in committee.items()
+                            if name != "Body"
+                        },
+                    )
+                    for committee in self.committees
+                    if committee["Body"] == body
+                ),
+            )
+            for body in "HS"
+        )
+
+        return element(
+            "COMMITTEES",
+            {"legislature": self.legislature},
+            element("TYPE", {"Committee_Type": "S"}, bodies),
+        )
+
+
+# Operation name -> (SyntheticSession method, (parameter name, XML schema
+# type) pairs as published in the generated WSDL).
+
+SESSION_ID = ("sessionID", "int")
+BILL_NUMBER = ("billNumber", "string")
+
+OPERATIONS = {
+    "Sessions": (None, ()),
+    "SessionsbyID": ("session_by_id", (SESSION_ID,)),
+    "BillsBySessionID": ("bills_by_session_id", (SESSION_ID,)),
+    "BillInfo": ("bill_info", (SESSION_ID, BILL_NUMBER)),
+    "MembersBySessionID": ("members_by_session_id", (SESSION_ID,)),
+    "MemberByID": ("member_by_id", (("memberID", "int"), SESSION_ID)),
+    "FloorVotesBySessionID": ("floor_votes_by_session_id", (SESSION_ID,)),
+    "FloorVotesByBill": ("floor_votes_by_bill", (SESSION_ID, BILL_NUMBER)),
+    "FloorVotesByCommID": (
+        "floor_votes_by_committee_id",
+        (SESSION_ID, ("committeeID", "int")),
+    ),
+    "DocumentsBySessionID": ("documents_by_session_id", (SESSION_ID,)),
+    "DocumentsByBillNum": ("documents_by_bill_num", (SESSION_ID, BILL_NUMBER)),
+    "DocumentsByBillNumDocType": (
+        "documents_by_bill_num",
+        (SESSION_ID, BILL_NUMBER, ("docType", "string")),
+    ),
+    "StandingByBillNum": ("standing_by_bill_num", (SESSION_ID, BILL_NUMBER)),
+    "CalendarsBySessionID": ("calendars_by_session_id", (SESSION_ID,)),
+    "ForAgainstNeutralBySessionID": ("positions", (SESSION_ID,)),
+    "CommitteeByLegislature": (None, (("legislatureID", "int"),)),
+}
+
+WSDL_OPERATION = """
+      <s:element name="{name}">
+        <s:complexType><s:sequence>{parameters}</s:sequence></s:complexType>
+      </s:element>
+      <s:element name="{name}Response">
+        <s:complexType><s:sequence>
+          <s:element minOccurs="0" maxOccurs="1" name="{name}Result">
+            <s:complexType mixed="true"><s:sequence><s:any/></s:sequence></s:complexType>
+          </s:element>
+        </s:sequence></s:complexType>
+      </s:element>"""
+
+WSDL = """<?xml version="1.0" encoding="utf-8"?>
+<wsdl:definitions xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/"
+                  xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+                  xmlns:s="http://www.w3.org/2001/XMLSchema"
+                  xmlns:tns="{namespace}"
+                  targetNamespace="{namespace}">
+  <wsdl:types>
+    <s:schema elementFormDefault="qualified" targetNamespace="{namespace}">{elements}
+    </s:schema>
+  </wsdl:types>{messages}
+  <wsdl:portType name="LegServiceSoap">{port_operations}
+  </wsdl:portType>
+  <wsdl:binding name="LegServiceSoap" type="tns:LegServiceSoap">
+    <soap:binding transport="http://schemas.xmlsoap.org/soap/http"/>{bindings}
+  </wsdl:binding>
+  <wsdl:service name="LegService">
+    <wsdl:port name="LegServiceSoap" binding="tns:LegServiceSoap">
+      <soap:address location="{address}"/>
+    </wsdl:port>
+  </wsdl:service>
+</wsdl:definitions>
+"""
+
+
+def wsdl(address: str) -> str:
+    return WSDL.format(
+        namespace=NAMESPACE,
+        address=address,
+        elements="".join(
+            WSDL_OPERATION.format(
+                name=name,
+                parameters="".join(
+                    '<s:element minOccurs="1" maxOccurs="1" name="%s" type="s:%s"/>'
+                    % parameter
+                    for parameter in parameters
+                ),
+            )
+            for name, (_, parameters) in OPERATIONS.items()
+        ),
+        messages="".join(
+            '\n  <wsdl:message name="%s%s"><wsdl:part name="parameters" '
+            'element="tns:%s%s"/></wsdl:message>' % (name, direction, name, suffix)
+            for name in OPERATIONS
+            for direction, suffix in (("SoapIn", ""), ("SoapOut", "Response"))
+        ),
+        port_operations="".join(
+            '\n    <wsdl:operation name="%s"><wsdl:input message="tns:%sSoapIn"/>'
+            '<wsdl:output message="tns:%sSoapOut"/></wsdl:operation>'
+            % (name, name, name)
+            for name in OPERATIONS
+        ),
+        bindings="".join(
+            '\n    <wsdl:operation name="%s"><soap:operation soapAction="%s%s" '
+            'style="document"/><wsdl:input><soap:body use="literal"/></wsdl:input>'
+            '<wsdl:output><soap:body use="literal"/></wsdl:output></wsdl:operation>'
+            % (name, NAMESPACE, name)
+            for name in OPERATIONS
+        ),
+    )
+
+
+def envelope(operation: str, result: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<soap:Envelope xmlns:soap="%s"><soap:Body>'
+        '<tns:%sResponse xmlns:tns="%s"><tns:%sResult>%s</tns:%sResult>'
+        "</tns:%sResponse></soap:Body></soap:Envelope>"
+        % (SOAP_ENV, operation, NAMESPACE, operation, result, operation, operation)
+    ).encode("utf-8")
+
+
+# Raised by StubServer.call for requests the service answers with a fault.
+
+
+class StubFault(Exception):
+    pass
+
+
+def fault(message: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<soap:Envelope xmlns:soap="%s"><soap:Body><soap:Fault>'
+        "<faultcode>soap:Server</faultcode><faultstring>%s</faultstring>"
+        "</soap:Fault></soap:Body></soap:Envelope>" % (SOAP_ENV, escape(message))
+    ).encode("utf-8")
+
+
+# A local stand-in for legservice.asmx serving SyntheticSession data for the
+# operations in OPERATIONS. The WSDL is published at <url>?WSDL, so a client
+# only needs wsdl= pointed at it:
+#
+#   server = StubServer(bills=5000, latency=0.05, error_rate=0.01).start()
+#   api = AzLegApiClient(username, password, wsdl=server.wsdl_url)
+#
+# Every response is delayed by latency seconds plus a uniform random jitter,
+# plus the body size over bandwidth (bytes per second) when one is given.
+# error_rate is the fraction of requests answered with HTTP 503 and
+# fault_rate the fraction answered with a SOAP fault. Sessions are generated
+# on first use with the keyword arguments given to SyntheticSession, and
+# response bodies are cached, so the stub itself is rarely the bottleneck.
+# Only the session IDs in sessions exist; others get a SOAP fault, so memory
+# stays bounded by the configured sessions.
+# requests counts the requests answered and peak the most that were in
+# flight at once.
+
+
+class StubServer:
+    def __init__(
+        self,
+        port: int = 0,
+        host: str = "127.0.0.1",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: float = None,
+        error_rate: float = 0.0,
+        fault_rate: float = 0.0,
+        sessions: Tuple[int, ...] = (121,),
+        seed: int = 0,
+        **scale
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.fault_rate = fault_rate
+        self.session_ids = tuple(sessions)
+        self.seed = seed
+        self.scale = scale
+        self.random = random.Random(seed)
+        self.sessions = {}
+        self.responses = {}
+        self.requests = 0
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.server = None
+
+    @property
+    def url(self) -> str:
+        return "http://%s:%d/legservice.asmx" % self.server.server_address[:2]
+
+    @property
+    def wsdl_url(self) -> str:
+        return self.url + "?WSDL"
+
+    def session(self, session_id: int) -> SyntheticSession:
+
+        if session_id not in self.session_ids:
+            raise StubFault("Session %s does not exist." % session_id)
+
+        with self.lock:
+            session = self.sessions.get(session_id)
+
+            if session is None:
+                session = self.sessions[session_id] = SyntheticSession(
+                    session_id, seed=self.seed, **self.scale
+                )
+
+        return session
+
+    # Session-wide and per-bill operations take the session ID first and are
+    # answered by the SyntheticSession method named in OPERATIONS.
+
+    def call(self, operation: str, args: tuple) -> str:
+
+        if operation == "Sessions":
+            return element(
+                "SESSIONS",
+                {},
+                "".join(self.session(id).sessions() for id in self.session_ids),
+            )
+
+        if operation == "CommitteeByLegislature":
+            for session_id in self.session_ids:
+                session = self.session(session_id)
+
+                if session.legislature == args[0]:
+                    return session.committees_by_leg()
+
+            return element("COMMITTEES", {"legislature": args[0]})
+
+        if operation == "MemberByID":
+            member_id, session_id = args
+            return self.session(session_id).member_by_id(member_id)
+
+        session_id, *args = args
+
+        return getattr(self.session(session_id), OPERATIONS[operation][0])(*args)
+
+    # Returns (status, body) for a SOAP request body.
+
+    def respond(self, operation: str, body: bytes) -> Tuple[int, bytes]:
+
+        with self.lock:
+            self.requests += 1
+            draw = self.random.random()
+
+        if draw < self.error_rate:
+            return 503, b"Service Unavailable"
+
+        if draw < self.error_rate + self.fault_rate:
+            return 500, fault("Server was unable to process request.")
+
+        if operation not in OPERATIONS:
+            return 500, fault("Unknown operation %s." % operation)
+
+        parameters = OPERATIONS[operation][1]
+
+        try:
+            request = etree.fromstring(body).find(etree.QName(SOAP_ENV, "Body"))[0]
+            args = tuple(
+                int(child.text) if kind == "int" else child.text or ""
+                for child, (name, kind) in zip(request, parameters)
+            )
+        except (etree.XMLSyntaxError, TypeError, ValueError, IndexError) as error:
+            return 500, fault("Server was unable to read request. %s" % error)
+
+        key = (operation, args)
+        response = self.responses.get(key)
+
+        if response is None:
+            try:
+                response = envelope(operation, self.call(operation, args))
+            except StubFault as error:
+                return 500, fault(str(error))
+
+            with self.lock:
+                self.responses[key] = response
+
+        return 200, response
+
+    def delay(self, size: int) -> float:
+
+        with self.lock:
+            jitter = self.random.uniform(0, self.jitter) if self.jitter else 0
+
+        return self.latency + jitter + (size / self.bandwidth if self.bandwidth else 0)
+
+    def start(self) -> "StubServer":
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if self.path.lower().endswith("?wsdl"):
+                    self.send(200, wsdl(stub.url).encode("utf-8"))
+                else:
+                    self.send(404, b"")
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                operation = (
+                    self.headers.get("SOAPAction", "").strip('"').rsplit("/", 1)[-1]
+                )
+
+                with stub.lock:
+                    stub.active += 1
+                    stub.peak = max(stub.peak, stub.active)
+
+                try:
+                    status, response = stub.respond(operation, body)
+                    time.sleep(stub.delay(len(response)))
+                    self.send(status, response)
+                finally:
+                    with stub.lock:
+                        stub.active -= 1
+
+            def send(self, status: int, body: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", "text/xml; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv: List[str] = None):
+
+    parser = argparse.ArgumentParser(description="Local legservice.asmx stand-in.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[121])
+    parser.add_argument("--bills", type=int, default=1000)
+    parser.add_argument("--members", type=int, default=90)
+    parser.add_argument("--roll-calls-per-bill", type=int, default=2)
+    parser.add_argument("--votes-per-roll-call", type=int, default=60)
+    parser.add_argument("--documents-per-bill", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--bandwidth", type=float, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fault-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    options = parser.parse_args(argv)
+
+    stub = StubServer(
+        port=options.port,
+        host=options.host,
+        latency=options.latency,
+        jitter=options.jitter,
+        bandwidth=options.bandwidth,
+        error_rate=options.error_rate,
+        fault_rate=options.fault_rate,
+        sessions=options.sessions,
+        seed=options.seed,
+        bills=options.bills,
+        members=options.members,
+        roll_calls_per_bill=options.roll_calls_per_bill,
+        votes_per_roll_call=options.votes_per_roll_call,
+        documents_per_bill=options.documents_per_bill,
+    ).start()
+
+    print("Serving %s" % stub.wsdl_url)
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
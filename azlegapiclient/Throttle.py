@@ -0,0 +1,244 @@
+import asyncio
+import threading
+import time
+from collections import Counter, deque
+from typing import Callable, Dict
+
+from .PooledTransport import is_retryable
+
+# Token bucket: rate requests per second on average, with bursts of up to
+# burst requests. reserve() always takes a token, letting the bucket go into
+# debt, and returns how long the caller must wait before using it, so threads
+# and coroutines can share one bucket and sleep in their own way.
+
+
+class TokenBucket:
+    def __init__(
+        self, rate: float, burst: int = None, clock: Callable = time.monotonic
+    ):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.clock = clock
+        self.tokens = float(self.burst)
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+
+            return max(0.0, -self.tokens / self.rate)
+
+
+# Limit on requests in flight, adjusted by additive increase / multiplicative
+# decrease. A successful call that found the limit saturated raises it by
+# increase / limit, i.e. about `increase` per round of `limit` calls. An
+# overload error (see is_retryable) or a call slower than latency_tolerance
+# times the operation's smoothed latency cuts it by `decrease`. Calls that
+# started before the last cut cannot cut it again, so one burst of failures
+# only halves the limit once.
+#
+# Slots are handed to waiters in arrival order, both threads (acquire) and
+# coroutines (acquire_async).
+
+
+class AdaptiveConcurrency:
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.1,
+        warmup: int = 5,
+        clock: Callable = time.monotonic,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.warmup = warmup
+        self.clock = clock
+        self.in_flight = 0
+        self.last_decrease = float("-inf")
+        self.latency = {}
+        self.samples = Counter()
+        self.increases = 0
+        self.decreases = 0
+        self.waiters = deque()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+
+        with self.lock:
+            if not self.waiters and self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return
+
+            event = threading.Event()
+            self.waiters.append(event.set)
+
+        event.wait()
+
+    async def acquire_async(self):
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        with self.lock:
+            if not self.waiters and self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return
+
+            self.waiters.append(wake)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self.lock:
+                if wake in self.waiters:
+                    self.waiters.remove(wake)
+                else:
+                    self._release()
+            raise
+
+    # started is the clock() reading taken when the call was sent, or None if
+    # it never was. overloaded is None for calls whose outcome says nothing
+    # about load; they give the slot back without a sample.
+
+    def release(self, operation: str, started: float, overloaded: bool = False):
+
+        now = self.clock()
+
+        with self.lock:
+            if started is not None and overloaded is not None:
+                self._adjust(operation, started, now - started, overloaded)
+
+            self._release()
+
+    def _adjust(self, operation: str, started: float, latency: float, overloaded):
+
+        average = self.latency.get(operation)
+        slow = (
+            self.samples[operation] >= self.warmup
+            and latency > self.latency_tolerance * average
+        )
+
+        if not overloaded:
+            self.samples[operation] += 1
+            self.latency[operation] = (
+                latency
+                if average is None
+                else average + self.smoothing * (latency - average)
+            )
+
+        if overloaded or slow:
+            if started >= self.last_decrease:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+                self.last_decrease = self.clock()
+                self.decreases += 1
+        elif self.in_flight >= int(self.limit) and self.limit < self.maximum:
+            self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+            self.increases += 1
+
+    def _release(self):
+
+        self.in_flight -= 1
+
+        while self.waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            self.waiters.popleft()()
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "waiting": len(self.waiters),
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "latency": dict(self.latency),
+            }
+
+
+# Runs service calls under an AdaptiveConcurrency limit and, when rate is
+# given, a TokenBucket. The client passes every attempt of every SOAP call
+# through call() or call_async(), so retries are limited too. Streamed
+# responses (iter_* methods) hold their slot until the response headers
+# arrive, not while the body is read.
+
+
+class Throttle:
+    def __init__(
+        self,
+        rate: float = None,
+        burst: int = None,
+        concurrency: AdaptiveConcurrency = None,
+        clock: Callable = time.monotonic,
+    ):
+        self.clock = clock
+        self.bucket = TokenBucket(rate, burst, clock) if rate is not None else None
+        self.concurrency = (
+            concurrency if concurrency is not None else AdaptiveConcurrency(clock=clock)
+        )
+
+    def call(self, operation: str, function: Callable, *args):
+
+        self.concurrency.acquire()
+        started = None
+
+        try:
+            if self.bucket is not None:
+                time.sleep(self.bucket.reserve())
+
+            started = self.clock()
+            result = function(*args)
+        except BaseException as error:
+            self.concurrency.release(operation, started, self._overloaded(error))
+            raise
+
+        self.concurrency.release(operation, started, False)
+
+        return result
+
+    async def call_async(self, operation: str, function: Callable, *args):
+
+        await self.concurrency.acquire_async()
+        started = None
+
+        try:
+            if self.bucket is not None:
+                await asyncio.sleep(self.bucket.reserve())
+
+            started = self.clock()
+            result = await function(*args)
+        except BaseException as error:
+            self.concurrency.release(operation, started, self._overloaded(error))
+            raise
+
+        self.concurrency.release(operation, started, False)
+
+        return result
+
+    # Only errors that point at an overloaded service feed the controller;
+    # anything else (a SOAP fault, cancellation) just gives the slot back.
+
+    def _overloaded(self, error: BaseException):
+        return True if is_retryable(error) else None
+
+    def stats(self) -> Dict:
+        return self.concurrency.stats()
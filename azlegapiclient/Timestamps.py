@@ -0,0 +1,37 @@
+import datetime
+from functools import lru_cache
+from typing import Union
+
+import isodate
+
+# Every date the service returns goes through parse_timestamp. Session-wide
+# responses repeat the same few hundred timestamps across thousands of rows,
+# so results are memoized. datetime.fromisoformat covers the service's own
+# format; isodate handles anything else ISO 8601 allows. Empty values decode
+# to None, and values neither can parse are returned unchanged so one
+# malformed date doesn't fail the whole call.
+
+
+@lru_cache(maxsize=8192)
+def _parse(value: str) -> Union[datetime.datetime, str]:
+
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+
+    try:
+        return isodate.parse_datetime(value)
+    except ValueError:
+        return value
+
+
+def parse_timestamp(value) -> Union[datetime.datetime, str]:
+
+    if not value:
+        return None
+
+    if isinstance(value, datetime.datetime):
+        return value
+
+    return _parse(value)
@@ -0,0 +1,274 @@
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from .AsyncAzLegApiClient import AsyncAzLegApiClient
+from .Records import as_mapping
+
+# Vote codes stored in the matrix. NO_RECORD marks a member who does not
+# appear on a roll call at all (e.g. the other chamber); values the service
+# returns that are not listed map to OTHER.
+
+NO_RECORD = 0
+AYE = 1
+NAY = 2
+NOT_VOTING = 3
+EXCUSED = 4
+PRESENT = 5
+ABSENT = 6
+VACANT = 7
+OTHER = 8
+
+VOTE_CODES = {
+    "Y": AYE,
+    "N": NAY,
+    "NV": NOT_VOTING,
+    "EX": EXCUSED,
+    "P": PRESENT,
+    "AB": ABSENT,
+    "V": VACANT,
+}
+
+TALLIES = {
+    "ayes": AYE,
+    "nays": NAY,
+    "not_voting": NOT_VOTING,
+    "excused": EXCUSED,
+    "present": PRESENT,
+    "absent": ABSENT,
+    "vacant": VACANT,
+}
+
+
+# Member x roll call matrix of vote codes for a session. Rows follow
+# member_ids (sorted) and columns follow tran_ids in response order; bills,
+# committee_ids and action_ids describe each column.
+
+
+class VoteMatrix:
+    def __init__(
+        self,
+        votes: np.ndarray,
+        member_ids: np.ndarray,
+        tran_ids: np.ndarray,
+        bills: np.ndarray,
+        committee_ids: np.ndarray,
+        action_ids: np.ndarray,
+        member_names: Dict[str, str] = None,
+    ):
+        self.votes = votes
+        self.member_ids = member_ids
+        self.tran_ids = tran_ids
+        self.bills = bills
+        self.committee_ids = committee_ids
+        self.action_ids = action_ids
+        self.member_names = member_names or {}
+        self.rows = {member_id: row for row, member_id in enumerate(member_ids)}
+
+    @classmethod
+    def from_session(cls, api, session_id: int) -> "VoteMatrix":
+
+        if isinstance(api, AsyncAzLegApiClient):
+            raise TypeError("use VoteMatrix.from_session_async with an async client")
+
+        return cls.from_floor_votes(api.floor_votes_by_session_id(session_id))
+
+    @classmethod
+    async def from_session_async(cls, api, session_id: int) -> "VoteMatrix":
+        return cls.from_floor_votes(await api.floor_votes_by_session_id(session_id))
+
+    # Fills the matrix from a raw FloorVotes document (e.g. a cassette or the
+    # fast path) without building a record per vote. VOTE elements without a
+    # MemID are skipped.
+
+    @classmethod
+    def from_response(cls, response) -> "VoteMatrix":
+
+        member_ids = []
+        columns = []
+        codes = []
+        member_names = {}
+        transactions = []
+
+        for column, tran in enumerate(response):
+            transactions.append(
+                (
+                    tran.get("ID"),
+                    tran.get("Bill"),
+                    tran.get("CmteID"),
+                    tran.get("Action_ID"),
+                )
+            )
+
+            for vote in tran:
+                member_id = vote.get("MemID")
+
+                if member_id is None:
+                    continue
+
+                member_ids.append(member_id)
+                columns.append(column)
+                codes.append(VOTE_CODES.get(vote.get("Vote"), OTHER))
+                member_names[member_id] = vote.get("MemName")
+
+        return cls._build(member_ids, columns, codes, transactions, member_names)
+
+    @classmethod
+    def from_floor_votes(cls, floor_votes: Dict) -> "VoteMatrix":
+
+        columns = []
+        member_ids = []
+        codes = []
+        member_names = {}
+        transactions = []
+
+        for column, tran in enumerate(floor_votes["tran"]):
+            tran = as_mapping(tran)
+            transactions.append(
+                (tran["tran_id"], tran["bill"], tran["cmte_id"], tran["action_id"])
+            )
+
+            for vote in tran["votes"]:
+                vote = as_mapping(vote)
+
+                if vote["member_id"] is None:
+                    continue
+
+                member_ids.append(vote["member_id"])
+                columns.append(column)
+                codes.append(VOTE_CODES.get(vote["vote"], OTHER))
+                member_names[vote["member_id"]] = vote["member_name"]
+
+        return cls._build(member_ids, columns, codes, transactions, member_names)
+
+    @classmethod
+    def _build(
+        cls,
+        member_ids: List[str],
+        columns: List[int],
+        codes: List[int],
+        transactions: List[tuple],
+        member_names: Dict[str, str],
+    ) -> "VoteMatrix":
+
+        # Rows are numbered in order of first appearance, then renumbered so
+        # member ids come out sorted.
+
+        first_seen = {}
+        seen_rows = [first_seen.setdefault(m, len(first_seen)) for m in member_ids]
+        unique_ids = np.array(sorted(first_seen), dtype=object)
+        renumber = np.empty(len(first_seen), dtype=np.intp)
+        renumber[[first_seen[m] for m in unique_ids]] = np.arange(len(unique_ids))
+        rows = renumber[np.array(seen_rows, dtype=np.intp)]
+
+        votes = np.zeros((len(unique_ids), len(transactions)), dtype=np.int8)
+        votes[rows, np.array(columns, dtype=np.intp)] = np.array(codes, dtype=np.int8)
+
+        tran_ids, bills, committee_ids, action_ids = (
+            np.array([tran[field] for tran in transactions], dtype=object)
+            for field in range(4)
+        )
+
+        return cls(
+            votes, unique_ids, tran_ids, bills, committee_ids, action_ids, member_names
+        )
+
+    @property
+    def shape(self):
+        return self.votes.shape
+
+    def member(self, member_id: str) -> np.ndarray:
+        return self.votes[self.rows[member_id]]
+
+    def tallies(self) -> Dict[str, np.ndarray]:
+        return {
+            name: np.count_nonzero(self.votes == code, axis=0)
+            for name, code in TALLIES.items()
+        }
+
+    def columns_for_bill(self, bill_number: str) -> np.ndarray:
+        return np.flatnonzero(self.bills == bill_number)
+
+    # Share of a member's aye/nay votes cast with the majority of their own
+    # party. Roll calls where the party splits evenly are not counted.
+    # parties maps member_id to party, e.g. from members_by_session_id.
+
+    def party_unity(self, parties: Dict[str, str]) -> Dict[str, float]:
+
+        party = np.array([parties.get(member_id) for member_id in self.member_ids])
+        aye = self.votes == AYE
+        nay = self.votes == NAY
+        agree = np.zeros(self.votes.shape[0], dtype=np.int64)
+        counted = np.zeros(self.votes.shape[0], dtype=np.int64)
+
+        for name in set(parties.values()):
+            rows = party == name
+            ayes = aye[rows].sum(axis=0)
+            nays = nay[rows].sum(axis=0)
+            majority = np.where(ayes > nays, AYE, np.where(nays > ayes, NAY, NO_RECORD))
+
+            voted = (aye[rows] | nay[rows]) & (majority != NO_RECORD)
+            agree[rows] = (voted & (self.votes[rows] == majority)).sum(axis=1)
+            counted[rows] = voted.sum(axis=1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            unity = agree / counted
+
+        return {
+            member_id: float(unity[row])
+            for row, member_id in enumerate(self.member_ids)
+            if party[row] is not None and counted[row]
+        }
+
+    # Members x members share of roll calls where both voted aye or nay and
+    # voted the same way. NaN where a pair never voted on the same roll call.
+
+    def agreement(self) -> np.ndarray:
+
+        sign = (self.votes == AYE).astype(np.float32) - (self.votes == NAY)
+        voted = np.abs(sign)
+
+        both = voted @ voted.T
+        same = (sign @ sign.T + both) / 2
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return same / both
+
+    # Compares the committee tallies in standing_by_bill_num output with the
+    # individual votes recorded for the same bill, committee and action.
+    # Returns one entry per disagreeing count.
+
+    def cross_check(self, standings: Iterable[Dict]) -> List[Dict]:
+
+        tallies = self.tallies()
+        mismatches = []
+
+        for standing in standings:
+            columns = np.flatnonzero(
+                (self.bills == standing["bill_number"])
+                & (self.committee_ids == standing["committee_id"])
+                & (self.action_ids == standing["action_id"])
+            )
+
+            if len(columns) == 0:
+                continue
+
+            column = columns[-1]
+
+            for name in TALLIES:
+                if standing.get(name) in (None, ""):
+                    continue
+
+                if int(standing[name]) != int(tallies[name][column]):
+                    mismatches.append(
+                        {
+                            "bill_number": standing["bill_number"],
+                            "committee_id": standing["committee_id"],
+                            "tran_id": self.tran_ids[column],
+                            "count": name,
+                            "standing": int(standing[name]),
+                            "votes": int(tallies[name][column]),
+                        }
+                    )
+
+        return mismatches
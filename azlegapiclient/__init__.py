@@ -1 +1,15 @@
-from .AzLegApiClient import AzLegApiClient
\ No newline at end of file
+from .AzLegApiClient import AzLegApiClient, BulkResult
+from .AsyncAzLegApiClient import AsyncAzLegApiClient
+from .ResponseCache import ResponseCache, MemoryBackend, DiskBackend
+from .Cassette import Cassette, CassetteMiss, CassetteTransport
+from .SessionSync import SessionSync
+from .SqliteMirror import SqliteMirror
+from .SessionSnapshot import SessionSnapshot
+from .SessionIndex import SessionIndex
+from .QueryPlanner import QueryPlanner
+from .CircuitBreaker import BreakerPolicy, CircuitBreaker, CircuitOpenError
+from .Hedger import HedgePolicy, Hedger
+from .Instrumentation import Instrumentation, CallMetrics
+from .PrometheusExporter import PrometheusExporter
+from .Throttle import Throttle, AdaptiveConcurrency, TokenBucket
+from .Records import Vote, FloorTransaction, Document, CalendarBill, Calendar, Member
@@ -0,0 +1,123 @@
+import time
+
+from lxml import etree
+
+from azlegapiclient.Extractors import extract_document, extract_floor_transaction
+from azlegapiclient.Timestamps import parse_timestamp
+from tests.fakes import documents, floor_votes
+
+# Records per second for the hand-written mapping loops the parsers used to
+# carry against the schema extractors that replaced them. Both decode the
+# same timestamp fields, so they do the same work.
+#
+#   python -m benchmarks.bench_extractors
+
+ROWS = 10000
+ROUNDS = 20
+
+
+def legacy_document(document):
+    return {
+        "item": document.get("Item"),
+        "transaction_type": document.get("Transaction_Type"),
+        "bill_number": document.get("Bill_Number"),
+        "document_type": document.get("Document_Type"),
+        "document_format": document.get("Document_Format"),
+        "description": document.get("Description"),
+        "url": document.get("URL"),
+        "transaction_date": parse_timestamp(document.get("Transaction_Date")),
+    }
+
+
+def legacy_floor_transaction(tran):
+
+    tran_meta = tran.attrib
+
+    tran_obj = {
+        "tran_id": tran_meta["ID"],
+        "type": tran_meta["Type"],
+        "bill": tran_meta["Bill"],
+        "cmte_id": tran_meta["CmteID"],
+        "cmte_name": tran_meta["CmteName"],
+        "cmte_short_name": tran_meta["CmteShortName"],
+        "referral": tran_meta["Referral"],
+        "cow_referral": tran_meta["COW_Referral"],
+        "action": tran_meta["Action"],
+        "action_id": tran_meta["Action_ID"],
+        "action_date": parse_timestamp(tran_meta["ActionDate"]),
+        "comments": tran_meta["Comments"],
+        "votes": [],
+    }
+
+    for vote in tran:
+
+        current = vote.attrib
+
+        tran_obj["votes"].append(
+            {
+                "member_id": current["MemID"],
+                "member_name": current["MemName"],
+                "display_order": current["DisplayOrder"],
+                "vote": current["Vote"],
+            }
+        )
+
+    return tran_obj
+
+
+def repeat(rows, count):
+    start, end = rows.index("<", rows.index(">") + 1), rows.rindex("</")
+
+    return rows[:start] + rows[start:end] * count + rows[end:]
+
+
+def bench(mapper, response):
+
+    start = time.process_time()
+
+    for element in response:
+        mapper(element)
+
+    return len(response) / (time.process_time() - start)
+
+
+def main():
+
+    cases = [
+        (
+            "documents",
+            etree.fromstring(repeat(documents(121, "HB2001"), ROWS)),
+            legacy_document,
+            extract_document,
+        ),
+        (
+            "floor transactions (60 votes)",
+            etree.fromstring(
+                repeat(floor_votes(121, "HB2001", *range(1700, 1760)), ROWS // 10)
+            ),
+            legacy_floor_transaction,
+            extract_floor_transaction,
+        ),
+    ]
+
+    print(
+        "%-32s %14s %16s %8s" % ("records", "legacy rec/s", "extractor rec/s", "gain")
+    )
+
+    for name, response, legacy_mapper, mapper in cases:
+        legacy = extracted = 0
+
+        # Best of ROUNDS, alternating the two so drift hits both alike.
+
+        for _ in range(ROUNDS):
+            legacy = max(legacy, bench(legacy_mapper, response))
+            extracted = max(extracted, bench(mapper, response))
+
+        print(
+            "%-32s %14.0f %16.0f %7.0f%%"
+            % (name, legacy, extracted, 100 * (extracted - legacy) / legacy)
+        )
+
+
+if __name__ == "__main__":
+    main()
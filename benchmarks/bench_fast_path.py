@@ -0,0 +1,77 @@
+import os
+import tempfile
+import time
+
+from azlegapiclient.AzLegApiClient import AzLegApiClient
+from azlegapiclient.PooledTransport import PooledTransport
+from tests.fakes import FakeAdapter, SESSION, documents
+
+# CPU time per call of the zeep path against the fast path, over canned
+# responses so only client-side work is measured.
+#
+#   python -m benchmarks.bench_fast_path
+
+FIXTURE_WSDL = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "fixtures", "legservice.wsdl"
+)
+CALLS = 200
+
+
+def large_documents(count):
+    rows = documents(121, "HB2001")
+    start, end = rows.index("<DOCUMENT "), rows.index("</DOCUMENTS>")
+
+    return rows[:start] + rows[start:end] * count + rows[end:]
+
+
+def bench(api, method, *args):
+
+    method(*args)
+    start = time.process_time()
+
+    for _ in range(CALLS):
+        method(*args)
+
+    return (time.process_time() - start) / CALLS
+
+
+def main():
+
+    adapter = FakeAdapter(
+        {"SessionsbyID": SESSION, "DocumentsBySessionID": large_documents(1000)}
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+
+        for fast in (False, True):
+            api = AzLegApiClient(
+                username="username",
+                password="password",
+                wsdl=FIXTURE_WSDL,
+                transport=PooledTransport(
+                    cache_path=os.path.join(directory, "cache.db")
+                ),
+                fast=fast,
+            )
+            api.transport.session.mount("https://", adapter)
+
+            results[fast] = {
+                "session_by_id": bench(api, api.session_by_id, 121),
+                "documents_by_session_id (1000 rows)": bench(
+                    api, api.documents_by_session_id, 121
+                ),
+            }
+
+    print("%-40s %12s %12s %8s" % ("call", "zeep ms", "fast ms", "saved"))
+
+    for name in results[False]:
+        slow, fast = results[False][name], results[True][name]
+        print(
+            "%-40s %12.3f %12.3f %7.0f%%"
+            % (name, slow * 1000, fast * 1000, 100 * (slow - fast) / slow)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import tracemalloc
+
+from lxml import etree
+
+from azlegapiclient.Extractors import EXTRACTORS, TYPED_EXTRACTORS
+from tests.fakes import documents, floor_votes
+
+# Bytes of Python heap per row held by parsed results, dicts against the
+# typed records (typed=True). Attribute strings are counted in both.
+#
+#   python -m benchmarks.bench_records
+
+TRANSACTIONS = 500
+MEMBERS = 60
+DOCUMENTS = 20000
+
+
+def repeat(rows, count):
+    start, end = rows.index("<", rows.index(">") + 1), rows.rindex("</")
+
+    return rows[:start] + rows[start:end] * count + rows[end:]
+
+
+def measure(extract, response):
+
+    tracemalloc.start()
+    records = [extract(element) for element in response]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del records
+
+    return size
+
+
+def main():
+
+    votes = etree.fromstring(
+        repeat(floor_votes(121, "HB2001", *range(1700, 1700 + MEMBERS)), TRANSACTIONS)
+    )
+    docs = etree.fromstring(repeat(documents(121, "HB2001"), DOCUMENTS))
+
+    cases = [
+        ("floor votes (per vote)", "floor_transaction", votes, TRANSACTIONS * MEMBERS),
+        ("documents (per document)", "document", docs, len(docs)),
+    ]
+
+    print("%-28s %12s %12s %8s" % ("rows", "dict B/row", "typed B/row", "saved"))
+
+    for name, record, response, rows in cases:
+        plain = measure(EXTRACTORS[record], response) / rows
+        typed = measure(TYPED_EXTRACTORS[record], response) / rows
+        print(
+            "%-28s %12.0f %12.0f %7.0f%%"
+            % (name, plain, typed, 100 * (plain - typed) / plain)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import timeit
+import tracemalloc
+
+from lxml import etree
+
+from azlegapiclient.Extractors import TYPED_EXTRACTORS
+from azlegapiclient.SessionIndex import SessionIndex
+from azlegapiclient.StubServer import SyntheticSession
+
+# Per-bill and per-member lookups on a full session's floor votes and
+# documents, scanning the result lists against a SessionIndex, plus the bytes
+# the index adds on top of the records.
+#
+#   python -m benchmarks.bench_session_index
+
+SESSION = SyntheticSession(bills=1500, members=90, votes_per_roll_call=60)
+LOOKUPS = 200
+
+
+def scan_bill(transactions, documents, bill_number):
+    return (
+        [tran for tran in transactions if tran.bill == bill_number],
+        [document for document in documents if document.bill_number == bill_number],
+    )
+
+
+def scan_member(transactions, member_id):
+    return [
+        (tran, vote)
+        for tran in transactions
+        for vote in tran.votes
+        if vote.member_id == member_id
+    ]
+
+
+def main():
+
+    transactions = list(
+        map(
+            TYPED_EXTRACTORS["floor_transaction"],
+            etree.fromstring(SESSION.floor_votes_by_session_id()),
+        )
+    )
+    documents = list(
+        map(
+            TYPED_EXTRACTORS["document"],
+            etree.fromstring(SESSION.documents_by_session_id()),
+        )
+    )
+
+    tracemalloc.start()
+    index = SessionIndex()
+    index.add_roll_calls(transactions)
+    index.add_documents(documents)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    bills = [bill["number"] for bill in SESSION.bills[:LOOKUPS]]
+    members = [str(member["Member_ID"]) for member in SESSION.members]
+
+    cases = [
+        (
+            "bill (scan)",
+            lambda: [scan_bill(transactions, documents, bill) for bill in bills],
+            len(bills),
+        ),
+        (
+            "bill (index)",
+            lambda: [
+                (index.roll_calls_for_bill(bill), index.documents_for_bill(bill))
+                for bill in bills
+            ],
+            len(bills),
+        ),
+        (
+            "member (scan)",
+            lambda: [scan_member(transactions, member) for member in members],
+            len(members),
+        ),
+        (
+            "member (index)",
+            lambda: [index.votes_for_member(member) for member in members],
+            len(members),
+        ),
+    ]
+
+    print(
+        "%d roll calls, %d votes, %d documents; index %.0f KiB"
+        % (len(transactions), len(index.vote_roll_calls), len(documents), size / 1024)
+    )
+    print("%-16s %12s" % ("lookup", "us/lookup"))
+
+    for name, run, count in cases:
+        seconds = min(timeit.repeat(run, number=1, repeat=3))
+        print("%-16s %12.1f" % (name, seconds / count * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import random
+import time
+
+import isodate
+from lxml import etree
+
+from azlegapiclient.Extractors import extract_document
+from azlegapiclient.Timestamps import _parse, parse_timestamp
+
+# Date decoding for a full session of documents: isodate on every row, as
+# bills_by_session_id used to, against the memoized parse_timestamp.
+#
+#   python -m benchmarks.bench_timestamps
+
+DOCUMENTS = 50000
+DISTINCT_DATES = 400
+
+
+def session_documents():
+
+    dates = [
+        "2019-%02d-%02dT%02d:00:00" % (1 + day // 28 % 12, 1 + day % 28, day % 24)
+        for day in range(DISTINCT_DATES)
+    ]
+
+    return etree.fromstring(
+        "<DOCUMENTS>%s</DOCUMENTS>"
+        % "".join(
+            '<DOCUMENT Item="%d" Transaction_Type="Bill" Bill_Number="HB%d" '
+            'Document_Type="Bill" Document_Format="PDF" Description="Introduced" '
+            'URL="https://example.org/%d.pdf" Transaction_Date="%s"/>'
+            % (item, 2000 + item % 1500, item, random.choice(dates))
+            for item in range(DOCUMENTS)
+        )
+    )
+
+
+def bench(function, values):
+
+    start = time.process_time()
+
+    for value in values:
+        function(value)
+
+    return time.process_time() - start
+
+
+def main():
+
+    response = session_documents()
+    values = [document.get("Transaction_Date") for document in response]
+
+    _parse.cache_clear()
+
+    results = [
+        ("isodate.parse_datetime", bench(isodate.parse_datetime, values)),
+        ("parse_timestamp (cold cache)", bench(parse_timestamp, values)),
+        ("parse_timestamp (warm cache)", bench(parse_timestamp, values)),
+    ]
+
+    print("%d documents, %d distinct dates" % (DOCUMENTS, DISTINCT_DATES))
+    print("%-32s %10s" % ("decoder", "ms"))
+
+    for name, seconds in results:
+        print("%-32s %10.1f" % (name, seconds * 1000))
+
+    start = time.process_time()
+    [extract_document(document) for document in response]
+    print(
+        "%-32s %10.1f"
+        % ("extract_document (full row)", (time.process_time() - start) * 1000)
+    )
+
+
+if __name__ == "__main__":
+    main()
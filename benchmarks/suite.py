@@ -0,0 +1,362 @@
+import argparse
+import copy
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Tuple
+
+import lxml
+from lxml import etree
+
+from azlegapiclient.AzLegApiClient import AzLegApiClient
+from azlegapiclient.FastPath import FastPath
+from azlegapiclient.Instrumentation import Instrumentation
+from azlegapiclient.Timestamps import _parse
+from tests.fakes import envelope
+
+# Offline benchmark of every public client method over the response
+# documents in benchmarks/fixtures, at the sizes given by --scales (1 is the
+# fixture as stored, 10 and 100 replicate its records). No network is used:
+# FixtureClient answers each call with the fixture wrapped in a SOAP
+# envelope, which is parsed as FastPath does, so the network phase is zero
+# and parse/map cover all client-side work. Peak memory is measured with
+# tracemalloc in a separate run and counts Python allocations (the records),
+# not libxml2's tree.
+#
+#   python -m benchmarks.suite --output results.json
+#   python -m benchmarks.suite --compare results.json
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+# method, arguments, fixture file, paths (relative to the document root)
+# whose children are replicated when scaling; None for single-record
+# responses, which are only run at scale 1.
+
+
+class Case(NamedTuple):
+    method: str
+    args: Tuple
+    fixture: str
+    scale: Tuple[str, ...] = (".",)
+
+    @property
+    def streaming(self) -> bool:
+        return self.method.startswith("iter_")
+
+
+CASES = [
+    Case("agendas_by_committee_id", (121, 1), "agendas"),
+    Case("agendas_by_session_id", (121,), "agendas"),
+    Case("bill_info", (121, "HB2001"), "bill_info", ("BILL/SPONSORS", "BILL/DOCS")),
+    Case("bills_by_session_id", (121,), "bills"),
+    Case("updated_bills", (121, "2019-01-01"), "bills"),
+    Case("calendars_by_body", (121, "H"), "calendars"),
+    Case("calendars_by_id", (9000,), "calendar", ("CALENDAR",)),
+    Case("calendars_by_committee_id", (121, 1), "calendars"),
+    Case("calendars_by_session_id", (121,), "calendars"),
+    Case("committee_actions", (), "committee_actions"),
+    Case("committees_by_leg_body", (54, "H"), "committees", ("TYPE/BODY",)),
+    Case("committee_by_leg_id", (54, 1), "committee", None),
+    Case("committee_by_leg_type", (54, "S"), "committees", ("TYPE/BODY",)),
+    Case("committees_by_leg_type_body", (54, "H"), "committees", ("TYPE/BODY",)),
+    Case("committees_by_leg", (54,), "committees", ("TYPE/BODY",)),
+    Case(
+        "committee_members", (121, 1), "committee_members", ("BODY/COMMITTEE/MEMBERS",)
+    ),
+    Case("documents_by_bill_num", (121, "HB2001"), "documents"),
+    Case("documents_by_bill_num_doc_type", (121, "HB2001", "Bill"), "documents"),
+    Case("documents_by_doc_type", (121, "Bill"), "documents"),
+    Case("documents_by_session_id", (121,), "documents"),
+    Case("documents_from_date", (121, "2019-01-01"), "documents"),
+    Case("documents_from_date_to_date", (121, "2019-01-01", "2019-06-01"), "documents"),
+    Case("exe_nom_current_position_holder", (121, 12, 4), "nominee_position", None),
+    Case("exe_nom_by_id", (3001,), "nominee", None),
+    Case("exec_nom_agencies_and_positions", (0,), "agencies"),
+    Case("floor_votes_by_bill", (121, "HB2001"), "floor_votes"),
+    Case("floor_votes_by_bill_from_date", (121, "HB2001", "2019-01-01"), "floor_votes"),
+    Case("floor_votes_by_committee_id", (121, 1), "floor_votes"),
+    Case("floor_votes_by_session_id", (121,), "floor_votes"),
+    Case("floor_votes_from_date", (121, "2019-01-01"), "floor_votes"),
+    Case(
+        "floor_votes_from_date_to_date",
+        (121, "2019-01-01", "2019-06-01"),
+        "floor_votes",
+    ),
+    Case("bill_positions_by_date", ("2019-01-01", "2019-06-01"), "bill_positions"),
+    Case("bill_positions_by_session", (121,), "bill_positions"),
+    Case("bill_positions_by_session_from_date", (121, "2019-01-01"), "bill_positions"),
+    Case("member_by_id", (1700, 121), "member", None),
+    Case("members_by_session_id", (121,), "members"),
+    Case("sessions", (), "sessions"),
+    Case("session_by_id", (121,), "session", None),
+    Case("sponsored_bills", (121, 1700), "sponsored_bills", ("SPONSOR",)),
+    Case("standing_by_bill_num", (121, "HB2001"), "standings"),
+    Case("standing_vote_for_bill", (121, "HB2001"), "standing_votes"),
+    Case("videos_by_date", ("2019-01-14",), "videos"),
+    Case("videos_by_session", (121,), "videos"),
+    Case("iter_documents_by_session_id", (121,), "documents"),
+    Case("iter_floor_votes_by_session_id", (121,), "floor_votes"),
+    Case("iter_bill_positions_by_session", (121,), "bill_positions"),
+    Case("iter_videos_by_session", (121,), "videos"),
+]
+
+
+def load(fixture: str) -> etree._Element:
+    return etree.parse(os.path.join(FIXTURES, fixture + ".xml")).getroot()
+
+
+def scale(document: etree._Element, paths: Tuple[str, ...], factor: int):
+
+    document = copy.deepcopy(document)
+
+    for path in paths if factor > 1 else ():
+        for parent in [document] if path == "." else document.findall(path):
+            children = list(parent)
+
+            for _ in range(factor - 1):
+                parent.extend(copy.deepcopy(child) for child in children)
+
+    return document
+
+
+class FixtureResponse:
+    def __init__(self, content: bytes):
+        self.status_code = 200
+        self.content = content
+        self.raw = io.BytesIO(content)
+
+    def close(self):
+        pass
+
+
+# Serves one canned envelope for every operation, through the client's usual
+# _request/_retry path so instrumentation sees each phase.
+
+
+class FixtureClient(AzLegApiClient):
+    def __init__(self, payload: bytes, **kwargs):
+        self.payload = payload
+        self.parser = FastPath(None, None)
+        super().__init__("username", "password", coalesce=False, **kwargs)
+
+    def _call_service(self, operation: str, args: tuple):
+        return self._retry(operation, self._respond, ())
+
+    def _respond(self):
+        return self.parser.parse(FixtureResponse(self.payload))
+
+    def _post_raw(self, operation: str, args: tuple, stream: bool = False):
+        return FixtureResponse(self.payload)
+
+
+def run(case: Case, factor: int, rounds: int) -> Dict:
+
+    document = scale(load(case.fixture), case.scale or (), factor)
+    payload = envelope("Result", etree.tostring(document, encoding="unicode")).encode(
+        "utf-8"
+    )
+    calls = []
+    api = FixtureClient(payload, instrumentation=Instrumentation(hooks=[calls.append]))
+    method = getattr(api, case.method)
+
+    def once():
+        result = method(*case.args)
+
+        if case.streaming:
+            result = list(result)
+
+        return result
+
+    once()
+    best = None
+
+    for _ in range(rounds):
+        _parse.cache_clear()
+        calls.clear()
+        started = perf_counter()
+        once()
+        elapsed = perf_counter() - started
+
+        if best is None or elapsed < best[0]:
+            best = (elapsed, calls[-1])
+
+    _parse.cache_clear()
+    tracemalloc.start()
+
+    try:
+        once()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    seconds, call = best
+    elements = sum(1 for _ in document.iter())
+
+    return {
+        "method": case.method,
+        "scale": factor,
+        "records": call.records,
+        "elements": elements,
+        "response_bytes": len(payload),
+        "seconds": seconds,
+        "records_per_second": call.records / seconds if seconds else None,
+        "elements_per_second": elements / seconds if seconds else None,
+        "peak_bytes": peak,
+        "phases": {
+            "network": call.network,
+            "parse": call.parse,
+            "map": call.map,
+            "total": call.total,
+        },
+    }
+
+
+def commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(rounds: int, scales: List[int]) -> Dict:
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "lxml": lxml.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "rounds": rounds,
+        "scales": scales,
+    }
+
+
+def suite(scales: List[int], rounds: int, pattern: str = None) -> Dict:
+
+    results = []
+
+    for case in CASES:
+        if pattern is not None and pattern not in case.method:
+            continue
+
+        for factor in scales if case.scale is not None else [1]:
+            results.append(run(case, factor, rounds))
+
+    return {"meta": metadata(rounds, scales), "results": results}
+
+
+# Results slower than the baseline by more than tolerance (a fraction).
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float) -> List[Dict]:
+
+    previous = {
+        (result["method"], result["scale"]): result for result in baseline["results"]
+    }
+    regressions = []
+
+    for result in current["results"]:
+        before = previous.get((result["method"], result["scale"]))
+
+        if before is None or not before["seconds"]:
+            continue
+
+        ratio = result["seconds"] / before["seconds"]
+
+        if ratio > 1 + tolerance:
+            regressions.append(
+                {
+                    "method": result["method"],
+                    "scale": result["scale"],
+                    "baseline": before["seconds"],
+                    "seconds": result["seconds"],
+                    "ratio": ratio,
+                }
+            )
+
+    return regressions
+
+
+def report(results: Dict):
+
+    print(
+        "%-38s %5s %8s %10s %12s %9s %9s %9s"
+        % (
+            "method",
+            "scale",
+            "records",
+            "ms",
+            "elements/s",
+            "parse ms",
+            "map ms",
+            "peak KiB",
+        )
+    )
+
+    for result in results["results"]:
+        print(
+            "%-38s %5d %8d %10.2f %12.0f %9.2f %9.2f %9.0f"
+            % (
+                result["method"],
+                result["scale"],
+                result["records"],
+                result["seconds"] * 1000,
+                result["elements_per_second"] or 0,
+                result["phases"]["parse"] * 1000,
+                result["phases"]["map"] * 1000,
+                result["peak_bytes"] / 1024,
+            )
+        )
+
+
+def main(argv: List[str] = None) -> int:
+
+    parser = argparse.ArgumentParser(description="Offline client benchmarks.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--filter", help="only methods containing this string")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    options = parser.parse_args(argv)
+
+    results = suite(options.scales, options.rounds, options.filter)
+    report(results)
+
+    if options.output is not None:
+        with open(options.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if options.compare is not None:
+        with open(options.compare) as f:
+            regressions = compare(json.load(f), results, options.tolerance)
+
+        for regression in regressions:
+            print(
+                "REGRESSION %(method)s x%(scale)d: %(baseline).4fs -> "
+                "%(seconds).4fs (%(ratio).2fx)" % regression
+            )
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
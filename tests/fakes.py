@@ -0,0 +1,181 @@
+import asyncio
+import io
+
+import requests
+from lxml import etree
+
+from azlegapiclient import AzLegApiClient, AsyncAzLegApiClient
+
+# Stand-ins for the zeep client so tests run without the live service.
+# responses maps a SOAP operation name to either an XML string or a callable
+# taking the operation arguments and returning one.
+
+
+class FakeService:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def respond(self, operation, args):
+        self.calls.append((operation, args))
+        response = self.responses[operation]
+
+        if callable(response):
+            response = response(*args)
+
+        if isinstance(response, Exception):
+            raise response
+
+        return etree.fromstring(response)
+
+    def __getattr__(self, operation):
+        return lambda *args: self.respond(operation, args)
+
+
+class FakeAsyncService(FakeService):
+    def __getattr__(self, operation):
+        async def call(*args):
+            await asyncio.sleep(0)
+            return self.respond(operation, args)
+
+        return call
+
+
+# requests adapter that answers SOAP posts for the operations in
+# fixtures/legservice.wsdl with canned result documents.
+
+
+def envelope(operation, result):
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+        '<soap:Body><tns:%sResponse xmlns:tns="http://www.azleg.gov/">'
+        "<tns:%sResult>%s</tns:%sResult></tns:%sResponse></soap:Body></soap:Envelope>"
+        % (operation, operation, result, operation, operation)
+    )
+
+
+class FakeAdapter(requests.adapters.BaseAdapter):
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = responses
+        self.requests = []
+
+    def send(self, request, stream=False, **kwargs):
+        operation = request.headers["SOAPAction"].strip('"').rsplit("/", 1)[-1]
+        self.requests.append(request)
+
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "text/xml; charset=utf-8"
+        response.raw = io.BytesIO(
+            envelope(operation, self.responses[operation]).encode("utf-8")
+        )
+        response.request = request
+        response.url = request.url
+
+        return response
+
+    def close(self):
+        pass
+
+
+class FakeClient:
+    def __init__(self, service):
+        self.service = service
+
+
+class FakeApiClient(AzLegApiClient):
+    def __init__(self, responses, **kwargs):
+        self.responses = responses
+        super().__init__(username="username", password="password", **kwargs)
+
+    def _create_client(self, username, password):
+        return FakeClient(FakeService(self.responses))
+
+
+class FakeAsyncApiClient(AsyncAzLegApiClient):
+    def __init__(self, responses, **kwargs):
+        self.responses = responses
+        super().__init__(username="username", password="password", **kwargs)
+
+    def _create_client(self, username, password):
+        return FakeClient(FakeAsyncService(self.responses))
+
+    async def aclose(self):
+        pass
+
+
+SESSION = (
+    '<SESSIONS><SESSION Session_ID="121" '
+    'Session_Full_Name="Fifty-fourth Legislature - First Regular Session" '
+    'Legislature="54" Session="1R" Legislation_Year="2019"/></SESSIONS>'
+)
+
+
+def bill_info(session_id, bill_number):
+    return (
+        '<BILLS><BILL Session_ID="%s" Bill_Number="%s">'
+        "<Short_Title>Title</Short_Title><Last_Updated>2019-01-14T00:00:00</Last_Updated>"
+        '<SPONSORS><SPONSOR Display_Order="1" Type="P" Member_ID="1711" Member_Name="Smith"/>'
+        "</SPONSORS>"
+        '<DOCS><DOC Document_Type="Bill" Document_Format="PDF" Description="Introduced" '
+        'Last_Updated="2019-01-14T00:00:00" URL="https://example.org/hb.pdf"/></DOCS>'
+        "</BILL></BILLS>" % (session_id, bill_number)
+    )
+
+
+def bills(session_id, *bill_numbers, last_updated="2019-01-14T00:00:00"):
+    return '<BILLS SessionID="%s">%s</BILLS>' % (
+        session_id,
+        "".join(
+            "<BILL><Bill_Number>%s</Bill_Number><Initial_Title>t</Initial_Title>"
+            "<Current_Title>t</Current_Title><Last_Updated>%s</Last_Updated></BILL>"
+            % (bill_number, last_updated)
+            for bill_number in bill_numbers
+        ),
+    )
+
+
+def documents(session_id, bill_number):
+    return (
+        '<DOCUMENTS><DOCUMENT Item="1" Transaction_Type="Bill" Bill_Number="%s" '
+        'Document_Type="Bill" Document_Format="PDF" Description="Introduced" '
+        'URL="https://example.org/bill.pdf" Transaction_Date="2019-01-14T00:00:00"/>'
+        "</DOCUMENTS>" % bill_number
+    )
+
+
+def floor_votes(session_id, bill_number, *members):
+    return (
+        '<FLOORVOTES SessionID="%s"><TRAN ID="1" Type="F" Bill="%s" CmteID="1" '
+        'CmteName="House" CmteShortName="H" Referral="1" COW_Referral="0" '
+        'Action="Passed" Action_ID="1" ActionDate="2019-02-01T00:00:00" Comments="">'
+        "%s</TRAN></FLOORVOTES>"
+        % (
+            session_id,
+            bill_number,
+            "".join(
+                '<VOTE MemID="%s" MemName="Member %s" DisplayOrder="%s" Vote="Y"/>'
+                % (member, member, order)
+                for order, member in enumerate(members)
+            ),
+        )
+    )
+
+
+def members(session_id, *member_ids, party="R"):
+    return "<MEMBERS>%s</MEMBERS>" % "".join(
+        '<MEMBER Legislature="54" Member_ID="%s" Full_Name="Member %s" '
+        'Report_Name="Member %s" Body="H" District="1" Party="%s" Status="A" '
+        'Postition="" Email="" Phone="" Fax="" Maj_Leader="N" Min_Leader="N" '
+        'Maj_Whip="N" Min_Whip="N" Room=""/>' % (member_id, member_id, member_id, party)
+        for member_id in member_ids
+    )
+
+
+COMMITTEES = (
+    '<COMMITTEES legislature="54"><TYPE Committee_Type="S"><BODY Body="H">'
+    '<COMMITTEE Committee_ID="1" Committee_Name="House" Committee_Short_Name="H" '
+    'Sub_Committee="N"/></BODY></TYPE></COMMITTEES>'
+)
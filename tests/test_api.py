@@ -1,11 +1,28 @@
+import os
 import unittest
 from zeep import CachingClient
 from azlegapiclient.AzLegApiClient import AzLegApiClient
+from azlegapiclient.Cassette import CassetteTransport
+
+# Set AZLEG_CASSETTE to a directory to run against recorded responses, and
+# AZLEG_CASSETTE_MODE=record once with network access to record them.
+
+
+def transport():
+    path = os.environ.get("AZLEG_CASSETTE")
+
+    if path is None:
+        return None
+
+    return CassetteTransport(path, mode=os.environ.get("AZLEG_CASSETTE_MODE", "replay"))
+
 
 class TestApiClient(unittest.TestCase):
 
     def test_api_client(self):
-        api = AzLegApiClient(username="DHoover", password="B23da@d8s")
+        api = AzLegApiClient(
+            username="DHoover", password="B23da@d8s", transport=transport()
+        )
         self.assertIsInstance(api.client, CachingClient)
 
 
@@ -13,7 +30,9 @@ class TestSessionByID(unittest.TestCase):
     
     def setUp(self):
         
-        self.api = AzLegApiClient(username="DHoover", password="B23da@d8s")
+        self.api = AzLegApiClient(
+            username="DHoover", password="B23da@d8s", transport=transport()
+        )
 
 
     def test_session_by_id(self):
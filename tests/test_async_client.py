@@ -0,0 +1,145 @@
+import asyncio
+import unittest
+
+from lxml import etree
+
+from tests.fakes import (
+    COMMITTEES,
+    SESSION,
+    FakeApiClient,
+    FakeAsyncApiClient,
+    bill_info,
+    bills,
+    documents,
+    floor_votes,
+    members,
+)
+
+RESPONSES = {
+    "SessionsbyID": SESSION,
+    "BillsBySessionID": bills(121, "HB2001", "HB2002"),
+    "BillInfo": bill_info,
+    "MembersBySessionID": members(121, 1711, 1712),
+    "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711, 1712),
+    "FloorVotesByBill": lambda session_id, bill_number: floor_votes(
+        session_id, bill_number, 1711
+    ),
+    "DocumentsBySessionID": documents(121, "HB2001"),
+    "DocumentsByBillNum": documents,
+    "CommitteeByLegislature": COMMITTEES,
+}
+
+# Client methods and arguments answered by RESPONSES.
+
+CALLS = [
+    ("session_by_id", (121,)),
+    ("bills_by_session_id", (121,)),
+    ("bill_info", (121, "HB2002")),
+    ("members_by_session_id", (121,)),
+    ("floor_votes_by_session_id", (121,)),
+    ("floor_votes_by_bill", (121, "HB2002")),
+    ("documents_by_session_id", (121,)),
+    ("documents_by_bill_num", (121, "HB2002")),
+    ("committees_by_leg", (54,)),
+]
+
+
+class TestAsyncClient(unittest.TestCase):
+    def test_matches_sync_client(self):
+
+        api = FakeApiClient(RESPONSES)
+        async_api = FakeAsyncApiClient(RESPONSES)
+
+        async def run():
+            return await asyncio.gather(
+                *[getattr(async_api, method)(*args) for method, args in CALLS]
+            )
+
+        for (method, args), result in zip(CALLS, asyncio.run(run())):
+            with self.subTest(method=method):
+                self.assertTrue(result)
+                self.assertEqual(result, getattr(api, method)(*args))
+
+    def test_concurrency_limit(self):
+
+        running = []
+        peak = []
+
+        async def floor_votes_by_bill(session_id, bill_number):
+            running.append(bill_number)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(bill_number)
+            return etree.fromstring(floor_votes(session_id, bill_number, 1711))
+
+        async_api = FakeAsyncApiClient({}, max_concurrency=3)
+        async_api.client.service.FloorVotesByBill = floor_votes_by_bill
+
+        async def run():
+            return await asyncio.gather(
+                *[
+                    async_api.floor_votes_by_bill(121, "HB%d" % number)
+                    for number in range(10)
+                ]
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(max(peak), 3)
+        self.assertEqual(
+            [result["tran"][0]["bill"] for result in results],
+            ["HB%d" % number for number in range(10)],
+        )
+
+
+class TestParsers(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApiClient(
+            {
+                "FloorVotesFromDate": lambda session_id, start: floor_votes(
+                    session_id, "HB2001"
+                ),
+                "FloorVotesFromDateToDate": lambda session_id, start, end: floor_votes(
+                    session_id, "HB2001", 1711
+                ),
+                "AgendaBySessionID": "<AGENDAS/>",
+                "AgendaBySessionIDFromDate": "<AGENDAS/>",
+            }
+        )
+        self.service = self.api.client.service
+
+    def test_floor_votes_from_date(self):
+
+        result = self.api.floor_votes_from_date(121, "2019-01-01")
+        between = self.api.floor_votes_from_date_to_date(
+            121, "2019-01-01", "2019-03-01"
+        )
+
+        self.assertEqual(result["session_id"], "121")
+        self.assertEqual(between["tran"][0]["votes"][0]["member_id"], "1711")
+        self.assertEqual(
+            self.service.calls,
+            [
+                ("FloorVotesFromDate", (121, "2019-01-01")),
+                ("FloorVotesFromDateToDate", (121, "2019-01-01", "2019-03-01")),
+            ],
+        )
+
+    def test_agendas_by_session_id(self):
+
+        agendas = self.api.agendas_by_session_id(121)
+        self.api.agendas_by_session_id(121, "2019-01-01")
+
+        self.assertEqual(agendas.tag, "AGENDAS")
+
+        self.assertEqual(
+            self.service.calls,
+            [
+                ("AgendaBySessionID", (121,)),
+                ("AgendaBySessionIDFromDate", (121, "2019-01-01")),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import asyncio
+import unittest
+
+from tests.fakes import FakeApiClient, FakeAsyncApiClient, SESSION, bill_info
+
+
+def bill_info_or_error(session_id, bill_number):
+    if bill_number == "HB9999":
+        return ValueError("no such bill")
+
+    return bill_info(session_id, bill_number)
+
+
+class TestBillInfoMany(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApiClient({"BillInfo": bill_info_or_error})
+
+    def test_results_keyed_by_bill_number(self):
+
+        results = {
+            result.key: result
+            for result in self.api.bill_info_many(121, ["HB2001", "HB2002", "SB1001"])
+        }
+
+        self.assertEqual(set(results), {"HB2001", "HB2002", "SB1001"})
+        self.assertEqual(results["SB1001"].result["bill_number"], "SB1001")
+        self.assertIsNone(results["SB1001"].error)
+
+    def test_errors_are_collected(self):
+
+        results = {
+            result.key: result
+            for result in self.api.bill_info_many(121, ["HB2001", "HB9999"])
+        }
+
+        self.assertEqual(results["HB2001"].result["bill_number"], "HB2001")
+        self.assertIsNone(results["HB9999"].result)
+        self.assertIsInstance(results["HB9999"].error, ValueError)
+
+
+class TestAsyncClient(unittest.TestCase):
+    def test_gather(self):
+        async def run():
+            api = FakeAsyncApiClient({"SessionsbyID": SESSION}, max_concurrency=4)
+            return await asyncio.gather(*[api.session_by_id(121) for _ in range(20)])
+
+        sessions = asyncio.run(run())
+
+        self.assertEqual(len(sessions), 20)
+        self.assertEqual(sessions[0]["session_id"], "121")
+
+    def test_bill_info_many(self):
+        async def run():
+            api = FakeAsyncApiClient({"BillInfo": bill_info_or_error})
+            return [
+                result async for result in api.bill_info_many(121, ["HB2001", "HB9999"])
+            ]
+
+        results = {result.key: result for result in asyncio.run(run())}
+
+        self.assertEqual(results["HB2001"].result["bill_number"], "HB2001")
+        self.assertIsInstance(results["HB9999"].error, ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import time
+import unittest
+
+from lxml import etree
+
+from azlegapiclient.ResponseCache import ResponseCache, MemoryBackend, DiskBackend
+from tests.fakes import FakeApiClient, SESSION, bill_info
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApiClient(
+            {
+                "SessionsbyID": SESSION,
+                "BillInfo": bill_info,
+                "BillsUpdated": '<BILLS SessionID="121"/>',
+            },
+            cache=ResponseCache(MemoryBackend(maxsize=2)),
+        )
+
+    def calls(self):
+        return len(self.api.client.service.calls)
+
+    def test_hit(self):
+
+        first = self.api.session_by_id(121)
+        second = self.api.session_by_id(121)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls(), 1)
+        self.assertEqual(self.api.cache.stats()["hits"], 1)
+        self.assertEqual(self.api.cache.stats()["misses"], 1)
+
+    def test_keyed_by_arguments(self):
+
+        self.api.bill_info(121, "HB2001")
+        self.api.bill_info(121, "HB2002")
+
+        self.assertEqual(self.calls(), 2)
+
+    def test_lru_eviction(self):
+
+        self.api.bill_info(121, "HB2001")
+        self.api.bill_info(121, "HB2002")
+        self.api.bill_info(121, "HB2001")
+        self.api.bill_info(121, "HB2003")
+        self.api.bill_info(121, "HB2001")
+        self.api.bill_info(121, "HB2002")
+
+        self.assertEqual(self.calls(), 4)
+
+    def test_expiry(self):
+
+        self.api.cache.ttls["SessionsbyID"] = 0.01
+        self.api.session_by_id(121)
+        time.sleep(0.02)
+        self.api.session_by_id(121)
+
+        self.assertEqual(self.calls(), 2)
+
+    def test_zero_ttl_is_not_cached(self):
+
+        self.api.updated_bills(121, "2019-01-01")
+        self.api.updated_bills(121, "2019-01-01")
+
+        self.assertEqual(self.calls(), 2)
+
+
+class TestDiskBackend(unittest.TestCase):
+    def test_persists_between_clients(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "responses.db")
+
+            for _ in range(2):
+                api = FakeApiClient(
+                    {"SessionsbyID": SESSION}, cache=ResponseCache(DiskBackend(path))
+                )
+                session = api.session_by_id(121)
+
+            self.assertEqual(session["session_id"], "121")
+            self.assertEqual(api.client.service.calls, [])
+
+    def test_lru_eviction(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            backend = DiskBackend(os.path.join(directory, "responses.db"), maxsize=2)
+
+            for key in ["a", "b", "c"]:
+                backend.set(key, time.time() + 60, etree.Element(key))
+
+            self.assertEqual(len(backend), 2)
+            self.assertIsNone(backend.get("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
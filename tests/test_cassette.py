@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+
+from azlegapiclient.AzLegApiClient import AzLegApiClient
+from azlegapiclient.Cassette import (
+    AUTO,
+    RECORD,
+    REPLAY,
+    Cassette,
+    CassetteMiss,
+    CassetteTransport,
+)
+from azlegapiclient.ResponseCache import ResponseCache
+from tests.fakes import FakeAdapter, SESSION, documents, floor_votes
+
+FIXTURE_WSDL = os.path.join(os.path.dirname(__file__), "fixtures", "legservice.wsdl")
+
+
+class TestCassette(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cassette")
+        self.adapter = FakeAdapter(
+            {
+                "SessionsbyID": SESSION,
+                "DocumentsBySessionID": documents(121, "HB2001"),
+                "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711, 1712),
+            }
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def api(self, mode, fast=False, **kwargs):
+        return AzLegApiClient(
+            username="user",
+            password="password",
+            wsdl=FIXTURE_WSDL,
+            transport=CassetteTransport(
+                self.path,
+                mode=mode,
+                adapter=self.adapter,
+                cache_path=os.path.join(self.directory.name, "cache.db"),
+            ),
+            fast=fast,
+            **kwargs
+        )
+
+    def record(self):
+
+        api = self.api(RECORD)
+
+        return (
+            api.session_by_id(121),
+            api.documents_by_session_id(121),
+            list(api.iter_floor_votes_by_session_id(121)),
+        )
+
+    def test_replays_without_network(self):
+
+        recorded = self.record()
+        sent = len(self.adapter.requests)
+
+        for fast in (False, True):
+            api = self.api(REPLAY, fast=fast)
+
+            self.assertEqual(
+                (
+                    api.session_by_id(121),
+                    api.documents_by_session_id(121),
+                    list(api.iter_floor_votes_by_session_id(121)),
+                ),
+                recorded,
+            )
+
+        self.assertEqual(len(self.adapter.requests), sent)
+
+    def test_files(self):
+
+        self.record()
+
+        self.assertEqual(
+            sorted(Cassette(self.path)),
+            [
+                ("DocumentsBySessionID", ("121",)),
+                ("FloorVotesBySessionID", ("121",)),
+                ("SessionsbyID", ("121",)),
+            ],
+        )
+        self.assertTrue(
+            os.path.exists(os.path.join(self.path, "SessionsbyID(121).xml.gz"))
+        )
+
+    def test_filename_round_trip(self):
+
+        args = ("121", "HB2001", "2019-01-01T00:00:00", "a,b(c)", "")
+        filename = Cassette.filename("DocumentsFromDateToDate", args)
+
+        self.assertEqual(
+            Cassette.parse_filename(filename), ("DocumentsFromDateToDate", args)
+        )
+        self.assertEqual(Cassette.parse_filename("Sessions().xml.gz"), ("Sessions", ()))
+
+    def test_replay_miss(self):
+
+        with self.assertRaises(CassetteMiss):
+            self.api(REPLAY).session_by_id(121)
+
+        self.assertEqual(self.adapter.requests, [])
+
+    def test_auto_records_misses(self):
+
+        api = self.api(AUTO)
+        api.session_by_id(121)
+        api.session_by_id(121)
+
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_warm(self):
+
+        recorded = self.record()
+        cache = ResponseCache()
+
+        self.assertEqual(Cassette(self.path).warm(cache), 3)
+
+        api = self.api(REPLAY, cache=cache)
+        api.transport.cassette.get = None
+
+        self.assertEqual(api.session_by_id(121), recorded[0])
+        self.assertEqual(api.documents_by_session_id(121), recorded[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
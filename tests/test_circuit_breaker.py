@@ -0,0 +1,189 @@
+import asyncio
+import time
+import unittest
+
+from zeep.exceptions import Fault, TransportError
+
+from azlegapiclient import (
+    BreakerPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
+    ResponseCache,
+)
+from azlegapiclient.CircuitBreaker import CLOSED, HALF_OPEN, OPEN
+from azlegapiclient.PooledTransport import NO_RETRY
+from tests.fakes import SESSION, FakeApiClient, FakeAsyncApiClient
+
+POLICY = BreakerPolicy(failure_threshold=2, reset_timeout=30)
+UNAVAILABLE = TransportError(status_code=503)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.breaker = CircuitBreaker(POLICY, clock=self.clock)
+
+    def fail(self):
+        self.breaker.before("SessionsbyID")
+        self.breaker.record("SessionsbyID", UNAVAILABLE)
+
+    def test_opens_after_consecutive_failures(self):
+
+        self.fail()
+        self.breaker.record("SessionsbyID")
+        self.fail()
+        self.assertEqual(self.breaker.state("SessionsbyID"), CLOSED)
+
+        self.fail()
+        self.assertEqual(self.breaker.state("SessionsbyID"), OPEN)
+
+        with self.assertRaises(CircuitOpenError) as raised:
+            self.breaker.before("SessionsbyID")
+
+        self.assertEqual(raised.exception.retry_after, 30)
+
+    def test_faults_do_not_count(self):
+
+        for _ in range(3):
+            self.breaker.before("SessionsbyID")
+            self.breaker.record("SessionsbyID", Fault("Invalid session"))
+
+        self.assertEqual(self.breaker.state("SessionsbyID"), CLOSED)
+
+    def test_single_probe_after_reset_timeout(self):
+
+        self.fail()
+        self.fail()
+        self.clock.now = 30
+
+        self.breaker.before("SessionsbyID")
+        self.assertEqual(self.breaker.state("SessionsbyID"), HALF_OPEN)
+
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before("SessionsbyID")
+
+        self.breaker.record("SessionsbyID", UNAVAILABLE)
+        self.assertEqual(self.breaker.state("SessionsbyID"), OPEN)
+
+        self.clock.now = 60
+        self.breaker.before("SessionsbyID")
+        self.breaker.record("SessionsbyID")
+        self.assertEqual(self.breaker.state("SessionsbyID"), CLOSED)
+
+    def test_aborted_probe_reopens(self):
+
+        self.fail()
+        self.fail()
+        self.clock.now = 30
+
+        self.breaker.before("SessionsbyID")
+        self.breaker.abort("SessionsbyID")
+        self.breaker.before("SessionsbyID")
+
+        self.assertEqual(self.breaker.state("SessionsbyID"), HALF_OPEN)
+
+    def test_operations_without_policy_pass(self):
+
+        breaker = CircuitBreaker(policies={"FloorVotesBySessionID": POLICY})
+
+        for _ in range(3):
+            breaker.before("SessionsbyID")
+            breaker.record("SessionsbyID", UNAVAILABLE)
+
+        self.assertEqual(breaker.state("SessionsbyID"), CLOSED)
+
+
+class TestClientCircuitBreaker(unittest.TestCase):
+    def client(self, **kwargs):
+        return FakeApiClient(
+            {"SessionsbyID": SESSION},
+            retry_policy=NO_RETRY,
+            breaker_policy=POLICY,
+            **kwargs
+        )
+
+    def expire(self, cache):
+
+        key = ResponseCache.key("SessionsbyID", (121,))
+        cache.backend.set(key, time.time() - 1, cache.backend.get(key)[1])
+
+    def break_circuit(self, api):
+
+        api.client.service.responses["SessionsbyID"] = UNAVAILABLE
+
+        for _ in range(2):
+            with self.assertRaises(TransportError):
+                api.session_by_id(121)
+
+    def test_fails_fast_when_open(self):
+
+        api = self.client()
+        self.break_circuit(api)
+
+        with self.assertRaises(CircuitOpenError):
+            api.session_by_id(121)
+
+        self.assertEqual(len(api.client.service.calls), 2)
+        self.assertEqual(
+            api.circuit_breaker.stats()["operations"]["SessionsbyID"]["rejected"], 1
+        )
+
+    def test_serves_stale_cache_when_open(self):
+
+        cache = ResponseCache(ttls={"SessionsbyID": 60})
+        api = self.client(cache=cache)
+
+        api.session_by_id(121)
+        self.expire(cache)
+        self.break_circuit(api)
+
+        self.assertEqual(api.session_by_id(121)["session_id"], "121")
+        self.assertEqual(
+            api.circuit_breaker.stats()["operations"]["SessionsbyID"]["stale"], 1
+        )
+
+    def test_stale_disabled(self):
+
+        cache = ResponseCache(ttls={"SessionsbyID": 60})
+        api = self.client(
+            cache=cache,
+            breaker_policies={"SessionsbyID": POLICY._replace(serve_stale=False)},
+        )
+
+        api.session_by_id(121)
+        self.expire(cache)
+        self.break_circuit(api)
+
+        with self.assertRaises(CircuitOpenError):
+            api.session_by_id(121)
+
+    def test_async(self):
+
+        api = FakeAsyncApiClient(
+            {"SessionsbyID": UNAVAILABLE}, retry_policy=NO_RETRY, breaker_policy=POLICY
+        )
+
+        async def call():
+            try:
+                await api.session_by_id(121)
+            except Exception as error:
+                return type(error)
+
+        async def run():
+            return [await call() for _ in range(3)]
+
+        self.assertEqual(
+            asyncio.run(run()), [TransportError, TransportError, CircuitOpenError]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from lxml import etree
+
+from azlegapiclient.Extractors import (
+    CALENDAR_FIELDS,
+    compile_extractor,
+    compile_text_extractor,
+    extract_calendar_bill,
+)
+from tests.fakes import COMMITTEES, FakeApiClient, documents, floor_votes
+
+CALENDARS = (
+    '<CALENDARS><CALENDAR Cal_ID="1" Body="H" Cal_Time="9:00 AM">'
+    '<BILL Bill_Number="HB2001" Display_Order="1" Reconsidered="N"/>'
+    '<BILL Bill_Number="HB2002" Display_Order="2" Reconsidered="Y"/>'
+    "</CALENDAR></CALENDARS>"
+)
+
+
+class TestCompileExtractor(unittest.TestCase):
+    def test_fields_in_order_and_missing_attributes_are_none(self):
+
+        extract = compile_extractor((("id", "ID"), ("name", "Name")))
+
+        record = extract(etree.fromstring('<ROW ID="7"/>'))
+
+        self.assertEqual(list(record), ["id", "name"])
+        self.assertEqual(record, {"id": "7", "name": None})
+
+    def test_single_field(self):
+
+        extract = compile_extractor((("id", "ID"),))
+
+        self.assertEqual(extract(etree.fromstring('<ROW ID="7"/>')), {"id": "7"})
+        self.assertEqual(extract(etree.fromstring("<ROW/>")), {"id": None})
+
+    def test_children(self):
+
+        extract = compile_extractor(CALENDAR_FIELDS, ("bills", extract_calendar_bill))
+
+        calendar = extract(etree.fromstring(CALENDARS)[0])
+
+        self.assertEqual(calendar["calendar_time"], "9:00 AM")
+        self.assertEqual(
+            [bill["bill_number"] for bill in calendar["bills"]], ["HB2001", "HB2002"]
+        )
+
+    def test_text_fields(self):
+
+        extract = compile_text_extractor((("bill_number", "Bill_Number"),))
+
+        record = extract(
+            etree.fromstring("<BILL><Bill_Number>HB2001</Bill_Number></BILL>")
+        )
+
+        self.assertEqual(record, {"bill_number": "HB2001"})
+
+
+class TestParsers(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApiClient(
+            {
+                "CalendarsBySessionID": CALENDARS,
+                "CalendarsByBody": CALENDARS,
+                "DocumentsByBillNumFromDate": documents(121, "HB2001"),
+                "DocumentsBySessionID": documents(121, "HB2001"),
+                "FloorVotesFromDate": floor_votes(121, "HB2001", 1711),
+                "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711),
+                "CommitteeByLegislature": COMMITTEES,
+            }
+        )
+
+    def test_calendar_keys_agree_across_endpoints(self):
+
+        by_session = self.api.calendars_by_session_id(121)["calendars"]
+        by_body = self.api.calendars_by_body(121, "H")["calendars"]
+
+        self.assertEqual(by_session, by_body)
+        self.assertIn("calendar_time", by_session[0])
+
+    def test_document_keys_agree_across_endpoints(self):
+
+        from_date = self.api.documents_from_date(121, "2021-01-01")["documents"]
+        by_session = self.api.documents_by_session_id(121)["documents"]
+
+        self.assertEqual(from_date, by_session)
+        self.assertEqual(from_date[0]["bill_number"], "HB2001")
+
+    def test_floor_vote_keys_agree_across_endpoints(self):
+
+        self.assertEqual(
+            self.api.floor_votes_from_date(121, "2021-01-01"),
+            self.api.floor_votes_by_session_id(121),
+        )
+
+    def test_committees_carry_type_and_body(self):
+
+        committees = self.api.committees_by_leg(55)["committees"]
+
+        self.assertTrue(committees)
+        self.assertTrue(all(c["type"] and c["body"] for c in committees))
+
+
+if __name__ == "__main__":
+    unittest.main()
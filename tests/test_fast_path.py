@@ -0,0 +1,145 @@
+import asyncio
+import datetime
+import os
+import tempfile
+import unittest
+
+import requests
+from lxml import etree
+from zeep.exceptions import Fault
+
+from azlegapiclient import AsyncAzLegApiClient
+from azlegapiclient.AzLegApiClient import AzLegApiClient
+from azlegapiclient.PooledTransport import PooledTransport
+from azlegapiclient.StubServer import StubServer
+from tests.fakes import FakeAdapter, SESSION, documents, floor_votes
+
+FIXTURE_WSDL = os.path.join(os.path.dirname(__file__), "fixtures", "legservice.wsdl")
+
+
+class TestFastPath(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.adapter = FakeAdapter(
+            {
+                "SessionsbyID": SESSION,
+                "DocumentsBySessionID": documents(121, "HB2001"),
+                "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711, 1712),
+                "FloorVotesFromDate": floor_votes(121, "HB2001", 1711, 1712),
+            }
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def api(self, fast):
+
+        api = AzLegApiClient(
+            username="user",
+            password="p&ss<word>",
+            wsdl=FIXTURE_WSDL,
+            transport=PooledTransport(
+                cache_path=os.path.join(self.directory.name, "cache.db")
+            ),
+            fast=fast,
+        )
+        api.transport.session.mount("https://", self.adapter)
+
+        return api
+
+    def test_matches_zeep_path(self):
+
+        fast, slow = self.api(True), self.api(False)
+
+        self.assertEqual(fast.session_by_id(121), slow.session_by_id(121))
+        self.assertEqual(
+            fast.documents_by_session_id(121), slow.documents_by_session_id(121)
+        )
+        self.assertEqual(
+            fast.floor_votes_by_session_id(121), slow.floor_votes_by_session_id(121)
+        )
+
+    def test_envelope(self):
+
+        self.api(True).session_by_id(121)
+        body = self.adapter.requests[0].body
+
+        self.assertIn(b"<ns0:sessionID>121</ns0:sessionID>", body)
+        self.assertIn(b"p&amp;ss&lt;word&gt;</wsse:Password>", body)
+        self.assertEqual(
+            self.adapter.requests[0].headers["SOAPAction"],
+            '"http://www.azleg.gov/SessionsbyID"',
+        )
+
+    # The SOAP body of each request sent, as (tag, text) pairs.
+
+    def bodies(self):
+
+        bodies = []
+
+        for request in self.adapter.requests:
+            body = etree.fromstring(request.body).find(
+                "{http://schemas.xmlsoap.org/soap/envelope/}Body"
+            )
+            bodies.append([(node.tag, node.text) for node in body.iter()])
+
+        return bodies
+
+    def test_envelope_matches_zeep(self):
+
+        start_date = datetime.datetime(2019, 1, 1)
+
+        self.api(True).floor_votes_from_date(121, start_date)
+        self.api(False).floor_votes_from_date(121, start_date)
+
+        fast, slow = self.bodies()
+
+        self.assertEqual(fast, slow)
+        self.assertIn(("{http://www.azleg.gov/}startDate", "2019-01-01T00:00:00"), fast)
+
+    def test_fault(self):
+
+        response = requests.Response()
+        response.status_code = 500
+        response._content = (
+            b'<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+            b"<soap:Body><soap:Fault><faultcode>soap:Server</faultcode>"
+            b"<faultstring>Invalid session</faultstring></soap:Fault></soap:Body>"
+            b"</soap:Envelope>"
+        )
+
+        with self.assertRaises(Fault) as context:
+            self.api(True).fast_path.parse(response)
+
+        self.assertEqual(context.exception.message, "Invalid session")
+
+    def test_async_client(self):
+
+        with StubServer(bills=10, members=8) as stub:
+
+            async def run(fast):
+                async with AsyncAzLegApiClient(
+                    "username",
+                    "password",
+                    wsdl=stub.wsdl_url,
+                    cache_path=os.path.join(self.directory.name, "cache.db"),
+                    fast=fast,
+                ) as api:
+                    results = await asyncio.gather(
+                        api.session_by_id(121),
+                        api.floor_votes_by_bill(121, "HB2002"),
+                        api.documents_by_session_id(121),
+                    )
+
+                    return results, api._fast_path
+
+            (fast, fast_path), (slow, _) = asyncio.run(run(True)), asyncio.run(
+                run(False)
+            )
+
+        self.assertIsNotNone(fast_path)
+        self.assertEqual(fast, slow)
+
+
+if __name__ == "__main__":
+    unittest.main()
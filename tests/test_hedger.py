@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import unittest
+
+from zeep.exceptions import TransportError
+
+from azlegapiclient import HedgePolicy
+from azlegapiclient.PooledTransport import NO_RETRY, PooledTransport
+from tests.fakes import SESSION, FakeApiClient, FakeAsyncApiClient, bill_info
+
+POLICY = HedgePolicy(percentile=0.5, min_samples=2, min_delay=0.01)
+
+
+# SessionsbyID answers immediately except for the calls listed in slow, which
+# hang until released.
+
+
+class Responder:
+    def __init__(self, slow=(), response=SESSION):
+        self.slow = slow
+        self.response = response
+        self.count = 0
+        self.release = threading.Event()
+
+    def __call__(self, session_id):
+        self.count += 1
+
+        if self.count in self.slow:
+            self.release.wait(5)
+
+        return self.response
+
+
+class TestHedger(unittest.TestCase):
+    def client(self, responder, **kwargs):
+        api = FakeApiClient(
+            {"SessionsbyID": responder}, hedge_policy=POLICY, coalesce=False, **kwargs
+        )
+        self.addCleanup(responder.release.set)
+
+        return api
+
+    def test_slow_call_is_hedged(self):
+
+        responder = Responder(slow={3})
+        api = self.client(responder)
+
+        for _ in range(3):
+            self.assertEqual(api.session_by_id(121)["session_id"], "121")
+
+        self.assertEqual(responder.count, 4)
+        self.assertEqual(
+            api.hedger.stats()["operations"]["SessionsbyID"],
+            {"calls": 3, "hedged": 1, "hedge_wins": 1, "delay": POLICY.min_delay},
+        )
+
+    def test_not_hedged_before_min_samples(self):
+
+        responder = Responder()
+        api = self.client(responder)
+
+        api.session_by_id(121)
+
+        self.assertIsNone(api.hedger.delay("SessionsbyID"))
+        self.assertEqual(responder.count, 1)
+
+    def test_per_operation_policy(self):
+
+        api = FakeApiClient(
+            {"SessionsbyID": SESSION}, hedge_policies={"FloorVotesBySessionID": POLICY}
+        )
+
+        self.assertIsNone(api.hedger.policy("SessionsbyID"))
+        self.assertEqual(api.hedger.policy("FloorVotesBySessionID"), POLICY)
+
+    def test_pool_sized_from_concurrency(self):
+
+        api = self.client(Responder(), transport=PooledTransport(pool_maxsize=40))
+
+        self.assertEqual(api.hedger.max_workers, 80)
+
+        api.hedger.reserve(20)
+        self.assertEqual(api.hedger.max_workers, 80)
+
+        list(api.bill_info_many(121, [], max_workers=64))
+        self.assertEqual(api.hedger.max_workers, 128)
+
+    def test_bulk_calls_are_not_queued_behind_the_pool(self):
+
+        # Every call of the bulk run hangs until the last one has started, so
+        # the run only succeeds if all of them hold a hedger thread at once.
+
+        callers = 48
+        started = threading.Barrier(callers, timeout=5)
+
+        def respond(session_id, bill_number):
+            started.wait()
+            return bill_info(session_id, bill_number)
+
+        api = FakeApiClient(
+            {"BillInfo": respond}, hedge_policy=POLICY, retry_policy=NO_RETRY
+        )
+        api.hedger.record("BillInfo", 1)
+        api.hedger.record("BillInfo", 1)
+
+        results = list(
+            api.bill_info_many(
+                121, ["HB%d" % number for number in range(callers)], callers
+            )
+        )
+
+        self.assertEqual([result.error for result in results], [None] * callers)
+
+    def test_error_when_every_copy_fails(self):
+
+        responder = Responder(response=TransportError(status_code=503))
+        api = self.client(Responder(), retry_policy=NO_RETRY)
+        api.session_by_id(121)
+        api.session_by_id(121)
+        api.client.service.responses["SessionsbyID"] = responder
+
+        with self.assertRaises(TransportError):
+            api.session_by_id(121)
+
+    def test_async_loser_is_cancelled(self):
+
+        copies = []
+        cancelled = []
+
+        async def run():
+            api = FakeAsyncApiClient(
+                {"SessionsbyID": SESSION}, hedge_policy=POLICY, coalesce=False
+            )
+            service = api.client.service
+
+            await api.session_by_id(121)
+            await api.session_by_id(121)
+
+            # The first copy of the next call hangs; the hedge answers.
+
+            async def respond(session_id):
+                copies.append(session_id)
+
+                if len(copies) == 1:
+                    try:
+                        await asyncio.sleep(5)
+                    except asyncio.CancelledError:
+                        cancelled.append(session_id)
+                        raise
+
+                return await service.SessionsbyID(session_id)
+
+            api.client.service = type("Service", (), {"SessionsbyID": respond})
+            session = await api.session_by_id(121)
+
+            return session, api.hedger.stats()
+
+        session, stats = asyncio.run(run())
+
+        self.assertEqual(session["session_id"], "121")
+        self.assertEqual(copies, [121, 121])
+        self.assertEqual(cancelled, [121])
+        self.assertEqual(stats["operations"]["SessionsbyID"]["hedge_wins"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import asyncio
+import os
+import tempfile
+import unittest
+import urllib.request
+
+from azlegapiclient import Instrumentation, PrometheusExporter, ResponseCache
+from azlegapiclient.AzLegApiClient import AzLegApiClient
+from azlegapiclient.Instrumentation import Histogram
+from azlegapiclient.PooledTransport import PooledTransport
+from tests.fakes import (
+    SESSION,
+    FakeAdapter,
+    FakeAsyncApiClient,
+    documents,
+    envelope,
+    floor_votes,
+)
+
+FIXTURE_WSDL = os.path.join(os.path.dirname(__file__), "fixtures", "legservice.wsdl")
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.adapter = FakeAdapter(
+            {
+                "SessionsbyID": SESSION,
+                "DocumentsBySessionID": documents(121, "HB2001"),
+                "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711, 1712),
+            }
+        )
+        self.calls = []
+        self.instrumentation = Instrumentation(hooks=[self.calls.append])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def api(self, **kwargs):
+
+        api = AzLegApiClient(
+            username="username",
+            password="password",
+            wsdl=FIXTURE_WSDL,
+            transport=PooledTransport(
+                cache_path=os.path.join(self.directory.name, "cache.db")
+            ),
+            instrumentation=self.instrumentation,
+            **kwargs
+        )
+        api.transport.session.mount("https://", self.adapter)
+
+        return api
+
+    def assert_measured(self, call, operation, records):
+
+        self.assertEqual(call.operation, operation)
+        self.assertEqual(call.source, "service")
+        self.assertEqual(call.records, records)
+        self.assertEqual(call.attempts, 1)
+        self.assertGreater(call.bytes, 0)
+        self.assertGreater(call.network, 0)
+        self.assertGreater(call.parse, 0)
+        self.assertGreater(call.map, 0)
+        self.assertGreaterEqual(call.total, call.network + call.parse + call.map - 1e-6)
+        self.assertIsNone(call.error)
+
+    def test_zeep_path(self):
+
+        self.api().floor_votes_by_session_id(121)
+
+        self.assert_measured(self.calls[0], "FloorVotesBySessionID", 1)
+
+    def test_fast_path(self):
+
+        self.api(fast=True).documents_by_session_id(121)
+
+        self.assert_measured(self.calls[0], "DocumentsBySessionID", 1)
+        self.assertEqual(
+            self.calls[0].bytes,
+            len(envelope("DocumentsBySessionID", documents(121, "HB2001"))),
+        )
+
+    def test_stream(self):
+
+        records = list(self.api().iter_documents_by_session_id(121))
+
+        self.assertEqual(len(records), 1)
+        self.assert_measured(self.calls[0], "DocumentsBySessionID", 1)
+
+    def test_cache_hit(self):
+
+        api = self.api(cache=ResponseCache())
+        api.session_by_id(121)
+        api.session_by_id(121)
+
+        self.assertEqual([call.source for call in self.calls], ["service", "cache"])
+        self.assertEqual(self.calls[1].network, 0)
+        self.assertEqual(
+            self.instrumentation.calls,
+            {
+                ("SessionsbyID", "service", "ok"): 1,
+                ("SessionsbyID", "cache", "ok"): 1,
+            },
+        )
+
+    def test_error(self):
+
+        self.adapter.responses["SessionsbyID"] = "<not xml"
+
+        with self.assertRaises(Exception):
+            self.api(fast=True).session_by_id(121)
+
+        self.assertIsNotNone(self.calls[0].error)
+        self.assertEqual(
+            list(self.instrumentation.calls), [("SessionsbyID", "service", "error")]
+        )
+
+    def test_async(self):
+
+        instrumentation = Instrumentation()
+        api = FakeAsyncApiClient(
+            {"SessionsbyID": SESSION}, instrumentation=instrumentation
+        )
+
+        asyncio.run(api.session_by_id(121))
+
+        self.assertEqual(instrumentation.seconds[("SessionsbyID", "total")].count, 1)
+        self.assertEqual(instrumentation.records["SessionsbyID"].sum, 1)
+
+
+class TestPrometheusExporter(unittest.TestCase):
+    def test_histogram_buckets(self):
+
+        histogram = Histogram((1, 10))
+
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+
+        self.assertEqual(
+            list(histogram.cumulative()), [(1, 2), (10, 3), (float("inf"), 4)]
+        )
+
+    def test_render_and_serve(self):
+
+        instrumentation = Instrumentation()
+
+        with instrumentation.measure("SessionsbyID") as call:
+            call.records = 3
+
+        exporter = PrometheusExporter(instrumentation)
+        text = exporter.render()
+
+        self.assertIn("# TYPE azleg_call_seconds histogram", text)
+        self.assertIn(
+            'azleg_call_seconds_bucket{operation="SessionsbyID",phase="total",le="+Inf"} 1',
+            text,
+        )
+        self.assertIn('azleg_response_records_sum{operation="SessionsbyID"} 3.0', text)
+        self.assertIn(
+            'azleg_calls_total{operation="SessionsbyID",source="cache",outcome="ok"} 1',
+            text,
+        )
+
+        server = exporter.serve(port=0, host="127.0.0.1")
+        self.addCleanup(server.shutdown)
+
+        with urllib.request.urlopen(
+            "http://127.0.0.1:%d/metrics" % server.server_address[1]
+        ) as response:
+            self.assertEqual(response.read().decode("utf-8"), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from lxml import etree
+
+from azlegapiclient.LazyRecord import LazyRecord, attribute, getters, lazy_extractor
+from tests.fakes import FakeApiClient, bill_info, bills, documents, floor_votes
+
+NOMINEE = (
+    "<NOMINEES>"
+    '<NOMINEE NomineeId="7" FirstName="Ann" LastName="Lee" Party="I">'
+    '<NOMPOSITION NomineePositionId="70" ReceivedDate="2019-01-02T00:00:00" '
+    'CommitteeShortName="GOV"/>'
+    "</NOMINEE></NOMINEES>"
+)
+
+
+class TestLazyRecord(unittest.TestCase):
+    def test_decodes_on_first_access_only(self):
+
+        decoded = []
+
+        def decoder(value):
+            decoded.append(value)
+            return value.upper()
+
+        extract = lazy_extractor(
+            getters((("name", "Name", decoder), ("party", "Party", decoder)))
+        )
+        record = extract(etree.fromstring('<MEMBER Name="ann" Party="i"/>'))
+
+        self.assertEqual(decoded, [])
+        self.assertEqual(record["name"], "ANN")
+        self.assertEqual(record["name"], "ANN")
+        self.assertEqual(decoded, ["ann"])
+        self.assertEqual(dict(record), {"name": "ANN", "party": "I"})
+        self.assertEqual(decoded, ["ann", "i"])
+
+    def test_mapping(self):
+
+        record = LazyRecord(
+            etree.fromstring('<MEMBER Name="ann"/>'), {"name": attribute("Name")}
+        )
+
+        self.assertEqual(list(record), ["name"])
+        self.assertEqual(len(record), 1)
+        self.assertEqual(record.get("missing", "default"), "default")
+        self.assertEqual(record, {"name": "ann"})
+
+        with self.assertRaises(KeyError):
+            record["missing"]
+
+
+class TestLazyClient(unittest.TestCase):
+    def setUp(self):
+        responses = {
+            "BillInfo": bill_info,
+            "BillsBySessionID": bills(121, "HB2001", "HB2002"),
+            "DocumentsBySessionID": documents(121, "HB2001"),
+            "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711, 1712),
+            "ExeNomNomineeById": NOMINEE,
+        }
+        self.api = FakeApiClient(responses)
+        self.lazy = FakeApiClient(responses, lazy=True)
+
+    def test_lazy_records_match_eager(self):
+
+        for method, args in [
+            ("bill_info", (121, "HB2001")),
+            ("bills_by_session_id", (121,)),
+            ("documents_by_session_id", (121,)),
+            ("floor_votes_by_session_id", (121,)),
+            ("exe_nom_by_id", (7,)),
+        ]:
+            self.assertEqual(
+                getattr(self.lazy, method)(*args), getattr(self.api, method)(*args)
+            )
+
+    def test_returns_lazy_records(self):
+
+        bill = self.lazy.bill_info(121, "HB2001")
+
+        self.assertIsInstance(bill, LazyRecord)
+        self.assertEqual(bill["sponsors"][0]["member_id"], "1711")
+        self.assertEqual(self.lazy.exe_nom_by_id(7)["committee_short_name"], "GOV")
+
+    def test_typed_and_lazy_are_exclusive(self):
+
+        with self.assertRaises(ValueError):
+            FakeApiClient({}, typed=True, lazy=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+
+from azlegapiclient.SqliteMirror import SqliteMirror
+from tests.fakes import (
+    FakeApiClient,
+    COMMITTEES,
+    SESSION,
+    bill_info,
+    bills,
+    documents,
+    floor_votes,
+    members,
+)
+
+
+class TestSqliteMirror(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApiClient(
+            {
+                "SessionsbyID": SESSION,
+                "MembersBySessionID": members(121, 1711, 1712),
+                "CommitteeByLegislature": COMMITTEES,
+                "DocumentsBySessionID": documents(121, "HB2001"),
+                "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711, 1712),
+                "BillsBySessionID": bills(121, "HB2001", "HB2002"),
+                "BillInfo": self.bill_info,
+            }
+        )
+        self.mirror = SqliteMirror()
+        self.errors = self.mirror.mirror_session(self.api, 121)
+
+    def bill_info(self, session_id, bill_number):
+        if bill_number == "HB2003":
+            return ConnectionError()
+
+        return bill_info(session_id, bill_number)
+
+    def test_bill(self):
+
+        bill = self.mirror.bill(121, "HB2001")
+
+        self.assertEqual(bill["short_title"], "Title")
+        self.assertEqual(bill["sponsors"][0]["member_id"], 1711)
+
+    def test_bills_sponsored_by(self):
+
+        sponsored = self.mirror.bills_sponsored_by(1711, 121)
+
+        self.assertEqual(
+            sorted(bill["bill_number"] for bill in sponsored), ["HB2001", "HB2002"]
+        )
+
+    def test_votes(self):
+
+        self.assertEqual(
+            [vote["vote"] for vote in self.mirror.votes_by_member(121, 1712)], ["Y"]
+        )
+        self.assertEqual(
+            len(self.mirror.floor_votes_for_bill(121, "HB2001")[0]["votes"]), 2
+        )
+
+    def test_reload_replaces_rows(self):
+
+        self.mirror.mirror_session(self.api, 121)
+
+        self.assertEqual(len(self.mirror.documents_for_bill(121, "HB2001")), 1)
+        self.assertEqual(len(self.mirror.bill(121, "HB2001")["sponsors"]), 1)
+        self.assertEqual(len(self.mirror.members(121)), 2)
+
+    def test_partial_documents_keep_others(self):
+
+        document = self.api.documents_by_session_id(121)["documents"][0]
+        later = dict(document, item=2, url="https://example.org/amended.pdf")
+
+        self.mirror.load_documents(121, {"documents": [later]})
+        self.mirror.load_documents(
+            121, {"documents": [dict(document, description="Revised")]}
+        )
+
+        self.assertEqual(
+            [
+                (row["item"], row["description"])
+                for row in self.mirror.documents_for_bill(121, "HB2001")
+            ],
+            [(1, "Revised"), (2, "Introduced")],
+        )
+
+    def test_reports_bill_errors(self):
+
+        self.api.responses["BillsBySessionID"] = bills(121, "HB2001", "HB2003")
+        errors = SqliteMirror().mirror_session(self.api, 121)
+
+        self.assertEqual(self.errors, {})
+        self.assertEqual(list(errors), ["HB2003"])
+        self.assertIsInstance(errors["HB2003"], ConnectionError)
+
+    def test_typed_records(self):
+
+        api = FakeApiClient(self.api.responses, typed=True)
+        mirror = SqliteMirror()
+
+        self.assertEqual(mirror.mirror_session(api, 121), {})
+
+        for query in (
+            "SELECT * FROM documents",
+            "SELECT * FROM floor_transactions",
+            "SELECT * FROM votes",
+            "SELECT * FROM members",
+        ):
+            with self.subTest(query=query):
+                self.assertEqual(mirror.query(query), self.mirror.query(query))
+
+    def test_committee(self):
+        self.assertEqual(self.mirror.committee(54, 1)["committee_short_name"], "H")
+
+    def test_uses_indexes(self):
+
+        plan = self.mirror.query(
+            "EXPLAIN QUERY PLAN SELECT * FROM votes WHERE member_id = ? "
+            "AND session_id = ?",
+            (1711, 121),
+        )
+
+        self.assertIn("votes_member", plan[0]["detail"])
+
+
+if __name__ == "__main__":
+    unittest.main()
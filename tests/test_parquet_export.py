@@ -0,0 +1,112 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from azlegapiclient.AzLegApiClient import AzLegApiClient
+from azlegapiclient.ParquetExport import ParquetExport
+from azlegapiclient.PooledTransport import PooledTransport
+from tests.fakes import FakeAdapter, bills, documents, floor_votes
+
+FIXTURE_WSDL = os.path.join(os.path.dirname(__file__), "fixtures", "legservice.wsdl")
+
+POSITIONS = (
+    "<POSITIONS>"
+    '<POSITION First_Name="A" Last_name="B" BillNum="HB2001" Representing="Self" '
+    'Opinion="For" PosDate="2019-01-20T10:00:00"/>'
+    '<POSITION First_Name="C" Last_name="D" BillNum="HB2001" Representing="Self" '
+    'Opinion="Against" PosDate="2019-01-21T10:00:00"/>'
+    "</POSITIONS>"
+)
+
+
+class TestParquetExport(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        api = AzLegApiClient(
+            username="username",
+            password="password",
+            wsdl=FIXTURE_WSDL,
+            transport=PooledTransport(
+                cache_path=os.path.join(self.directory.name, "cache.db")
+            ),
+        )
+        self.adapter = FakeAdapter(
+            {
+                "BillsBySessionID": bills(121, "HB2001", "HB2002"),
+                "DocumentsBySessionID": documents(121, "HB2001"),
+                "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711, 1712, 1713),
+                "ForAgainstNeutralBySessionID": POSITIONS,
+            }
+        )
+        api.transport.session.mount("https://", self.adapter)
+        self.export = ParquetExport(api, self.directory.name, row_group_size=2)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_export_session(self):
+
+        results = self.export.export_session(121)
+
+        self.assertEqual(
+            {dataset: result.rows for dataset, result in results.items()},
+            {"bills": 2, "documents": 1, "floor_votes": 3, "bill_positions": 2},
+        )
+
+        for result in results.values():
+            self.assertTrue(os.path.exists(result.path))
+            self.assertFalse(os.path.exists(result.path + ".tmp"))
+
+    def test_floor_votes_one_row_per_vote(self):
+
+        table = pq.read_table(self.export.export(121, "floor_votes").path)
+
+        self.assertEqual(
+            table.column("member_id").to_pylist(), ["1711", "1712", "1713"]
+        )
+        self.assertEqual(table.column("bill").to_pylist(), ["HB2001"] * 3)
+        self.assertEqual(table.column("session_id").to_pylist(), [121] * 3)
+
+    def test_floor_transactions_without_votes(self):
+
+        self.adapter.responses["FloorVotesBySessionID"] = floor_votes(
+            121, "HB2001", 1711
+        ).replace(
+            "</FLOORVOTES>",
+            floor_votes(121, "HB2002")
+            .replace('<TRAN ID="1"', '<TRAN ID="2"')
+            .split(">", 1)[1],
+        )
+
+        table = pq.read_table(self.export.export(121, "floor_votes").path)
+
+        self.assertEqual(table.column("tran_id").to_pylist(), ["1", "2"])
+        self.assertEqual(table.column("bill").to_pylist(), ["HB2001", "HB2002"])
+        self.assertEqual(table.column("member_id").to_pylist(), ["1711", None])
+        self.assertEqual(table.column("vote").to_pylist(), ["Y", None])
+
+    def test_types(self):
+
+        table = pq.read_table(self.export.export(121, "floor_votes").path)
+
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("vote").type))
+        self.assertTrue(pa.types.is_timestamp(table.schema.field("action_date").type))
+        self.assertEqual(
+            table.column("action_date")[0].as_py(), datetime.datetime(2019, 2, 1)
+        )
+
+    def test_bounded_row_groups(self):
+
+        path = self.export.export(121, "floor_votes").path
+        metadata = pq.ParquetFile(path).metadata
+
+        self.assertEqual(metadata.num_row_groups, 2)
+        self.assertEqual(metadata.row_group(0).num_rows, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import asyncio
+import unittest
+from functools import partial
+
+from azlegapiclient import QueryPlanner, ResponseCache
+from azlegapiclient.StubServer import StubServer
+
+from tests.fakes import FakeApiClient, FakeAsyncApiClient
+
+SCALE = dict(bills=20, members=12, roll_calls_per_bill=2, votes_per_roll_call=10)
+
+
+def call(stub, operation, *args):
+    return stub.call(operation, args)
+
+
+def responses(stub):
+    return {
+        operation: partial(call, stub, operation)
+        for operation in (
+            "FloorVotesBySessionID",
+            "FloorVotesByBill",
+            "FloorVotesByCommID",
+            "DocumentsBySessionID",
+            "DocumentsByBillNum",
+            "DocumentsByBillNumDocType",
+        )
+    }
+
+
+def without_source(result):
+    return {key: value for key, value in result.items() if key != "source"}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestQueryPlanner(unittest.TestCase):
+    def setUp(self):
+        self.stub = StubServer(sessions=(121, 122), **SCALE)
+        self.clock = Clock()
+        self.planner = QueryPlanner(max_age=60, clock=self.clock)
+        self.api = FakeApiClient(responses(self.stub), planner=self.planner)
+        self.service = self.api.client.service
+
+    def narrow_calls(self):
+        return [
+            operation
+            for operation, _ in self.service.calls
+            if operation not in ("FloorVotesBySessionID", "DocumentsBySessionID")
+        ]
+
+    def test_network_until_session_wide(self):
+
+        result = self.api.floor_votes_by_bill(121, "HB2002")
+
+        self.assertEqual(result["source"], "network")
+        self.assertEqual(len(result["tran"]), 2)
+        self.assertEqual(self.narrow_calls(), ["FloorVotesByBill"])
+
+    def test_derived_matches_network(self):
+
+        plain = FakeApiClient(responses(self.stub))
+        committee_id = plain.floor_votes_by_session_id(121)["tran"][0]["cmte_id"]
+        calls = [
+            ("floor_votes_by_bill", (121, "HB2002")),
+            ("floor_votes_by_bill", (121, "HB9999")),
+            ("floor_votes_by_committee_id", (121, int(committee_id))),
+            ("documents_by_bill_num", (121, "HB2003")),
+            ("documents_by_bill_num_doc_type", (121, "HB2003", "Bill")),
+        ]
+
+        self.api.floor_votes_by_session_id(121)
+        self.api.documents_by_session_id(121)
+
+        for method, args in calls:
+            result = getattr(self.api, method)(*args)
+
+            self.assertEqual(result["source"], "derived")
+            self.assertEqual(without_source(result), getattr(plain, method)(*args))
+
+        self.assertEqual(self.narrow_calls(), [])
+        self.assertEqual(self.planner.stats()["derived"], 5)
+
+    def test_expiry(self):
+
+        self.api.floor_votes_by_session_id(121)
+        self.clock.now = 30
+
+        self.assertEqual(
+            self.api.floor_votes_by_bill(121, "HB2002")["source"], "derived"
+        )
+
+        self.clock.now = 61
+
+        self.assertEqual(
+            self.api.floor_votes_by_bill(121, "HB2002")["source"], "network"
+        )
+        self.assertEqual(self.narrow_calls(), ["FloorVotesByBill"])
+
+    def test_other_session(self):
+
+        self.api.floor_votes_by_session_id(121)
+
+        self.assertEqual(
+            self.api.floor_votes_by_bill(122, "HB2002")["source"], "network"
+        )
+
+    def test_cache_hits_are_not_observed(self):
+
+        cache = ResponseCache()
+        warm = FakeApiClient(responses(self.stub), cache=cache)
+        warm.floor_votes_by_session_id(121)
+
+        api = FakeApiClient(responses(self.stub), cache=cache, planner=self.planner)
+        api.floor_votes_by_session_id(121)
+
+        self.assertEqual(api.floor_votes_by_bill(121, "HB2002")["source"], "network")
+
+    def test_async_client(self):
+
+        api = FakeAsyncApiClient(responses(self.stub), planner=self.planner)
+
+        async def run():
+            await api.floor_votes_by_session_id(121)
+            return await asyncio.gather(
+                api.floor_votes_by_bill(121, "HB2002"),
+                api.documents_by_bill_num(121, "HB2002"),
+            )
+
+        votes, documents = asyncio.run(run())
+
+        self.assertEqual(votes["source"], "derived")
+        self.assertEqual(len(votes["tran"]), 2)
+        self.assertEqual(documents["source"], "network")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from azlegapiclient import Calendar, Document, FloorTransaction, Member, Vote
+from azlegapiclient.Extractors import compile_extractor
+from tests.fakes import FakeApiClient, documents, floor_votes, members
+from tests.test_extractors import CALENDARS
+
+
+def as_dict(record):
+    return {
+        key: [as_dict(child) for child in value] if isinstance(value, list) else value
+        for key, value in record._asdict().items()
+    }
+
+
+class TestTypedRecords(unittest.TestCase):
+    def setUp(self):
+        responses = {
+            "CalendarsBySessionID": CALENDARS,
+            "DocumentsBySessionID": documents(121, "HB2001"),
+            "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711, 1712),
+            "MembersBySessionID": members(121, 1711, 1712),
+        }
+        self.api = FakeApiClient(responses)
+        self.typed = FakeApiClient(responses, typed=True)
+
+    def test_typed_records_match_dicts(self):
+
+        for method, key in [
+            ("calendars_by_session_id", "calendars"),
+            ("documents_by_session_id", "documents"),
+            ("floor_votes_by_session_id", "tran"),
+            ("members_by_session_id", "members"),
+        ]:
+            plain = getattr(self.api, method)(121)[key]
+            typed = getattr(self.typed, method)(121)[key]
+
+            self.assertEqual([as_dict(record) for record in typed], plain)
+
+    def test_record_types(self):
+
+        calendar = self.typed.calendars_by_session_id(121)["calendars"][0]
+        document = self.typed.documents_by_session_id(121)["documents"][0]
+        tran = self.typed.floor_votes_by_session_id(121)["tran"][0]
+        member = self.typed.members_by_session_id(121)["members"][0]
+
+        self.assertIsInstance(calendar, Calendar)
+        self.assertEqual(calendar.bills[0].bill_number, "HB2001")
+        self.assertIsInstance(document, Document)
+        self.assertIsInstance(tran, FloorTransaction)
+        self.assertIsInstance(tran.votes[0], Vote)
+        self.assertEqual([vote.member_id for vote in tran.votes], ["1711", "1712"])
+        self.assertIsInstance(member, Member)
+
+    def test_schema_mismatch_is_rejected(self):
+
+        with self.assertRaises(ValueError):
+            compile_extractor((("member_id", "MemID"),), record=Vote)
+
+
+if __name__ == "__main__":
+    unittest.main()
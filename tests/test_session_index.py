@@ -0,0 +1,136 @@
+import datetime
+import unittest
+
+from azlegapiclient.SessionIndex import SessionIndex
+from azlegapiclient.StubServer import SyntheticSession
+from tests.fakes import FakeApiClient
+
+SESSION = SyntheticSession(bills=40, members=20, votes_per_roll_call=12)
+
+
+class TestSessionIndex(unittest.TestCase):
+    def setUp(self):
+
+        self.results = {}
+
+        for typed in (False, True):
+            api = FakeApiClient(
+                {
+                    "FloorVotesBySessionID": SESSION.floor_votes_by_session_id(),
+                    "DocumentsBySessionID": SESSION.documents_by_session_id(),
+                },
+                typed=typed,
+            )
+            self.results[typed] = (
+                api.floor_votes_by_session_id(121)["tran"],
+                api.documents_by_session_id(121)["documents"],
+            )
+
+    def index(self, typed=False):
+
+        transactions, documents = self.results[typed]
+        index = SessionIndex()
+        index.add_roll_calls(transactions)
+        index.add_documents(documents)
+
+        return index
+
+    def test_matches_scans(self):
+
+        transactions, documents = self.results[False]
+        index = self.index()
+
+        self.assertEqual(
+            index.roll_calls_for_bill("HB2002"),
+            [tran for tran in transactions if tran["bill"] == "HB2002"],
+        )
+        self.assertEqual(
+            index.roll_calls_for_committee(3),
+            [tran for tran in transactions if tran["cmte_id"] == "3"],
+        )
+        self.assertEqual(
+            index.documents_for_bill("HB2002", "Bill"),
+            [
+                document
+                for document in documents
+                if document["bill_number"] == "HB2002"
+                and document["document_type"] == "Bill"
+            ],
+        )
+        self.assertEqual(
+            index.votes_for_member(1705),
+            [
+                (tran, vote)
+                for tran in transactions
+                for vote in tran["votes"]
+                if vote["member_id"] == "1705"
+            ],
+        )
+
+    def test_day_buckets(self):
+
+        transactions, documents = self.results[False]
+        index = self.index()
+        start, end = datetime.date(2019, 2, 1), datetime.date(2019, 2, 28)
+
+        self.assertEqual(
+            sorted(map(id, index.roll_calls_between(start, end))),
+            sorted(
+                id(tran)
+                for tran in transactions
+                if start <= tran["action_date"].date() <= end
+            ),
+        )
+        self.assertEqual(
+            len(index.documents_between(start, end)),
+            sum(
+                start <= document["transaction_date"].date() <= end
+                for document in documents
+            ),
+        )
+
+    def test_typed_records(self):
+
+        index = self.index(typed=True)
+        roll_call, vote = index.votes_for_member("1705")[0]
+
+        self.assertEqual(vote.member_id, "1705")
+        self.assertIn(vote, roll_call.votes)
+        self.assertEqual(
+            [tran.bill for tran in index.roll_calls_for_bill("SB2001")], ["SB2001"] * 2
+        )
+
+    def test_incremental_insert(self):
+
+        transactions, documents = self.results[False]
+        index = SessionIndex()
+
+        self.assertEqual(index.add_roll_calls(transactions[:10]), 10)
+        self.assertEqual(index.add_roll_calls(transactions), len(transactions) - 10)
+        self.assertEqual(index.add_documents(documents + documents), len(documents))
+        self.assertEqual(
+            index.stats(),
+            {
+                "documents": len(documents),
+                "roll_calls": len(transactions),
+                "votes": 12 * len(transactions),
+                "bills": 40,
+                "members": 20,
+                "committees": len({tran["cmte_id"] for tran in transactions}),
+                "days": len(
+                    {tran["action_date"].date() for tran in transactions}
+                    | {document["transaction_date"].date() for document in documents}
+                ),
+            },
+        )
+
+    def test_missing_keys(self):
+
+        index = self.index()
+
+        self.assertEqual(index.roll_calls_for_bill("HB9999"), [])
+        self.assertEqual(index.votes_for_member(1), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from lxml import etree
+
+from tests.fakes import SESSION, FakeApiClient, FakeAsyncApiClient
+
+CALLERS = 10
+
+
+class TestSingleFlight(unittest.TestCase):
+    def client(self, response=SESSION, **kwargs):
+
+        # The first call holds until every caller has arrived, so all of them
+        # overlap with it.
+
+        def respond(session_id):
+            deadline = time.monotonic() + 5
+
+            while (
+                api.single_flight is not None
+                and api.single_flight.stats()["calls"] < CALLERS
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.001)
+
+            return response
+
+        api = FakeApiClient({"SessionsbyID": respond}, coalesce=True, **kwargs)
+
+        return api
+
+    def call_concurrently(self, function):
+
+        with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+            futures = [executor.submit(function) for _ in range(CALLERS)]
+
+        return futures
+
+    def test_concurrent_calls_share_one_request(self):
+
+        api = self.client()
+
+        futures = self.call_concurrently(lambda: api.session_by_id(121))
+
+        self.assertEqual(len(api.client.service.calls), 1)
+        self.assertEqual(
+            [future.result()["session_id"] for future in futures], ["121"] * CALLERS
+        )
+        self.assertEqual(api.single_flight.stats()["coalesced"], CALLERS - 1)
+        self.assertEqual(
+            api.single_flight.stats()["operations"]["SessionsbyID"],
+            {"calls": CALLERS, "coalesced": CALLERS - 1},
+        )
+
+    def test_errors_are_shared(self):
+
+        api = self.client(response=ValueError("boom"))
+
+        futures = self.call_concurrently(lambda: api.session_by_id(121))
+
+        self.assertEqual(len(api.client.service.calls), 1)
+
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result()
+
+    def test_later_calls_are_not_coalesced(self):
+
+        api = FakeApiClient({"SessionsbyID": SESSION}, coalesce=True)
+
+        api.session_by_id(121)
+        api.session_by_id(121)
+
+        self.assertEqual(len(api.client.service.calls), 2)
+        self.assertEqual(api.single_flight.stats()["coalesced"], 0)
+
+    def test_off_by_default(self):
+
+        api = FakeApiClient({"SessionsbyID": SESSION})
+
+        self.call_concurrently(lambda: api.session_by_id(121))
+
+        self.assertIsNone(api.single_flight)
+        self.assertEqual(len(api.client.service.calls), CALLERS)
+
+
+class TestAsyncSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_one_request(self):
+
+        api = FakeAsyncApiClient({"SessionsbyID": SESSION}, coalesce=True)
+
+        async def run():
+            return await asyncio.gather(
+                *[api.session_by_id(121) for _ in range(CALLERS)]
+            )
+
+        sessions = asyncio.run(run())
+
+        self.assertEqual(
+            [session["session_id"] for session in sessions], ["121"] * CALLERS
+        )
+        self.assertEqual(len(api.client.service.calls), 1)
+        self.assertEqual(api.single_flight.stats()["coalesced"], CALLERS - 1)
+
+    def test_cancelled_waiter_does_not_cancel_call(self):
+
+        api = FakeAsyncApiClient({"SessionsbyID": SESSION}, coalesce=True)
+
+        async def run():
+            leader = asyncio.ensure_future(api.session_by_id(121))
+            waiter = asyncio.ensure_future(api.session_by_id(121))
+            await asyncio.sleep(0)
+            waiter.cancel()
+
+            return await leader
+
+        self.assertEqual(asyncio.run(run())["session_id"], "121")
+
+    def test_cancelled_leader_does_not_cancel_call(self):
+
+        api = FakeAsyncApiClient({}, coalesce=True)
+        calls = []
+
+        async def sessions_by_id(session_id):
+            calls.append(session_id)
+            await asyncio.sleep(0.01)
+            return etree.fromstring(SESSION)
+
+        api.client.service.SessionsbyID = sessions_by_id
+
+        async def run():
+            leader = asyncio.ensure_future(api.session_by_id(121))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(api.session_by_id(121))
+            await asyncio.sleep(0)
+            leader.cancel()
+
+            return leader, await waiter
+
+        leader, session = asyncio.run(run())
+
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(session["session_id"], "121")
+        self.assertEqual(calls, [121])
+        self.assertEqual(api.single_flight.stats()["coalesced"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
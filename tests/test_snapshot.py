@@ -0,0 +1,120 @@
+import asyncio
+import collections
+import os
+import tempfile
+import time
+import unittest
+
+from azlegapiclient import AsyncAzLegApiClient, AzLegApiClient, SessionSnapshot
+from azlegapiclient.PooledTransport import PooledTransport
+from azlegapiclient.SessionSnapshot import SNAPSHOT_CALLS
+from azlegapiclient.StubServer import StubServer
+from tests.fakes import FakeApiClient
+
+SCALE = dict(bills=20, members=12, roll_calls_per_bill=2, votes_per_roll_call=10)
+
+
+class TestSessionSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def api(self, stub, **kwargs):
+        return AzLegApiClient(
+            "username",
+            "password",
+            wsdl=stub.wsdl_url,
+            transport=PooledTransport(
+                cache_path=os.path.join(self.directory.name, "cache.db")
+            ),
+            fast=True,
+            **kwargs
+        )
+
+    def check(self, snapshot: SessionSnapshot):
+
+        bill = snapshot.bills["HB2002"]
+        roll_call = bill.roll_calls[0]
+        vote = roll_call.votes[0]
+
+        self.assertEqual(snapshot.session["session_id"], "121")
+        self.assertEqual(len(snapshot.bills), 20)
+        self.assertEqual(len(snapshot.members), 12)
+        self.assertEqual(len(snapshot.roll_calls), 40)
+        self.assertEqual(len(snapshot.votes()), 400)
+        self.assertEqual(len(bill.roll_calls), 2)
+        self.assertIs(roll_call.bill, bill)
+        self.assertIs(vote.roll_call, roll_call)
+        self.assertIs(vote.member, snapshot.members[vote.member_id])
+        self.assertIn(vote, vote.member.votes)
+        self.assertIn(roll_call, roll_call.committee.roll_calls)
+        self.assertIs(snapshot.committees[roll_call.cmte_id], roll_call.committee)
+        self.assertEqual(len(bill.documents), 4)
+        self.assertTrue(all(document.bill is bill for document in bill.documents))
+        self.assertTrue(all(position.bill is bill for position in bill.positions))
+        self.assertTrue(
+            all(
+                entry.bill is snapshot.bills[entry.bill_number]
+                and entry in entry.bill.calendar_entries
+                for calendar in snapshot.calendars
+                for entry in calendar.entries
+            )
+        )
+
+    def test_links(self):
+
+        with StubServer(**SCALE) as stub:
+            self.check(self.api(stub).snapshot_session(121))
+
+    def test_typed_records(self):
+
+        with StubServer(**SCALE) as stub:
+            snapshot = self.api(stub, typed=True).snapshot_session(121, 54)
+
+        self.check(snapshot)
+        self.assertEqual(snapshot.members["1700"].full_name, "John Smith")
+
+    def test_calls_run_concurrently(self):
+
+        with StubServer(latency=0.2, **SCALE) as stub:
+            api = self.api(stub)
+            api.sessions()
+            api.snapshot_session(121)
+
+        # committees_by_leg waits for session_by_id; every other call overlaps.
+
+        self.assertEqual(stub.requests, 9)
+        self.assertEqual(stub.peak, len(SNAPSHOT_CALLS) + 1)
+
+    def test_first_failure_is_raised(self):
+
+        def slow(*args):
+            time.sleep(0.3)
+            return ValueError("slow")
+
+        responses = collections.defaultdict(lambda: slow)
+        responses["MembersBySessionID"] = RuntimeError("fast")
+
+        with self.assertRaises(RuntimeError):
+            FakeApiClient(responses).snapshot_session(121, 54)
+
+    def test_async(self):
+
+        with StubServer(**SCALE) as stub:
+
+            async def run():
+                async with AsyncAzLegApiClient(
+                    "username",
+                    "password",
+                    wsdl=stub.wsdl_url,
+                    cache_path=os.path.join(self.directory.name, "cache.db"),
+                ) as api:
+                    return await api.snapshot_session(121)
+
+            self.check(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+
+from azlegapiclient import AsyncAzLegApiClient, Instrumentation
+from azlegapiclient.AzLegApiClient import AzLegApiClient
+from azlegapiclient.Extractors import extract_document
+from azlegapiclient.PooledTransport import PooledTransport
+from azlegapiclient.StubServer import StubServer
+from tests.fakes import FakeAdapter, documents, envelope, floor_votes
+
+FIXTURE_WSDL = os.path.join(os.path.dirname(__file__), "fixtures", "legservice.wsdl")
+
+
+class TestIterRecords(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.adapter = FakeAdapter(
+            {
+                "DocumentsBySessionID": documents(121, "HB2001"),
+                "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711, 1712),
+            }
+        )
+        self.api = AzLegApiClient(
+            username="username",
+            password="password",
+            wsdl=FIXTURE_WSDL,
+            transport=PooledTransport(
+                cache_path=os.path.join(self.directory.name, "cache.db")
+            ),
+        )
+        self.api.transport.session.mount("https://", self.adapter)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_matches_list_method(self):
+
+        self.assertEqual(
+            list(self.api.iter_documents_by_session_id(121)),
+            self.api.documents_by_session_id(121)["documents"],
+        )
+        self.assertEqual(
+            list(self.api.iter_floor_votes_by_session_id(121)),
+            self.api.floor_votes_by_session_id(121)["tran"],
+        )
+
+    def test_sends_wsse_header(self):
+
+        list(self.api.iter_documents_by_session_id(121))
+
+        self.assertIn(b"UsernameToken", self.adapter.requests[0].body)
+
+    def test_clears_consumed_records(self):
+
+        records = "".join(
+            '<DOCUMENT Item="%d" Bill_Number="HB%d"/>' % (item, item)
+            for item in range(10000)
+        )
+        stream = io.BytesIO(
+            envelope(
+                "DocumentsBySessionID", "<DOCUMENTS>%s</DOCUMENTS>" % records
+            ).encode("utf-8")
+        )
+        siblings = []
+
+        def mapper(element):
+            siblings.append(len(list(element.itersiblings(preceding=True))))
+            return extract_document(element)
+
+        documents = list(self.api._iter_stream(stream, mapper))
+
+        self.assertEqual(len(documents), 10000)
+        self.assertEqual(documents[-1]["bill_number"], "HB9999")
+        self.assertLessEqual(max(siblings), 1)
+
+
+class TestAsyncIterRecords(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_matches_list_method(self):
+
+        instrumentation = Instrumentation()
+
+        with StubServer(bills=30, members=10, votes_per_roll_call=8) as stub:
+
+            async def run(**kwargs):
+                async with AsyncAzLegApiClient(
+                    "username",
+                    "password",
+                    wsdl=stub.wsdl_url,
+                    cache_path=os.path.join(self.directory.name, "cache.db"),
+                    **kwargs
+                ) as api:
+                    return (
+                        [r async for r in api.iter_documents_by_session_id(121)],
+                        (await api.documents_by_session_id(121))["documents"],
+                        [r async for r in api.iter_floor_votes_by_session_id(121)],
+                        (await api.floor_votes_by_session_id(121))["tran"],
+                    )
+
+            for kwargs in ({}, {"instrumentation": instrumentation}):
+                streamed, documents, streamed_votes, votes = asyncio.run(run(**kwargs))
+
+                self.assertEqual(len(streamed), 120)
+                self.assertEqual(streamed, documents)
+                self.assertEqual(streamed_votes, votes)
+
+        self.assertEqual(
+            instrumentation.calls[("DocumentsBySessionID", "service", "ok")], 2
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
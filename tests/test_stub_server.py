@@ -0,0 +1,171 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from zeep.exceptions import Fault, TransportError
+
+from azlegapiclient import AsyncAzLegApiClient, AzLegApiClient
+from azlegapiclient.PooledTransport import NO_RETRY, PooledTransport
+from azlegapiclient.StubServer import StubServer, SyntheticSession
+
+SCALE = dict(bills=30, members=20, roll_calls_per_bill=2, votes_per_roll_call=15)
+
+
+def request(session_id):
+    return (
+        '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+        "<soap:Body><SessionsbyID><sessionID>%d</sessionID></SessionsbyID>"
+        "</soap:Body></soap:Envelope>" % session_id
+    ).encode("utf-8")
+
+
+class TestSyntheticSession(unittest.TestCase):
+    def test_scale(self):
+
+        session = SyntheticSession(documents_per_bill=3, **SCALE)
+        transactions = [
+            transaction
+            for bill in session.bills
+            for transaction in bill["transactions"]
+        ]
+
+        self.assertEqual(len(session.bills), 30)
+        self.assertEqual(len(session.members), 20)
+        self.assertEqual(len(transactions), 60)
+        self.assertTrue(all(len(votes) == 15 for _, votes in transactions))
+        self.assertEqual(sum(len(bill["documents"]) for bill in session.bills), 90)
+
+    def test_no_committees(self):
+
+        session = SyntheticSession(committees=0, **SCALE)
+
+        self.assertEqual(len(session.calendars), 60)
+        self.assertEqual(session.calendars[0][0]["Committee_ID"], "")
+
+    def test_deterministic(self):
+
+        self.assertEqual(
+            SyntheticSession(seed=1, **SCALE).floor_votes_by_session_id(),
+            SyntheticSession(seed=1, **SCALE).floor_votes_by_session_id(),
+        )
+        self.assertNotEqual(
+            SyntheticSession(seed=1, **SCALE).floor_votes_by_session_id(),
+            SyntheticSession(seed=2, **SCALE).floor_votes_by_session_id(),
+        )
+
+
+class TestStubServer(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def api(self, stub, **kwargs):
+        return AzLegApiClient(
+            "username",
+            "password",
+            wsdl=stub.wsdl_url,
+            transport=PooledTransport(
+                cache_path=os.path.join(self.directory.name, "cache.db")
+            ),
+            **kwargs
+        )
+
+    def test_serves_client(self):
+
+        with StubServer(**SCALE) as stub:
+            for fast in (False, True):
+                api = self.api(stub, fast=fast)
+
+                self.assertEqual(api.session_by_id(121)["session_id"], "121")
+                self.assertEqual(len(api.bills_by_session_id(121)["bills"]), 30)
+                self.assertEqual(len(api.members_by_session_id(121)["members"]), 20)
+                self.assertEqual(len(api.floor_votes_by_session_id(121)["tran"]), 60)
+                self.assertEqual(len(api.floor_votes_by_bill(121, "HB2002")["tran"]), 2)
+                self.assertEqual(api.bill_info(121, "HB2002")["bill_number"], "HB2002")
+                self.assertEqual(
+                    len(
+                        api.documents_by_bill_num_doc_type(121, "HB2002", "Bill")[
+                            "documents"
+                        ]
+                    ),
+                    1,
+                )
+                self.assertEqual(
+                    sum(1 for _ in api.iter_documents_by_session_id(121)), 120
+                )
+
+    def test_async_client(self):
+
+        with StubServer(**SCALE) as stub:
+
+            async def run():
+                async with AsyncAzLegApiClient(
+                    "username",
+                    "password",
+                    wsdl=stub.wsdl_url,
+                    cache_path=os.path.join(self.directory.name, "cache.db"),
+                ) as api:
+                    return await asyncio.gather(
+                        api.bills_by_session_id(121), api.members_by_session_id(121)
+                    )
+
+            bills, members = asyncio.run(run())
+
+        self.assertEqual(len(bills["bills"]), 30)
+        self.assertEqual(len(members["members"]), 20)
+
+    def test_errors(self):
+
+        with StubServer(error_rate=1, **SCALE) as stub:
+            with self.assertRaises(TransportError) as raised:
+                self.api(stub, fast=True, retry_policy=NO_RETRY).sessions()
+
+        self.assertEqual(raised.exception.status_code, 503)
+
+        with StubServer(fault_rate=1, **SCALE) as stub:
+            with self.assertRaises(Fault):
+                self.api(stub, fast=True).sessions()
+
+    def test_unknown_session_is_a_fault(self):
+
+        stub = StubServer(sessions=(121,), **SCALE)
+
+        status, body = stub.respond("SessionsbyID", request(122))
+
+        self.assertEqual(status, 500)
+        self.assertIn(b"Session 122 does not exist.", body)
+        self.assertEqual(stub.respond("SessionsbyID", request(121))[0], 200)
+        self.assertEqual(list(stub.sessions), [121])
+
+        with StubServer(**SCALE) as stub:
+            with self.assertRaises(Fault):
+                self.api(stub, fast=True).session_by_id(122)
+
+    def test_committees_by_legislature(self):
+
+        stub = StubServer(sessions=(121, 122), legislature=54, **SCALE)
+
+        self.assertIn("Committee_ID", stub.call("CommitteeByLegislature", (54,)))
+        self.assertEqual(
+            stub.call("CommitteeByLegislature", (53,)),
+            '<COMMITTEES legislature="53"/>',
+        )
+
+    def test_latency(self):
+
+        with StubServer(latency=0.1, **SCALE) as stub:
+            api = self.api(stub, fast=True)
+            api.sessions()
+
+            started = time.perf_counter()
+            api.session_by_id(121)
+
+            self.assertGreaterEqual(time.perf_counter() - started, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
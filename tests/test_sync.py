@@ -0,0 +1,134 @@
+import os
+import tempfile
+import unittest
+
+from azlegapiclient import QueryPlanner, ResponseCache
+from azlegapiclient.SessionSync import SessionSync
+from tests.fakes import FakeApiClient, bill_info, bills, documents, floor_votes
+
+
+class TestSessionSync(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.failing = set()
+        self.titles = {}
+        self.api = self.client()
+        self.sync = SessionSync(self.api, self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def client(self, **kwargs):
+        return FakeApiClient(
+            {
+                "BillsBySessionID": bills(121, "HB2001", "HB2002"),
+                "BillsUpdated": lambda session_id, start_date: bills(
+                    session_id, "HB2002", last_updated="2019-03-01T00:00:00"
+                ),
+                "BillInfo": self.bill_info,
+                "DocumentsByBillNum": documents,
+                "FloorVotesByBill": lambda session_id, bill_number: floor_votes(
+                    session_id, bill_number, 1711
+                ),
+            },
+            **kwargs
+        )
+
+    def bill_info(self, session_id, bill_number):
+        if bill_number in self.failing:
+            return ConnectionError()
+
+        return bill_info(session_id, bill_number).replace(
+            "<Short_Title>Title<",
+            "<Short_Title>%s<" % self.titles.get(bill_number, "Title"),
+        )
+
+    def fetched_bills(self):
+        return sorted(
+            args[1]
+            for operation, args in self.api.client.service.calls
+            if operation == "BillInfo"
+        )
+
+    def test_initial_sync_fetches_every_bill(self):
+
+        result = self.sync.sync(121)
+
+        self.assertEqual(result.updated, ["HB2001", "HB2002"])
+        self.assertEqual(result.watermark, "2019-01-14T00:00:00")
+        self.assertEqual(
+            self.sync.bills(121)["HB2001"]["documents"]["documents"][0]["bill_number"],
+            "HB2001",
+        )
+
+    def test_incremental_sync_fetches_updated_bills(self):
+
+        self.sync.sync(121)
+        self.api.client.service.calls.clear()
+
+        result = self.sync.sync(121)
+
+        self.assertEqual(result.updated, ["HB2002"])
+        self.assertEqual(self.fetched_bills(), ["HB2002"])
+        self.assertIn(
+            ("BillsUpdated", (121, "2019-01-14T00:00:00")),
+            self.api.client.service.calls,
+        )
+        self.assertEqual(self.sync.load(121)["watermark"], "2019-03-01T00:00:00")
+
+    def test_failed_bills_are_retried(self):
+
+        self.failing.add("HB2001")
+        result = self.sync.sync(121)
+
+        self.assertEqual(list(result.errors), ["HB2001"])
+        self.assertNotIn("HB2001", self.sync.bills(121))
+
+        self.failing.clear()
+        self.api.client.service.calls.clear()
+        result = self.sync.sync(121)
+
+        self.assertEqual(self.fetched_bills(), ["HB2001", "HB2002"])
+        self.assertIn("HB2001", self.sync.bills(121))
+        self.assertEqual(self.sync.load(121)["pending"], [])
+
+    def test_cached_responses_are_refetched(self):
+
+        api = self.client(cache=ResponseCache(), planner=QueryPlanner())
+        sync = SessionSync(api, self.directory.name)
+
+        sync.sync(121)
+        api.bill_info(121, "HB2002")
+        self.titles["HB2002"] = "Amended"
+        sync.sync(121)
+
+        self.assertEqual(sync.bills(121)["HB2002"]["bill"]["short_title"], "Amended")
+        self.assertEqual(sync.load(121)["watermark"], "2019-03-01T00:00:00")
+
+    def test_typed_and_lazy_records_are_stored_as_dicts(self):
+
+        for options in ({"typed": True}, {"lazy": True}):
+            with self.subTest(**options):
+                sync = SessionSync(
+                    self.client(**options), os.path.join(self.directory.name, "x")
+                )
+                sync.sync(121)
+                bill = sync.bills(121)["HB2001"]
+
+                self.assertEqual(
+                    bill["documents"]["documents"][0]["bill_number"], "HB2001"
+                )
+                self.assertEqual(
+                    bill["floor_votes"]["tran"][0]["votes"][0]["member_id"], "1711"
+                )
+                os.remove(sync.path(121))
+
+    def test_state_is_replaced_atomically(self):
+
+        self.sync.sync(121)
+
+        self.assertEqual(os.listdir(self.directory.name), ["session_121.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from zeep.exceptions import TransportError
+
+from azlegapiclient import AdaptiveConcurrency, Throttle, TokenBucket
+from azlegapiclient.PooledTransport import NO_RETRY
+from tests.fakes import SESSION, FakeApiClient, FakeAsyncApiClient
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+
+        clock = Clock()
+        bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0, 0, 0.5, 1.0])
+
+        clock.now = 3
+        self.assertEqual(bucket.reserve(), 0)
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.concurrency = AdaptiveConcurrency(
+            initial=2, maximum=4, warmup=2, clock=self.clock
+        )
+
+    def call(self, latency=1.0, overloaded=False):
+
+        started = self.clock.now
+        self.concurrency.acquire()
+        self.clock.now += latency
+        self.concurrency.release("SessionsbyID", started, overloaded)
+
+    def saturate(self, count):
+        for _ in range(count):
+            self.concurrency.acquire()
+
+    def test_increases_only_when_saturated(self):
+
+        self.call()
+        self.assertEqual(self.concurrency.limit, 2)
+
+        self.saturate(1)
+        self.call()
+        self.assertEqual(self.concurrency.limit, 2.5)
+
+    def test_burst_of_errors_decreases_once(self):
+
+        self.concurrency.limit = 4
+        started = self.clock.now
+        self.saturate(4)
+        self.clock.now += 1
+
+        for _ in range(4):
+            self.concurrency.release("SessionsbyID", started, True)
+
+        self.assertEqual(self.concurrency.limit, 2)
+        self.assertEqual(self.concurrency.stats()["decreases"], 1)
+
+        self.call(overloaded=True)
+        self.assertEqual(self.concurrency.limit, 1)
+
+    def test_latency_spike_decreases(self):
+
+        self.call()
+        self.call()
+        self.call(latency=1.5)
+        self.assertEqual(self.concurrency.limit, 2)
+
+        self.call(latency=5)
+        self.assertEqual(self.concurrency.limit, 1)
+
+    def test_neutral_outcome_is_ignored(self):
+
+        self.saturate(1)
+        self.concurrency.acquire()
+        self.concurrency.release("SessionsbyID", 0, None)
+
+        self.assertEqual(self.concurrency.limit, 2)
+        self.assertEqual(self.concurrency.stats()["in_flight"], 1)
+
+    def test_waiters_get_released_slots(self):
+
+        self.saturate(2)
+        acquired = threading.Event()
+
+        def wait():
+            self.concurrency.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=wait)
+        thread.start()
+
+        self.assertFalse(acquired.wait(0.05))
+        self.concurrency.release("SessionsbyID", None)
+        self.assertTrue(acquired.wait(5))
+        thread.join()
+
+        self.assertEqual(self.concurrency.stats()["in_flight"], 2)
+
+
+class TestClientThrottle(unittest.TestCase):
+    def test_limits_calls_in_flight(self):
+
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def respond(session_id):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+
+            threading.Event().wait(0.01)
+
+            with lock:
+                in_flight[0] -= 1
+
+            return SESSION
+
+        api = FakeApiClient(
+            {"SessionsbyID": respond},
+            coalesce=False,
+            throttle=Throttle(concurrency=AdaptiveConcurrency(initial=2, maximum=2)),
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(api.session_by_id, [121] * 16))
+
+        self.assertEqual(in_flight[1], 2)
+        self.assertEqual(len(api.client.service.calls), 16)
+
+    def test_overload_errors_cut_limit(self):
+
+        throttle = Throttle()
+        api = FakeApiClient(
+            {"SessionsbyID": TransportError(status_code=503)},
+            retry_policy=NO_RETRY,
+            throttle=throttle,
+        )
+
+        with self.assertRaises(TransportError):
+            api.session_by_id(121)
+
+        self.assertEqual(throttle.stats()["limit"], 2)
+        self.assertEqual(throttle.stats()["in_flight"], 0)
+
+    def test_async(self):
+
+        throttle = Throttle(concurrency=AdaptiveConcurrency(initial=1, maximum=1))
+        api = FakeAsyncApiClient({"SessionsbyID": SESSION}, throttle=throttle)
+
+        async def run():
+            return await asyncio.gather(
+                *[api.session_by_id(session_id) for session_id in range(10)]
+            )
+
+        self.assertEqual(len(asyncio.run(run())), 10)
+        self.assertEqual(len(api.client.service.calls), 10)
+        self.assertEqual(throttle.stats()["in_flight"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
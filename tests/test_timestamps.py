@@ -0,0 +1,92 @@
+import datetime
+import unittest
+
+from azlegapiclient.Timestamps import _parse, parse_timestamp
+from tests.fakes import FakeApiClient, bills, documents, floor_votes
+
+
+class TestParseTimestamp(unittest.TestCase):
+    def test_formats(self):
+
+        self.assertEqual(
+            parse_timestamp("2019-02-01T10:30:00"),
+            datetime.datetime(2019, 2, 1, 10, 30),
+        )
+        self.assertEqual(parse_timestamp("2019-02-01"), datetime.datetime(2019, 2, 1))
+        self.assertEqual(
+            parse_timestamp("2019-02-01T10:30:00Z").utcoffset(), datetime.timedelta(0)
+        )
+
+    def test_isodate_fallback(self):
+
+        # Basic format, which fromisoformat in older Pythons rejects.
+
+        self.assertEqual(
+            parse_timestamp("20190201T103000"), datetime.datetime(2019, 2, 1, 10, 30)
+        )
+
+    def test_malformed(self):
+
+        self.assertEqual(parse_timestamp("1/14/2019"), "1/14/2019")
+        self.assertEqual(parse_timestamp("2019-02-30T00:00:00"), "2019-02-30T00:00:00")
+
+    def test_empty_and_parsed_values(self):
+
+        value = datetime.datetime(2019, 2, 1)
+
+        self.assertIsNone(parse_timestamp(None))
+        self.assertIsNone(parse_timestamp(""))
+        self.assertIs(parse_timestamp(value), value)
+
+    def test_memoized(self):
+
+        _parse.cache_clear()
+
+        first = parse_timestamp("2019-03-01T00:00:00")
+        second = parse_timestamp("2019-03-01T00:00:00")
+
+        self.assertIs(first, second)
+        self.assertEqual(_parse.cache_info().hits, 1)
+
+
+class TestDateFields(unittest.TestCase):
+    def test_endpoints_return_datetimes(self):
+
+        api = FakeApiClient(
+            {
+                "BillsBySessionID": bills(121, "HB2001"),
+                "DocumentsBySessionID": documents(121, "HB2001"),
+                "FloorVotesBySessionID": floor_votes(121, "HB2001", 1711),
+            }
+        )
+
+        self.assertEqual(
+            api.bills_by_session_id(121)["bills"][0]["last_updated"],
+            datetime.datetime(2019, 1, 14),
+        )
+        self.assertEqual(
+            api.documents_by_session_id(121)["documents"][0]["transaction_date"],
+            datetime.datetime(2019, 1, 14),
+        )
+        self.assertEqual(
+            api.floor_votes_by_session_id(121)["tran"][0]["action_date"],
+            datetime.datetime(2019, 2, 1),
+        )
+
+    def test_malformed_date_does_not_fail_the_call(self):
+
+        api = FakeApiClient(
+            {
+                "BillsBySessionID": bills(121, "HB2001").replace(
+                    "2019-01-14T00:00:00", "01/14/2019"
+                )
+            }
+        )
+
+        self.assertEqual(
+            api.bills_by_session_id(121)["bills"][0]["last_updated"], "01/14/2019"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
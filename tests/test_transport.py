@@ -0,0 +1,82 @@
+import unittest
+
+import requests
+from zeep.exceptions import TransportError
+
+from azlegapiclient.PooledTransport import PooledTransport, RetryPolicy, NO_RETRY
+from tests.fakes import FakeApiClient, SESSION
+
+
+class Flaky:
+    def __init__(self, failures, error):
+        self.failures = failures
+        self.error = error
+
+    def __call__(self, *args):
+        if self.failures:
+            self.failures -= 1
+            return self.error
+
+        return SESSION
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_delays(self):
+        policy = RetryPolicy(attempts=4, backoff_factor=1, max_backoff=3)
+        self.assertEqual(list(policy.delays()), [1, 2, 3, None])
+
+    def test_retries_connection_errors(self):
+        api = FakeApiClient(
+            {"SessionsbyID": Flaky(2, requests.exceptions.ConnectionError())},
+            retry_policy=RetryPolicy(attempts=3, backoff_factor=0),
+        )
+
+        self.assertEqual(api.session_by_id(121)["session_id"], "121")
+        self.assertEqual(len(api.client.service.calls), 3)
+
+    def test_does_not_retry_client_errors(self):
+        api = FakeApiClient(
+            {"SessionsbyID": Flaky(1, TransportError(status_code=404))},
+            retry_policy=RetryPolicy(attempts=3, backoff_factor=0),
+        )
+
+        with self.assertRaises(TransportError):
+            api.session_by_id(121)
+
+    def test_per_operation_policy(self):
+        api = FakeApiClient(
+            {"SessionsbyID": Flaky(1, requests.exceptions.Timeout())},
+            retry_policy=RetryPolicy(attempts=3, backoff_factor=0),
+            retry_policies={"SessionsbyID": NO_RETRY},
+        )
+
+        with self.assertRaises(requests.exceptions.Timeout):
+            api.session_by_id(121)
+
+
+class TestPooledTransport(unittest.TestCase):
+    def test_pool_and_timeouts(self):
+        transport = PooledTransport(pool_maxsize=64, connect_timeout=2, read_timeout=30)
+        adapter = transport.session.get_adapter("https://www.azleg.gov/")
+
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertEqual(transport.operation_timeout, (2, 30))
+
+    def test_connect_retries(self):
+        def connect_retries(transport):
+            return transport.session.get_adapter("https://www.azleg.gov/").max_retries
+
+        retrying = PooledTransport(cache=False)
+        FakeApiClient({}, transport=retrying)
+        single = PooledTransport(cache=False)
+        FakeApiClient({}, transport=single, retry_policy=NO_RETRY)
+        explicit = PooledTransport(cache=False, connect_retries=2)
+        FakeApiClient({}, transport=explicit)
+
+        self.assertEqual(connect_retries(retrying).connect, 0)
+        self.assertEqual(connect_retries(single).connect, 3)
+        self.assertEqual(connect_retries(explicit).connect, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import asyncio
+import unittest
+
+import numpy as np
+from lxml import etree
+
+from azlegapiclient.VoteMatrix import (
+    AYE,
+    NAY,
+    NO_RECORD,
+    NOT_VOTING,
+    OTHER,
+    VoteMatrix,
+)
+from tests.fakes import FakeApiClient, FakeAsyncApiClient
+
+# Two roll calls on HB2001 and one on HB2002. R members 1 and 2 vote
+# together on HB2001 and split on HB2002; R member 5 votes against them on
+# the first roll call only. D members 3 and 4 split on the second, and 4 has
+# no record on HB2002.
+
+FLOOR_VOTES = (
+    '<FLOORVOTES SessionID="121">'
+    '<TRAN ID="10" Bill="HB2001" CmteID="5" Action_ID="1">'
+    '<VOTE MemID="1" MemName="One" Vote="Y"/><VOTE MemID="2" MemName="Two" Vote="Y"/>'
+    '<VOTE MemID="3" MemName="Three" Vote="N"/><VOTE MemID="4" MemName="Four" Vote="N"/>'
+    '<VOTE MemID="5" MemName="Five" Vote="N"/>'
+    "</TRAN>"
+    '<TRAN ID="11" Bill="HB2001" CmteID="5" Action_ID="2">'
+    '<VOTE MemID="1" MemName="One" Vote="N"/><VOTE MemID="2" MemName="Two" Vote="N"/>'
+    '<VOTE MemID="3" MemName="Three" Vote="Y"/><VOTE MemID="4" MemName="Four" Vote="N"/>'
+    "</TRAN>"
+    '<TRAN ID="12" Bill="HB2002" CmteID="5" Action_ID="1">'
+    '<VOTE MemID="1" MemName="One" Vote="Y"/><VOTE MemID="2" MemName="Two" Vote="N"/>'
+    '<VOTE MemID="3" MemName="Three" Vote="NV"/>'
+    "</TRAN>"
+    "</FLOORVOTES>"
+)
+
+PARTIES = {"1": "R", "2": "R", "3": "D", "4": "D", "5": "R"}
+
+
+class TestVoteMatrix(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApiClient({"FloorVotesBySessionID": FLOOR_VOTES})
+        self.matrix = VoteMatrix.from_session(self.api, 121)
+
+    def test_matrix(self):
+
+        self.assertEqual(self.matrix.shape, (5, 3))
+        self.assertEqual(self.matrix.votes.dtype, np.int8)
+        self.assertEqual(list(self.matrix.member_ids), ["1", "2", "3", "4", "5"])
+        self.assertEqual(list(self.matrix.tran_ids), ["10", "11", "12"])
+        self.assertEqual(list(self.matrix.member("3")), [NAY, AYE, NOT_VOTING])
+        self.assertEqual(self.matrix.member("4")[2], NO_RECORD)
+        self.assertEqual(list(self.matrix.columns_for_bill("HB2001")), [0, 1])
+
+    def test_response_matches_parsed_floor_votes(self):
+
+        raw = VoteMatrix.from_response(etree.fromstring(FLOOR_VOTES))
+
+        np.testing.assert_array_equal(raw.votes, self.matrix.votes)
+        self.assertEqual(raw.member_names, self.matrix.member_names)
+
+    def test_incomplete_votes_stay_aligned(self):
+
+        # A VOTE without MemID is skipped; one without Vote counts as OTHER.
+
+        response = (
+            '<FLOORVOTES SessionID="121"><TRAN ID="10">'
+            '<VOTE MemName="Nobody" Vote="Y"/><VOTE MemID="1" MemName="One"/>'
+            '<VOTE MemID="2" Vote="N"/><VOTE MemID="3" MemName="Three" Vote="Y"/>'
+            "</TRAN></FLOORVOTES>"
+        )
+        api = FakeApiClient({"FloorVotesBySessionID": response})
+
+        for matrix in (
+            VoteMatrix.from_response(etree.fromstring(response)),
+            VoteMatrix.from_session(api, 121),
+        ):
+            self.assertEqual(list(matrix.member_ids), ["1", "2", "3"])
+            self.assertEqual(list(matrix.votes[:, 0]), [OTHER, NAY, AYE])
+            self.assertEqual(matrix.member_names, {"1": "One", "2": None, "3": "Three"})
+
+    def test_async_client(self):
+
+        api = FakeAsyncApiClient({"FloorVotesBySessionID": FLOOR_VOTES})
+
+        with self.assertRaises(TypeError):
+            VoteMatrix.from_session(api, 121)
+
+        matrix = asyncio.run(VoteMatrix.from_session_async(api, 121))
+
+        np.testing.assert_array_equal(matrix.votes, self.matrix.votes)
+
+    def test_tallies(self):
+
+        tallies = self.matrix.tallies()
+
+        self.assertEqual(list(tallies["ayes"]), [2, 1, 1])
+        self.assertEqual(list(tallies["nays"]), [3, 3, 1])
+        self.assertEqual(list(tallies["not_voting"]), [0, 0, 1])
+
+    def test_party_unity(self):
+
+        unity = self.matrix.party_unity(PARTIES)
+
+        # Even splits do not count: R on HB2002 and D on the second HB2001
+        # roll call, which leaves the D members one roll call each.
+
+        self.assertEqual(unity, {"1": 1.0, "2": 1.0, "3": 1.0, "4": 1.0, "5": 0.0})
+
+    def test_agreement(self):
+
+        agreement = self.matrix.agreement()
+
+        self.assertEqual(agreement[0, 1], 2 / 3)
+        self.assertEqual(agreement[0, 2], 0.0)
+        self.assertEqual(agreement[2, 3], 0.5)
+        self.assertEqual(agreement[0, 0], 1.0)
+
+    def test_cross_check(self):
+
+        standings = [
+            {
+                "bill_number": "HB2001",
+                "committee_id": "5",
+                "action_id": "1",
+                "ayes": "2",
+                "nays": "1",
+            },
+            {"bill_number": "HB9999", "committee_id": "5", "action_id": "1"},
+        ]
+
+        self.assertEqual(
+            self.matrix.cross_check(standings),
+            [
+                {
+                    "bill_number": "HB2001",
+                    "committee_id": "5",
+                    "tran_id": "10",
+                    "count": "nays",
+                    "standing": 1,
+                    "votes": 3,
+                }
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import time
+import unittest
+
+from zeep import CachingClient
+
+import azlegapiclient
+from azlegapiclient.AzLegApiClient import VENDORED_WSDL, AzLegApiClient, vendor_wsdl
+from azlegapiclient.PooledTransport import PooledTransport
+
+FIXTURE_WSDL = os.path.join(os.path.dirname(__file__), "fixtures", "legservice.wsdl")
+
+
+class TestLocalWsdl(unittest.TestCase):
+    def setUp(self):
+        self.api = AzLegApiClient(
+            username="username", password="password", wsdl=FIXTURE_WSDL
+        )
+
+    def test_client_is_lazy(self):
+        self.assertIsNone(self.api._client)
+
+    def test_loads_without_network(self):
+
+        start = time.perf_counter()
+        client = self.api.client
+
+        self.assertIsInstance(client, CachingClient)
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertIs(self.api.client, client)
+        self.assertIsNotNone(client.service.SessionsbyID)
+
+    def test_vendor_wsdl(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = vendor_wsdl(
+                os.path.join(directory, "wsdl", "legservice.wsdl"),
+                url=FIXTURE_WSDL,
+                transport=PooledTransport(
+                    cache_path=os.path.join(directory, "cache.db")
+                ),
+            )
+
+            with open(path, "rb") as vendored, open(FIXTURE_WSDL, "rb") as fixture:
+                self.assertEqual(vendored.read(), fixture.read())
+
+    def test_vendored_outside_package(self):
+
+        package = os.path.dirname(os.path.abspath(azlegapiclient.__file__))
+
+        self.assertFalse(os.path.abspath(VENDORED_WSDL).startswith(package + os.sep))
+
+
+if __name__ == "__main__":
+    unittest.main()